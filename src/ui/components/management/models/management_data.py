@@ -2,10 +2,28 @@
 # File: src/ui/components/management/models/management_data.py
 
 import hashlib
+import mmap
+import os
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
+# hashlib.file_digest hashes in C without per-chunk Python overhead (3.11+)
+_file_digest = getattr(hashlib, "file_digest", None)
+
+# Files at least this large are memory-mapped for full hashing
+_MMAP_HASH_THRESHOLD = 16 * 1024 * 1024
+_HASH_BLOCK_SIZE = 1024 * 1024
+
 
 class DuplicateConfidence(Enum):
     """Confidence levels for duplicate detection."""
@@ -88,26 +106,47 @@ class FileInfo:
         else:
             return FileAgeCategory.OLD
 
-    def calculate_hash(self, hash_type: str = "full") -> str:
-        """Calculate file hash for duplicate detection."""
-        try:
-            hasher = hashlib.sha256()
+    def calculate_hash(
+        self, hash_type: str = "full", cancel_event: threading.Event | None = None
+    ) -> str:
+        """
+        Calculate file hash for duplicate detection.
 
+        Small files go through hashlib.file_digest where available (3.11+).
+        Large files are memory-mapped and hashed in blocks without copying;
+        a set cancel_event stops that between blocks and returns "".
+        """
+        try:
             with open(self.path, "rb") as f:
                 if hash_type == "partial":
                     # Read first 1KB for quick comparison
-                    data = f.read(1024)
-                    hasher.update(data)
+                    hasher = hashlib.sha256(f.read(1024))
                     self.hash_partial = hasher.hexdigest()
                     return self.hash_partial
+
+                size = os.fstat(f.fileno()).st_size
+                if size >= _MMAP_HASH_THRESHOLD:
+                    hasher = hashlib.sha256()
+                    with (
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+                        memoryview(mm) as view,
+                    ):
+                        for start in range(0, len(view), _HASH_BLOCK_SIZE):
+                            if cancel_event is not None and cancel_event.is_set():
+                                return ""
+                            hasher.update(view[start : start + _HASH_BLOCK_SIZE])
+                elif _file_digest is not None:
+                    hasher = _file_digest(f, "sha256")
                 else:
-                    # Read full file in chunks
-                    while chunk := f.read(8192):
+                    hasher = hashlib.sha256()
+                    while chunk := f.read(_HASH_BLOCK_SIZE):
                         hasher.update(chunk)
-                    self.hash_sha256 = hasher.hexdigest()
-                    return self.hash_sha256
 
-        except (OSError, PermissionError):
+                self.hash_sha256 = hasher.hexdigest()
+                return self.hash_sha256
+
+        except (OSError, ValueError):
+            # ValueError: mmap of a file that shrank to zero length
             return ""
 
 
@@ -123,15 +162,19 @@ class DuplicateGroup:
 
     def __post_init__(self):
         """Calculate derived properties."""
-        self.total_size = sum(file.size for file in self.files)
-        self.potential_savings = (
-            self.total_size - max(file.size for file in self.files) if self.files else 0
-        )
+        self.update_totals()
 
         # Use hash from first file as group key
         if self.files and self.files[0].hash_sha256:
             self.hash_key = self.files[0].hash_sha256
 
+    def update_totals(self):
+        """Recompute the total size and savings after files changed."""
+        self.total_size = sum(file.size for file in self.files)
+        self.potential_savings = (
+            self.total_size - max(file.size for file in self.files) if self.files else 0
+        )
+
     def get_recommended_keeper(self) -> FileInfo | None:
         """Get the recommended file to keep (newest, largest)."""
         if not self.files:
@@ -157,9 +200,70 @@ class LargeFileAnalysis:
     total_size: int = 0
     size_threshold: int = 100 * 1024 * 1024  # 100MB default
 
+    # File sizes in the same order as files: an int64 array when NumPy is
+    # available (vectorized sums and argsort), otherwise a plain list
+    sizes: "np.ndarray | list[int]" = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+
+    # Detailed cleanup recommendations, generated once per analysis by the UI
+    recommendations: list[dict] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self):
         """Calculate total size."""
-        self.total_size = sum(file.size for file in self.files)
+        self.update_files(self.files)
+
+    def update_files(self, files: list[FileInfo]):
+        """Replace the analyzed files and recompute the derived sizes."""
+        self.files = files
+        if NUMPY_AVAILABLE:
+            self.sizes = np.fromiter(
+                (file.size for file in files), dtype=np.int64, count=len(files)
+            )
+            self.total_size = int(self.sizes.sum())
+        else:
+            self.sizes = [file.size for file in files]
+            self.total_size = sum(self.sizes)
+
+    def remove_file(self, file_info: FileInfo) -> bool:
+        """
+        Drop one file (matched by identity) and adjust the derived sizes.
+
+        Returns whether the file was part of the analysis.
+        """
+        files = self.files
+        if NUMPY_AVAILABLE:
+            # Only files of the same size can be the one being removed
+            candidates = np.flatnonzero(self.sizes == file_info.size).tolist()
+        else:
+            candidates = range(len(files))
+
+        index = next((i for i in candidates if files[i] is file_info), None)
+        if index is None:
+            return False
+
+        del files[index]
+        if NUMPY_AVAILABLE:
+            self.sizes = np.delete(self.sizes, index)
+        else:
+            del self.sizes[index]
+        self.total_size -= file_info.size
+        return True
+
+    def get_average_size(self) -> int:
+        """Get the average file size, or 0 when there are no files."""
+        return self.total_size // len(self.files) if self.files else 0
+
+    def get_size_order(self, descending: bool = True) -> list[int]:
+        """Get indices into files ordered by size; ties keep their file order."""
+        if NUMPY_AVAILABLE:
+            keys = -self.sizes if descending else self.sizes
+            return np.argsort(keys, kind="stable").tolist()
+        return sorted(
+            range(len(self.sizes)), key=self.sizes.__getitem__, reverse=descending
+        )
 
     def get_files_by_category(self) -> dict[FileSizeCategory, list[FileInfo]]:
         """Group files by size category."""
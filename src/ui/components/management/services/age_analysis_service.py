@@ -3,6 +3,7 @@
 
 from collections import defaultdict
 from datetime import datetime
+from typing import TextIO
 
 from ..models.management_data import FileAgeAnalysis, FileAgeCategory, FileInfo
 
@@ -304,21 +305,39 @@ class FileAgeAnalysisService:
         Returns:
             Formatted string ready for file export
         """
+        from io import StringIO
+
+        output = StringIO()
+        self.export_analysis_results_stream(analysis, format_type, output)
+        return output.getvalue()
+
+    def export_analysis_results_stream(
+        self, analysis: FileAgeAnalysis, format_type: str, output: TextIO
+    ):
+        """
+        Export age analysis results directly to a writable text stream.
+
+        Rows are written incrementally so the serialized export is never
+        held in memory as a single string.
+
+        Args:
+            analysis: FileAgeAnalysis object
+            format_type: Export format ("csv", "json")
+            output: Writable text file-like object
+        """
         if format_type == "csv":
-            return self._export_to_csv(analysis)
+            self._export_to_csv(analysis, output)
         elif format_type == "json":
-            return self._export_to_json(analysis)
+            self._export_to_json(analysis, output)
         else:
             raise ValueError(f"Unsupported export format: {format_type}")
 
-    def _export_to_csv(self, analysis: FileAgeAnalysis) -> str:
+    def _export_to_csv(self, analysis: FileAgeAnalysis, output: TextIO):
         """Export analysis to CSV format."""
         import csv
-        from io import StringIO
 
         from src.utils.file_utils import format_size
 
-        output = StringIO()
         writer = csv.writer(output)
 
         # Header
@@ -351,9 +370,7 @@ class FileAgeAnalysisService:
                 ]
             )
 
-        return output.getvalue()
-
-    def _export_to_json(self, analysis: FileAgeAnalysis) -> str:
+    def _export_to_json(self, analysis: FileAgeAnalysis, output: TextIO):
         """Export analysis to JSON format."""
         import json
 
@@ -395,4 +412,4 @@ class FileAgeAnalysisService:
                 }
             )
 
-        return json.dumps(data, indent=2)
+        json.dump(data, output, indent=2)
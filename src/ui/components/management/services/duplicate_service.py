@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
 # File: src/ui/components/management/services/duplicate_service.py
 
+import os
+import threading
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 from ..models.management_data import DuplicateConfidence, DuplicateGroup, FileInfo
 
@@ -12,14 +15,21 @@ class DuplicateDetectionService:
     Implements both heuristic and content-based duplicate detection.
     """
 
-    def __init__(self):
+    def __init__(self, max_workers: int | None = None):
         self.hash_cache = {}  # Cache for calculated hashes
         self.progress_callback = None
+        self.cancel_event = None
+        # Hashing is I/O bound, so a few threads overlap reads well
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
 
     def set_progress_callback(self, callback):
         """Set callback function for progress updates."""
         self.progress_callback = callback
 
+    def set_cancel_event(self, event: threading.Event):
+        """Set an event that aborts hashing, including in-flight files."""
+        self.cancel_event = event
+
     def find_duplicates(
         self,
         files: list[dict],
@@ -97,58 +107,48 @@ class DuplicateDetectionService:
     def _find_hash_duplicates(self, files: list[FileInfo]) -> list[DuplicateGroup]:
         """Find duplicates using content hash comparison."""
         duplicate_groups = []
-        total_files = len(files)
-
-        # Step 1: Quick partial hash for pre-filtering
-        partial_hash_groups = defaultdict(list)
 
-        for i, file in enumerate(files):
-            if self.progress_callback:
-                self.progress_callback(
-                    f"Quick scan: {file.name}", int((i / total_files) * 50)
-                )
-
-            # Calculate partial hash (first 1KB)
-            try:
-                partial_hash = file.calculate_hash("partial")
+        # Files of different sizes can never match, so only files sharing
+        # their size with another file are read at all
+        size_groups = defaultdict(list)
+        for file in files:
+            size_groups[file.size].append(file)
+        candidates = [
+            file
+            for file_list in size_groups.values()
+            if len(file_list) >= 2
+            for file in file_list
+        ]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # Step 1: Quick partial hash for pre-filtering
+            partial_hash_groups = defaultdict(list)
+            partial_hashes = self._hash_files(
+                executor, candidates, self._partial_hash, "Quick scan", 0
+            )
+            for file, partial_hash in partial_hashes:
                 if partial_hash:
-                    partial_hash_groups[partial_hash].append(file)
-            except Exception:
-                # Skip files that can't be read
-                continue
-
-        # Step 2: Full hash verification for potential duplicates
-        hash_groups = defaultdict(list)
-        files_to_hash = []
-
-        # Collect files that have matching partial hashes
-        for partial_hash, file_list in partial_hash_groups.items():
-            if len(file_list) >= 2:
-                files_to_hash.extend(file_list)
-
-        # Calculate full hashes for potential duplicates
-        for i, file in enumerate(files_to_hash):
-            if self.progress_callback:
-                self.progress_callback(
-                    f"Deep scan: {file.name}", 50 + int((i / len(files_to_hash)) * 50)
-                )
-
-            try:
-                # Check cache first
-                cache_key = f"{file.path}:{file.size}:{file.modified.timestamp()}"
-
-                if cache_key in self.hash_cache:
-                    full_hash = self.hash_cache[cache_key]
-                else:
-                    full_hash = file.calculate_hash("full")
-                    self.hash_cache[cache_key] = full_hash
-
+                    partial_hash_groups[(file.size, partial_hash)].append(file)
+
+            # Step 2: Full hash verification for potential duplicates
+            hash_groups = defaultdict(list)
+            files_to_hash = []
+
+            # Collect files that have matching partial hashes
+            for file_list in partial_hash_groups.values():
+                if len(file_list) >= 2:
+                    files_to_hash.extend(file_list)
+
+            # Calculate full hashes for potential duplicates
+            full_hashes = self._hash_files(
+                executor, files_to_hash, self._full_hash, "Deep scan", 50
+            )
+            for file, full_hash in full_hashes:
                 if full_hash:
                     hash_groups[full_hash].append(file)
 
-            except Exception:
-                # Skip files that can't be hashed
-                continue
+        if self._is_cancelled():
+            return []
 
         # Create duplicate groups for files with matching hashes
         for hash_value, file_list in hash_groups.items():
@@ -166,6 +166,64 @@ class DuplicateDetectionService:
 
         return duplicate_groups
 
+    def _hash_files(self, executor, files, hash_func, label, base_progress):
+        """
+        Hash files on the executor and yield (file, hash) in input order.
+
+        Progress is reported from the calling thread as results arrive and
+        covers 50 points starting at base_progress. Stops early on cancel.
+        """
+        total_files = len(files)
+        for i, (file, file_hash) in enumerate(
+            zip(files, executor.map(hash_func, files))
+        ):
+            if self._is_cancelled():
+                return
+
+            if self.progress_callback:
+                self.progress_callback(
+                    f"{label}: {file.name}",
+                    base_progress + int((i / total_files) * 50),
+                )
+
+            yield file, file_hash
+
+    def _partial_hash(self, file: FileInfo) -> str:
+        """Hash the first 1KB of a file; runs on a pool thread."""
+        if self._is_cancelled():
+            return ""
+
+        try:
+            return file.calculate_hash("partial")
+        except Exception:
+            # Skip files that can't be read
+            return ""
+
+    def _full_hash(self, file: FileInfo) -> str:
+        """Hash a whole file, using the cache; runs on a pool thread."""
+        if self._is_cancelled():
+            return ""
+
+        try:
+            # Check cache first
+            cache_key = f"{file.path}:{file.size}:{file.modified.timestamp()}"
+
+            if cache_key in self.hash_cache:
+                return self.hash_cache[cache_key]
+
+            full_hash = file.calculate_hash("full", self.cancel_event)
+            if not self._is_cancelled():
+                self.hash_cache[cache_key] = full_hash
+            return full_hash
+
+        except Exception:
+            # Skip files that can't be hashed
+            return ""
+
+    def _is_cancelled(self) -> bool:
+        """Check whether the caller cancelled the detection."""
+        return self.cancel_event is not None and self.cancel_event.is_set()
+
     def _merge_duplicate_groups(
         self, groups: list[DuplicateGroup]
     ) -> list[DuplicateGroup]:
@@ -3,6 +3,7 @@
 
 import os
 from datetime import datetime
+from typing import TextIO
 
 from ..models.management_data import FileInfo, FileSizeCategory, LargeFileAnalysis
 
@@ -282,21 +283,36 @@ class LargeFileAnalysisService:
         Returns:
             Formatted string ready for file export
         """
+        from io import StringIO
+
+        output = StringIO()
+        self.export_analysis_results_stream(analysis, format_type, output)
+        return output.getvalue()
+
+    def export_analysis_results_stream(
+        self, analysis: LargeFileAnalysis, format_type: str, output: TextIO
+    ):
+        """
+        Export analysis results directly to a writable text stream.
+
+        Args:
+            analysis: LargeFileAnalysis object
+            format_type: Export format ("csv", "json")
+            output: Writable text file-like object
+        """
         if format_type == "csv":
-            return self._export_to_csv(analysis)
+            self._export_to_csv(analysis, output)
         elif format_type == "json":
-            return self._export_to_json(analysis)
+            self._export_to_json(analysis, output)
         else:
             raise ValueError(f"Unsupported export format: {format_type}")
 
-    def _export_to_csv(self, analysis: LargeFileAnalysis) -> str:
+    def _export_to_csv(self, analysis: LargeFileAnalysis, output: TextIO):
         """Export analysis to CSV format."""
         import csv
-        from io import StringIO
 
         from src.utils.file_utils import format_size
 
-        output = StringIO()
         writer = csv.writer(output)
 
         # Header
@@ -326,9 +342,7 @@ class LargeFileAnalysisService:
                 ]
             )
 
-        return output.getvalue()
-
-    def _export_to_json(self, analysis: LargeFileAnalysis) -> str:
+    def _export_to_json(self, analysis: LargeFileAnalysis, output: TextIO):
         """Export analysis to JSON format."""
         import json
 
@@ -355,4 +369,4 @@ class LargeFileAnalysisService:
                 }
             )
 
-        return json.dumps(data, indent=2)
+        json.dump(data, output, indent=2)
@@ -27,6 +27,27 @@ from ...modern_button import ModernButton
 from ..models.management_data import FileAgeAnalysis, FileAgeCategory, FileInfo
 from ..services.age_analysis_service import FileAgeAnalysisService
 from ..workers.analysis_workers import FileAgeAnalysisWorker
+from .common import ThrottledProgress
+
+# Candidate label stylesheets, formatted once at import for every candidate
+_CANDIDATE_NAME_QSS = f"""
+QLabel {{
+    font-weight: {Typography.WEIGHT_MEDIUM};
+    font-size: {Typography.FONT_MD};
+    color: {ModernTheme.VERY_DARK_GRAY.name()};
+    background: transparent;
+    border: none;
+}}
+"""
+
+_CANDIDATE_DETAILS_QSS = f"""
+QLabel {{
+    color: {ModernTheme.DARK_GRAY.name()};
+    font-size: {Typography.FONT_SM};
+    background: transparent;
+    border: none;
+}}
+"""
 
 
 class AgeCategoryCard(CardWidget):
@@ -185,50 +206,22 @@ class ArchivalCandidateWidget(CardWidget):
 
         # File name and age badge
         name_layout = QHBoxLayout()
-        name_label = QLabel(self.file_info.name)
-        name_label.setStyleSheet(f"""
-        QLabel {{
-            font-weight: {Typography.WEIGHT_MEDIUM};
-            font-size: {Typography.FONT_MD};
-            color: {ModernTheme.VERY_DARK_GRAY.name()};
-            background: transparent;
-            border: none;
-        }}
-        """)
+        self.name_label = QLabel(self.file_info.name)
+        self.name_label.setStyleSheet(_CANDIDATE_NAME_QSS)
 
-        age_badge = QLabel(self.file_info.age_category.value.title())
-        age_badge.setStyleSheet(f"""
-        QLabel {{
-            background-color: {self._get_age_color()};
-            color: {ModernTheme.WHITE.name()};
-            padding: 2px 8px;
-            border-radius: 4px;
-            font-size: {Typography.FONT_XS};
-            font-weight: {Typography.WEIGHT_BOLD};
-        }}
-        """)
+        self.age_badge = QLabel(self.file_info.age_category.value.title())
+        self._apply_age_badge_style()
 
-        name_layout.addWidget(name_label)
+        name_layout.addWidget(self.name_label)
         name_layout.addStretch()
-        name_layout.addWidget(age_badge)
+        name_layout.addWidget(self.age_badge)
 
         # File details
-        from src.utils.file_utils import format_size
-
-        days_old = (datetime.now() - self.file_info.modified).days
-        details_text = f"{self.file_info.path} • {format_size(self.file_info.size)} • {days_old} days old"
-        details_label = QLabel(details_text)
-        details_label.setStyleSheet(f"""
-        QLabel {{
-            color: {ModernTheme.DARK_GRAY.name()};
-            font-size: {Typography.FONT_SM};
-            background: transparent;
-            border: none;
-        }}
-        """)
+        self.details_label = QLabel(self._get_details_text())
+        self.details_label.setStyleSheet(_CANDIDATE_DETAILS_QSS)
 
         info_layout.addLayout(name_layout)
-        info_layout.addWidget(details_label)
+        info_layout.addWidget(self.details_label)
 
         # Action buttons
         actions_layout = QHBoxLayout()
@@ -256,6 +249,44 @@ class ArchivalCandidateWidget(CardWidget):
         layout.addLayout(info_layout, 1)
         layout.addLayout(actions_layout)
 
+    def update_with(self, file_info: FileInfo, is_selected: bool = False):
+        """Rebind this widget to another file, reusing its child widgets."""
+        previous_category = self.file_info.age_category
+        self.file_info = file_info
+        self.is_selected = is_selected
+
+        self.checkbox.blockSignals(True)
+        self.checkbox.setChecked(is_selected)
+        self.checkbox.blockSignals(False)
+
+        self.name_label.setText(file_info.name)
+        self.details_label.setText(self._get_details_text())
+
+        # Only the badge colour depends on the file, so restyle it when needed
+        if file_info.age_category != previous_category:
+            self.age_badge.setText(file_info.age_category.value.title())
+            self._apply_age_badge_style()
+
+    def _get_details_text(self) -> str:
+        """Build the path/size/age details line for the current file."""
+        from src.utils.file_utils import format_size
+
+        days_old = (datetime.now() - self.file_info.modified).days
+        return f"{self.file_info.path} • {format_size(self.file_info.size)} • {days_old} days old"
+
+    def _apply_age_badge_style(self):
+        """Style the age badge with the current file's category colour."""
+        self.age_badge.setStyleSheet(f"""
+        QLabel {{
+            background-color: {self._get_age_color()};
+            color: {ModernTheme.WHITE.name()};
+            padding: 2px 8px;
+            border-radius: 4px;
+            font-size: {Typography.FONT_XS};
+            font-weight: {Typography.WEIGHT_BOLD};
+        }}
+        """)
+
     def _get_age_color(self) -> str:
         """Get color for age category."""
         colors = {
@@ -286,6 +317,10 @@ class FileAgeAnalyzerTool(QWidget):
         self.service = FileAgeAnalysisService()
         self.selected_files = set()
 
+        # Candidate widgets currently displayed, and hidden ones kept for reuse
+        self._candidate_widgets: list[ArchivalCandidateWidget] = []
+        self._candidate_pool: list[ArchivalCandidateWidget] = []
+
         self.setup_ui()
 
     def setup_ui(self):
@@ -303,6 +338,7 @@ class FileAgeAnalyzerTool(QWidget):
         # Progress bar
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
+        self._progress = ThrottledProgress(self.progress_bar)
         layout.addWidget(self.progress_bar)
 
         # Results area
@@ -426,10 +462,15 @@ class FileAgeAnalyzerTool(QWidget):
 
         # Start analysis worker
         self.analysis_worker = FileAgeAnalysisWorker(self.current_files)
-
-        self.analysis_worker.progress_updated.connect(self.on_progress_updated)
-        self.analysis_worker.analysis_completed.connect(self.on_analysis_completed)
-        self.analysis_worker.analysis_failed.connect(self.on_analysis_failed)
+        self._progress.reset()
+
+        # Queue explicitly so the worker never blocks on UI slots
+        signals = self.analysis_worker.signals
+        queued = Qt.ConnectionType.QueuedConnection
+        signals.progress_updated.connect(self.on_progress_updated, queued)
+        signals.progress_counts.connect(self.on_progress_counts, queued)
+        signals.analysis_completed.connect(self.on_analysis_completed, queued)
+        signals.analysis_failed.connect(self.on_analysis_failed, queued)
         self.analysis_worker.start()
 
     def cancel_analysis(self):
@@ -442,8 +483,11 @@ class FileAgeAnalyzerTool(QWidget):
 
     def on_progress_updated(self, message: str, percentage: int):
         """Handle progress updates."""
-        self.progress_bar.setValue(percentage)
-        self.progress_bar.setFormat(f"{message} ({percentage}%)")
+        self._progress.update(message, percentage)
+
+    def on_progress_counts(self, processed: int, total: int, percentage: int):
+        """Handle per-file progress updates."""
+        self._progress.update_counts(processed, total, percentage)
 
     def on_analysis_completed(self, analysis: FileAgeAnalysis):
         """Handle completed analysis."""
@@ -498,14 +542,16 @@ class FileAgeAnalyzerTool(QWidget):
         dist_layout.setSpacing(Spacing.MD)
 
         # Create category cards in a grid
+        add_widget = dist_layout.addWidget
+        on_category = self.on_category_selected
         row, col = 0, 0
         for category in FileAgeCategory:
             if category in distribution:
                 stats = distribution[category]
                 if stats["count"] > 0:  # Only show categories with files
                     category_card = AgeCategoryCard(category, stats)
-                    category_card.category_selected.connect(self.on_category_selected)
-                    dist_layout.addWidget(category_card, row, col)
+                    category_card.category_selected.connect(on_category)
+                    add_widget(category_card, row, col)
 
                     col += 1
                     if col >= 3:  # 3 columns per row
@@ -648,12 +694,27 @@ class FileAgeAnalyzerTool(QWidget):
 
                 candidates_layout.addWidget(bulk_actions)
 
-            # Add candidate widgets
+            # Add candidate widgets, reusing pooled ones from the previous run.
+            # Hot loop: bind repeated attribute lookups to locals.
+            add_widget = candidates_layout.addWidget
+            pool = self._candidate_pool
+            displayed = self._candidate_widgets.append
+            handle_action = self.handle_file_action
+            on_selected = self.on_file_selected
             for candidate in candidates[:25]:  # Show top 25 candidates
-                candidate_widget = ArchivalCandidateWidget(candidate)
-                candidate_widget.file_action_requested.connect(self.handle_file_action)
-                candidate_widget.file_selected.connect(self.on_file_selected)
-                candidates_layout.addWidget(candidate_widget)
+                if pool:
+                    # Lay out a pooled widget before showing it, so it is never
+                    # shown while still parented to the tool
+                    candidate_widget = pool.pop()
+                    candidate_widget.update_with(candidate)
+                    add_widget(candidate_widget)
+                    candidate_widget.show()
+                else:
+                    candidate_widget = ArchivalCandidateWidget(candidate)
+                    candidate_widget.file_action_requested.connect(handle_action)
+                    candidate_widget.file_selected.connect(on_selected)
+                    add_widget(candidate_widget)
+                displayed(candidate_widget)
 
             if len(candidates) > 25:
                 more_label = QLabel(
@@ -789,12 +850,14 @@ class FileAgeAnalyzerTool(QWidget):
 
         try:
             format_type = "json" if selected_filter.startswith("JSON") else "csv"
-            export_data = self.service.export_analysis_results(
-                self.current_analysis, format_type
-            )
-
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(export_data)
+            # Stream straight to disk through a 1 MiB buffer instead of
+            # serializing the whole export into memory first
+            with open(
+                file_path, "w", encoding="utf-8", newline="", buffering=1 << 20
+            ) as f:
+                self.service.export_analysis_results_stream(
+                    self.current_analysis, format_type, f
+                )
 
             QMessageBox.information(
                 self,
@@ -809,6 +872,17 @@ class FileAgeAnalyzerTool(QWidget):
 
     def clear_results(self):
         """Clear the results area."""
+        # Keep candidate widgets for the next display; reparenting to the tool
+        # hides them and saves them from their card's destruction, and ties
+        # the pool's lifetime to the tool
+        for widget in self._candidate_widgets:
+            widget.setParent(self)
+            if len(self._candidate_pool) < 25:
+                self._candidate_pool.append(widget)
+            else:
+                widget.deleteLater()
+        self._candidate_widgets.clear()
+
         while self.results_layout.count():
             child = self.results_layout.takeAt(0)
             if child.widget():
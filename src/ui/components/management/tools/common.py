@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# File: src/ui/components/management/tools/common.py
+
+import time
+
+from PyQt6.QtWidgets import QProgressBar, QScrollArea, QVBoxLayout, QWidget
+
+from ....themes.styles import Spacing
+
+
+class ThrottledProgress:
+    """
+    Applies worker progress to a progress bar at most ~30 times per second.
+    Completion (100%) is always shown.
+    """
+
+    def __init__(self, progress_bar: QProgressBar, max_rate: int = 30):
+        self.progress_bar = progress_bar
+        self.interval = 1 / max_rate
+        self._last_ts = 0.0
+
+    def reset(self):
+        """Forget the last update, e.g. when a new analysis starts."""
+        self._last_ts = 0.0
+
+    def update(self, message: str, percentage: int):
+        """Show a progress update unless one was shown too recently."""
+        if not self._ready(percentage):
+            return
+
+        self.progress_bar.setValue(percentage)
+        self.progress_bar.setFormat(f"{message} ({percentage}%)")
+
+    def update_counts(self, processed: int, total: int, percentage: int):
+        """
+        Show a per-file progress update from raw counts.
+
+        The label text is only formatted when the update is shown and the
+        bar is visible, instead of once per emitted signal in the worker.
+        """
+        if not self._ready(percentage) or not self.progress_bar.isVisible():
+            return
+
+        self.progress_bar.setValue(percentage)
+        self.progress_bar.setFormat(
+            f"Processed {processed}/{total} files ({percentage}%)"
+        )
+
+    def _ready(self, percentage: int) -> bool:
+        """Return True if an update at this percentage should be shown."""
+        now = time.monotonic()
+        if percentage < 100 and now - self._last_ts < self.interval:
+            return False
+        self._last_ts = now
+        return True
+
+
+def replace_results_container(
+    scroll_area: QScrollArea,
+) -> tuple[QWidget, QVBoxLayout]:
+    """
+    Install a fresh, empty results widget in a scroll area.
+
+    Any previous widget is deleted as a whole instead of draining its layout.
+
+    Returns:
+        Tuple of (results_widget, results_layout)
+    """
+    old_widget = scroll_area.takeWidget()
+    if old_widget is not None:
+        old_widget.deleteLater()
+
+    results_widget = QWidget()
+    results_layout = QVBoxLayout(results_widget)
+    results_layout.setSpacing(Spacing.MD)
+
+    scroll_area.setWidget(results_widget)
+    return results_widget, results_layout
@@ -1,10 +1,13 @@
 #!/usr/bin/env python3
 # File: src/ui/components/management/tools/duplicate_finder.py
 
-import os
+from itertools import islice
+from typing import ClassVar
 
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import QSignalBlocker, Qt, QThreadPool, QTimer, pyqtSignal
+from PyQt6.QtGui import QStandardItem, QStandardItemModel
 from PyQt6.QtWidgets import (
+    QAbstractItemView,
     QCheckBox,
     QFrame,
     QHBoxLayout,
@@ -12,15 +15,84 @@ from PyQt6.QtWidgets import (
     QMessageBox,
     QProgressBar,
     QScrollArea,
+    QTreeView,
     QVBoxLayout,
     QWidget,
 )
 
+from src.utils.file_utils import format_size
+
 from ....themes.styles import ModernTheme, Spacing, Typography
 from ...card_widget import CardWidget, StatsCard, TitleCard
 from ...modern_button import ModernButton
 from ..models.management_data import DuplicateConfidence, DuplicateGroup, FileInfo
 from ..workers.analysis_workers import DuplicateAnalysisWorker
+from ..workers.file_workers import FileDeleteRunnable, FileDeleteSignals
+from .common import replace_results_container
+
+# Theme colour names resolved once; these QColors never change at runtime
+_SUCCESS = ModernTheme.SUCCESS.name()
+_WARNING = ModernTheme.WARNING.name()
+_ERROR = ModernTheme.ERROR.name()
+_DARK_GRAY = ModernTheme.DARK_GRAY.name()
+_LIGHT_GRAY = ModernTheme.LIGHT_GRAY.name()
+_BORDER = ModernTheme.BORDER.name()
+
+# Stylesheets shared by every duplicate group, built once at import so Qt
+# sees identical strings instead of re-formatted copies per widget
+_SAVINGS_QSS = f"""
+QLabel {{
+    color: {_DARK_GRAY};
+    font-size: {Typography.FONT_SM};
+    background: transparent;
+    border: none;
+}}
+"""
+
+_FILES_FRAME_QSS = f"""
+QFrame {{
+    background-color: {_LIGHT_GRAY};
+    border: 1px solid {_BORDER};
+    border-radius: 4px;
+}}
+"""
+
+_NO_RESULTS_QSS = f"""
+QLabel {{
+    color: {_SUCCESS};
+    font-size: {Typography.FONT_LG};
+    font-weight: {Typography.WEIGHT_BOLD};
+    padding: {Spacing.XL}px;
+    text-align: center;
+    background: transparent;
+    border: none;
+}}
+"""
+
+
+def _file_details(files: list[FileInfo]) -> list[str]:
+    """Format the details column for a batch of files.
+
+    Duplicates usually share a size, so each distinct size is formatted once.
+    """
+    sizes = {size: format_size(size) for size in {file.size for file in files}}
+    return [
+        f"{file.path} • {sizes[file.size]} • {file.modified:%Y-%m-%d %H:%M}"
+        for file in files
+    ]
+
+
+def _confidence_qss(color: str) -> str:
+    """Build the confidence label stylesheet for a given text colour."""
+    return f"""
+QLabel {{
+    color: {color};
+    font-weight: {Typography.WEIGHT_BOLD};
+    font-size: {Typography.FONT_MD};
+    background: transparent;
+    border: none;
+}}
+"""
 
 
 class DuplicateGroupWidget(CardWidget):
@@ -29,11 +101,34 @@ class DuplicateGroupWidget(CardWidget):
     files_selected = pyqtSignal(list, object)  # selected_files, group
     preview_requested = pyqtSignal(str)  # file_path
 
+    # Confidence label color and stylesheet per confidence level
+    _CONFIDENCE_COLOR: ClassVar[dict[DuplicateConfidence, str]] = {
+        DuplicateConfidence.HIGH: _SUCCESS,
+        DuplicateConfidence.MEDIUM: _WARNING,
+        DuplicateConfidence.LOW: _ERROR,
+    }
+    _CONFIDENCE_QSS: ClassVar[dict[DuplicateConfidence, str]] = {
+        confidence: _confidence_qss(color)
+        for confidence, color in _CONFIDENCE_COLOR.items()
+    }
+    _DEFAULT_CONFIDENCE_QSS: ClassVar[str] = _confidence_qss(_DARK_GRAY)
+
     def __init__(self, duplicate_group: DuplicateGroup, parent=None):
         super().__init__(parent)
 
         self.duplicate_group = duplicate_group
-        self.file_checkboxes = {}
+        # Checkable name item of each file's row, by path
+        self.file_items: dict[str, QStandardItem] = {}
+        self._selected_paths: set[str] = set()
+
+        # Files whose deletion is still running on the thread pool, and the
+        # outcome of the current batch so far
+        self._pending_deletes: dict[str, FileInfo] = {}
+        self._deleted_count = 0
+        self._failed_deletes: list[str] = []
+        self._delete_signals = FileDeleteSignals(self)
+        self._delete_signals.finished.connect(self._after_delete)
+
         self.setup_ui()
 
     def setup_ui(self):
@@ -56,148 +151,129 @@ class DuplicateGroupWidget(CardWidget):
         header_layout = QHBoxLayout()
 
         # Group info
-        confidence_color = {
-            DuplicateConfidence.HIGH: ModernTheme.SUCCESS.name(),
-            DuplicateConfidence.MEDIUM: ModernTheme.WARNING.name(),
-            DuplicateConfidence.LOW: ModernTheme.ERROR.name(),
-        }
-
-        confidence_label = QLabel(
-            f"Confidence: {self.duplicate_group.confidence.value.title()}"
-        )
-        confidence_label.setStyleSheet(f"""
-        QLabel {{
-            color: {confidence_color.get(self.duplicate_group.confidence, ModernTheme.DARK_GRAY.name())};
-            font-weight: {Typography.WEIGHT_BOLD};
-            font-size: {Typography.FONT_MD};
-            background: transparent;
-            border: none;
-        }}
-        """)
+        self.confidence_label = QLabel()
 
         # Space savings info
-        from src.utils.file_utils import format_size
+        self.savings_label = QLabel()
+        self.savings_label.setStyleSheet(_SAVINGS_QSS)
 
-        savings_text = (
-            f"Potential savings: {format_size(self.duplicate_group.potential_savings)}"
-        )
-        savings_label = QLabel(savings_text)
-        savings_label.setStyleSheet(f"""
-        QLabel {{
-            color: {ModernTheme.DARK_GRAY.name()};
-            font-size: {Typography.FONT_SM};
-            background: transparent;
-            border: none;
-        }}
-        """)
-
-        header_layout.addWidget(confidence_label)
+        self.update_header()
+
+        header_layout.addWidget(self.confidence_label)
         header_layout.addStretch()
-        header_layout.addWidget(savings_label)
+        header_layout.addWidget(self.savings_label)
 
         layout.addLayout(header_layout)
 
+    def update_header(self):
+        """Show the current group's confidence and potential savings."""
+        confidence = self.duplicate_group.confidence
+        self.confidence_label.setText(f"Confidence: {confidence.value.title()}")
+        self.confidence_label.setStyleSheet(
+            self._CONFIDENCE_QSS.get(confidence, self._DEFAULT_CONFIDENCE_QSS)
+        )
+
+        savings_text = (
+            f"Potential savings: {format_size(self.duplicate_group.potential_savings)}"
+        )
+        self.savings_label.setText(savings_text)
+
     def setup_file_list(self, layout):
-        """Setup the file list with checkboxes."""
-        files_frame = QFrame()
-        files_frame.setFrameShape(QFrame.Shape.StyledPanel)
-        files_frame.setStyleSheet(f"""
-        QFrame {{
-            background-color: {ModernTheme.LIGHT_GRAY.name()};
-            border: 1px solid {ModernTheme.BORDER.name()};
-            border-radius: 4px;
-        }}
-        """)
-
-        files_layout = QVBoxLayout(files_frame)
-        files_layout.setContentsMargins(Spacing.SM, Spacing.SM, Spacing.SM, Spacing.SM)
-
-        # Get recommended keeper
-        recommended_keeper = self.duplicate_group.get_recommended_keeper()
-
-        for file in self.duplicate_group.files:
-            file_widget = self.create_file_widget(file, file == recommended_keeper)
-            files_layout.addWidget(file_widget)
-
-        layout.addWidget(files_frame)
-
-    def create_file_widget(self, file: FileInfo, is_recommended_keeper: bool):
-        """Create a widget for a single file in the duplicate group."""
-        file_widget = QWidget()
-        file_layout = QHBoxLayout(file_widget)
-        file_layout.setContentsMargins(0, 0, 0, 0)
-
-        # Checkbox for selection
-        checkbox = QCheckBox()
-        checkbox.stateChanged.connect(self.on_file_selection_changed)
+        """Setup the file list as a checkable item model shown in a tree view."""
+        # Columns: name (checkable), details, recommended-keeper badge
+        self.files_model = QStandardItemModel(0, 3, self)
+
+        self.files_tree = QTreeView()
+        self.files_tree.setModel(self.files_model)
+        self.files_tree.setHeaderHidden(True)
+        self.files_tree.setRootIsDecorated(False)
+        self.files_tree.setUniformRowHeights(True)
+        self.files_tree.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.files_tree.setStyleSheet(_FILES_FRAME_QSS)
+        self.files_tree.setToolTip(
+            "Double-click a file (or select it and press Preview)"
+        )
 
-        # Pre-select files for removal (not the recommended keeper)
-        if not is_recommended_keeper:
-            checkbox.setChecked(True)
+        self.populate_file_list()
+
+        # One connection for the whole list instead of one per checkbox
+        self.files_model.itemChanged.connect(self.on_file_item_changed)
+        self.files_tree.doubleClicked.connect(self._on_preview_clicked)
+
+        layout.addWidget(self.files_tree)
 
-        self.file_checkboxes[file.path] = checkbox
+    def populate_file_list(self):
+        """Fill the file tree with one checkable row per file in the group."""
+        # Get recommended keeper; it is one of the group's own FileInfo
+        # objects, so identity suffices and avoids dataclass field-wise __eq__
+        recommended_keeper_id = id(self.duplicate_group.get_recommended_keeper())
 
-        # File info
-        file_info_layout = QVBoxLayout()
-        file_info_layout.setSpacing(2)
+        # Format every row's details up front, then build each row detached
+        # before handing it to the model
+        files = self.duplicate_group.files
+        append_row = self.files_model.appendRow
+        for file, details in zip(files, _file_details(files), strict=True):
+            append_row(
+                self.create_file_row(file, details, id(file) == recommended_keeper_id)
+            )
+
+        for column in range(self.files_model.columnCount()):
+            self.files_tree.resizeColumnToContents(column)
+        self._fit_tree_height()
+
+    def rebind(self, duplicate_group: DuplicateGroup):
+        """Show another duplicate group, reusing this widget's children."""
+        self.duplicate_group = duplicate_group
+        self.file_items = {}
+        self._selected_paths = set()
+        self._pending_deletes = {}
+        self._deleted_count = 0
+        self._failed_deletes = []
+        self.update_header()
+        self.files_model.setRowCount(0)
+        self.populate_file_list()
+
+    def is_deleting(self) -> bool:
+        """Whether deletions started from this widget are still running."""
+        return bool(self._pending_deletes)
+
+    def _fit_tree_height(self):
+        """Size the file tree to show every row without an inner scrollbar."""
+        tree = self.files_tree
+        row_count = self.files_model.rowCount()
+        row_height = tree.sizeHintForRow(0) if row_count else 0
+        tree.setFixedHeight(row_height * row_count + 2 * tree.frameWidth())
+
+    def create_file_row(
+        self, file: FileInfo, details_text: str, is_recommended_keeper: bool
+    ) -> list[QStandardItem]:
+        """Create the model row for a single file in the duplicate group."""
+        name_item = QStandardItem(file.name)
+        name_item.setData(file.path, Qt.ItemDataRole.UserRole)
+        name_item.setCheckable(True)
+        name_item.setForeground(ModernTheme.VERY_DARK_GRAY)
 
-        # File name and recommended badge
-        name_layout = QHBoxLayout()
-        name_label = QLabel(file.name)
-        name_label.setStyleSheet(f"""
-        QLabel {{
-            font-weight: {Typography.WEIGHT_MEDIUM};
-            font-size: {Typography.FONT_MD};
-            color: {ModernTheme.VERY_DARK_GRAY.name()};
-            background: transparent;
-            border: none;
-        }}
-        """)
+        # Pre-select files for removal (not the recommended keeper)
+        name_item.setCheckState(
+            Qt.CheckState.Unchecked if is_recommended_keeper else Qt.CheckState.Checked
+        )
+        if not is_recommended_keeper:
+            self._selected_paths.add(file.path)
 
-        name_layout.addWidget(name_label)
+        details_item = QStandardItem(details_text)
+        details_item.setForeground(ModernTheme.DARK_GRAY)
 
+        # The badge is drawn from the item's font and colour roles
+        badge_item = QStandardItem()
         if is_recommended_keeper:
-            recommended_label = QLabel("RECOMMENDED KEEPER")
-            recommended_label.setStyleSheet(f"""
-            QLabel {{
-                background-color: {ModernTheme.SUCCESS.name()};
-                color: {ModernTheme.WHITE.name()};
-                padding: 2px 6px;
-                border-radius: 3px;
-                font-size: {Typography.FONT_XS};
-                font-weight: {Typography.WEIGHT_BOLD};
-            }}
-            """)
-            name_layout.addWidget(recommended_label)
-
-        name_layout.addStretch()
-        file_info_layout.addLayout(name_layout)
-
-        # File details
-        from src.utils.file_utils import format_size
-
-        details_text = f"{file.path} • {format_size(file.size)} • {file.modified.strftime('%Y-%m-%d %H:%M')}"
-        details_label = QLabel(details_text)
-        details_label.setStyleSheet(f"""
-        QLabel {{
-            color: {ModernTheme.DARK_GRAY.name()};
-            font-size: {Typography.FONT_SM};
-            background: transparent;
-            border: none;
-        }}
-        """)
-        file_info_layout.addWidget(details_label)
-
-        # Preview button
-        preview_button = ModernButton("Preview", "secondary")
-        preview_button.setMaximumWidth(80)
-        preview_button.clicked.connect(lambda: self.preview_requested.emit(file.path))
-
-        file_layout.addWidget(checkbox)
-        file_layout.addLayout(file_info_layout, 1)
-        file_layout.addWidget(preview_button)
-
-        return file_widget
+            badge_item.setText("RECOMMENDED KEEPER")
+            badge_font = badge_item.font()
+            badge_font.setBold(True)
+            badge_item.setFont(badge_font)
+            badge_item.setForeground(ModernTheme.SUCCESS)
+
+        self.file_items[file.path] = name_item
+        return [name_item, details_item, badge_item]
 
     def setup_actions(self, layout):
         """Setup action buttons."""
@@ -210,6 +286,10 @@ class DuplicateGroupWidget(CardWidget):
         select_none_btn = ModernButton("Select None", "secondary")
         select_none_btn.clicked.connect(self.select_no_files)
 
+        # Preview button shared by all rows; previews the current row
+        preview_btn = ModernButton("Preview", "secondary")
+        preview_btn.clicked.connect(self._on_preview_clicked)
+
         # Remove selected button
         remove_btn = ModernButton("Remove Selected", "danger")
         remove_btn.clicked.connect(self.remove_selected_files)
@@ -217,10 +297,31 @@ class DuplicateGroupWidget(CardWidget):
         actions_layout.addWidget(select_all_btn)
         actions_layout.addWidget(select_none_btn)
         actions_layout.addStretch()
+        actions_layout.addWidget(preview_btn)
         actions_layout.addWidget(remove_btn)
 
         layout.addLayout(actions_layout)
 
+    def on_file_item_changed(self, item: QStandardItem):
+        """Handle check state changes in the file list."""
+        if item.column() != 0:
+            return
+
+        # Keep the selected-path set in step with the toggled row
+        path = item.data(Qt.ItemDataRole.UserRole)
+        if item.checkState() == Qt.CheckState.Checked:
+            self._selected_paths.add(path)
+        else:
+            self._selected_paths.discard(path)
+        self.on_file_selection_changed()
+
+    def _on_preview_clicked(self, *_args):
+        """Request a preview of the current row; the path is stored on the item."""
+        index = self.files_tree.currentIndex()
+        if index.isValid():
+            item = self.files_model.item(index.row(), 0)
+            self.preview_requested.emit(item.data(Qt.ItemDataRole.UserRole))
+
     def on_file_selection_changed(self):
         """Handle file selection changes."""
         selected_files = self.get_selected_files()
@@ -228,22 +329,32 @@ class DuplicateGroupWidget(CardWidget):
 
     def get_selected_files(self) -> list[FileInfo]:
         """Get list of selected files."""
-        selected_files = []
-        for file in self.duplicate_group.files:
-            checkbox = self.file_checkboxes.get(file.path)
-            if checkbox and checkbox.isChecked():
-                selected_files.append(file)
-        return selected_files
+        selected_paths = self._selected_paths
+        return [
+            file for file in self.duplicate_group.files if file.path in selected_paths
+        ]
 
     def select_all_files(self):
         """Select all files in the group."""
-        for checkbox in self.file_checkboxes.values():
-            checkbox.setChecked(True)
+        self._set_all_check_states(Qt.CheckState.Checked)
 
     def select_no_files(self):
         """Deselect all files in the group."""
-        for checkbox in self.file_checkboxes.values():
-            checkbox.setChecked(False)
+        self._set_all_check_states(Qt.CheckState.Unchecked)
+
+    def _set_all_check_states(self, state: Qt.CheckState):
+        """Apply a check state to every file, notifying listeners only once."""
+        # Block itemChanged so the batch doesn't emit files_selected per row;
+        # that also silences dataChanged, hence the explicit repaint below
+        with QSignalBlocker(self.files_model):
+            for item in self.file_items.values():
+                item.setCheckState(state)
+        if state == Qt.CheckState.Checked:
+            self._selected_paths = set(self.file_items)
+        else:
+            self._selected_paths = set()
+        self.files_tree.viewport().update()
+        self.on_file_selection_changed()
 
     def remove_selected_files(self):
         """Remove selected files (with confirmation)."""
@@ -255,14 +366,14 @@ class DuplicateGroupWidget(CardWidget):
             return
 
         # Confirmation dialog
-        file_list = "\\n".join([f"• {file.name}" for file in selected_files[:5]])
-        if len(selected_files) > 5:
-            file_list += f"\\n... and {len(selected_files) - 5} more files"
+        count = len(selected_files)
+        file_list = "\n".join(f"• {file.name}" for file in islice(selected_files, 5))
+        more = f"\n... and {count - 5} more files" if count > 5 else ""
 
         reply = QMessageBox.question(
             self,
             "Confirm Deletion",
-            f"Are you sure you want to delete these {len(selected_files)} files?\\n\\n{file_list}\\n\\nThis action cannot be undone.",
+            f"Are you sure you want to delete these {count} files?\n\n{file_list}{more}\n\nThis action cannot be undone.",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
             QMessageBox.StandardButton.No,
         )
@@ -271,23 +382,49 @@ class DuplicateGroupWidget(CardWidget):
             self.delete_files(selected_files)
 
     def delete_files(self, files: list[FileInfo]):
-        """Delete the specified files."""
-        success_count = 0
-        failed_files = []
-
+        """Delete the specified files on the thread pool."""
+        # Deletes are independent, so the pool runs them concurrently while
+        # the UI stays responsive; _after_delete applies each outcome
+        pool = QThreadPool.globalInstance()
         for file in files:
-            try:
-                os.remove(file.path)
-                success_count += 1
+            if file.path in self._pending_deletes:
+                continue
+            self._pending_deletes[file.path] = file
+            pool.start(FileDeleteRunnable(file.path, self._delete_signals))
+
+    def _after_delete(self, file_path: str, error: str):
+        """Apply one finished deletion; report once the whole batch is done."""
+        file = self._pending_deletes.pop(file_path, None)
+        if file is None:
+            return
 
-                # Remove from UI
-                checkbox = self.file_checkboxes.get(file.path)
-                if checkbox:
-                    checkbox.parent().setVisible(False)
-                    del self.file_checkboxes[file.path]
+        if error:
+            self._failed_deletes.append(f"{file.name}: {error}")
+        else:
+            self._deleted_count += 1
+
+            # Release the row rather than hiding it, and drop the file from
+            # the group so later selection scans stay short and correct
+            self._selected_paths.discard(file.path)
+            item = self.file_items.pop(file.path, None)
+            if item:
+                self.files_model.removeRow(item.row())
+            files = self.duplicate_group.files
+            if file in files:
+                files.remove(file)
+
+        if self._pending_deletes:
+            return
 
-            except Exception as e:
-                failed_files.append(f"{file.name}: {e!s}")
+        success_count = self._deleted_count
+        failed_files = self._failed_deletes
+        self._deleted_count = 0
+        self._failed_deletes = []
+
+        if success_count > 0:
+            self.duplicate_group.update_totals()
+            self.update_header()
+            self._fit_tree_height()
 
         # Show results
         if success_count > 0:
@@ -296,9 +433,9 @@ class DuplicateGroupWidget(CardWidget):
             )
 
         if failed_files:
-            error_message = "\\n".join(failed_files)
+            error_message = "\n".join(failed_files)
             QMessageBox.warning(
-                self, "Some Deletions Failed", f"Failed to delete:\\n{error_message}"
+                self, "Some Deletions Failed", f"Failed to delete:\n{error_message}"
             )
 
 
@@ -312,6 +449,23 @@ class DuplicateFinderTool(QWidget):
         self.duplicate_groups = []
         self.analysis_worker = None
 
+        # Placeholder frames for groups not yet built, keyed to their group
+        self._pending: dict[QFrame, DuplicateGroup] = {}
+
+        # Group widgets currently displayed, and hidden ones kept for reuse
+        self._group_widgets: list[DuplicateGroupWidget] = []
+        self._group_widget_pool: list[DuplicateGroupWidget] = []
+
+        # Hidden group widgets whose deletions are still running; they keep
+        # their group until the batch is reported, then become reusable
+        self._deleting_group_widgets: list[DuplicateGroupWidget] = []
+
+        # Latest worker progress, applied to the progress bar at most 20x/s
+        self._pending_progress: tuple[str, int] | None = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(50)
+        self._progress_timer.timeout.connect(self._flush_progress)
+
         self.setup_ui()
 
     def setup_ui(self):
@@ -383,14 +537,16 @@ class DuplicateFinderTool(QWidget):
         self.results_area = QScrollArea()
         self.results_area.setWidgetResizable(True)
         self.results_area.setVisible(False)
-
-        self.results_widget = QWidget()
-        self.results_layout = QVBoxLayout(self.results_widget)
-        self.results_layout.setSpacing(Spacing.MD)
-
-        self.results_area.setWidget(self.results_widget)
+        self.results_widget, self.results_layout = replace_results_container(
+            self.results_area
+        )
         layout.addWidget(self.results_area, 1)  # Take remaining space
 
+        # Build group widgets lazily as their placeholders scroll into view
+        scroll_bar = self.results_area.verticalScrollBar()
+        scroll_bar.valueChanged.connect(self._materialize_visible_groups)
+        scroll_bar.rangeChanged.connect(self._materialize_visible_groups)
+
     def update_files(self, files: list[dict]):
         """Update the files to analyze."""
         self.current_files = files
@@ -407,6 +563,8 @@ class DuplicateFinderTool(QWidget):
         self.cancel_button.setVisible(True)
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
+        self._pending_progress = None
+        self._progress_timer.start()
 
         # Clear previous results
         self.clear_results()
@@ -418,9 +576,10 @@ class DuplicateFinderTool(QWidget):
             self.use_heuristics.isChecked(),
         )
 
-        self.analysis_worker.progress_updated.connect(self.on_progress_updated)
-        self.analysis_worker.analysis_completed.connect(self.on_analysis_completed)
-        self.analysis_worker.analysis_failed.connect(self.on_analysis_failed)
+        signals = self.analysis_worker.signals
+        signals.progress_updated.connect(self.on_progress_updated)
+        signals.analysis_completed.connect(self.on_analysis_completed)
+        signals.analysis_failed.connect(self.on_analysis_failed)
         self.analysis_worker.start()
 
     def cancel_analysis(self):
@@ -433,6 +592,16 @@ class DuplicateFinderTool(QWidget):
 
     def on_progress_updated(self, message: str, percentage: int):
         """Handle progress updates."""
+        # Only remember the latest value; _flush_progress paints it
+        self._pending_progress = (message, percentage)
+
+    def _flush_progress(self):
+        """Apply the most recent progress update to the progress bar."""
+        if self._pending_progress is None:
+            return
+
+        message, percentage = self._pending_progress
+        self._pending_progress = None
         self.progress_bar.setValue(percentage)
         self.progress_bar.setFormat(f"{message} ({percentage}%)")
 
@@ -452,6 +621,8 @@ class DuplicateFinderTool(QWidget):
         self.start_button.setVisible(True)
         self.cancel_button.setVisible(False)
         self.progress_bar.setVisible(False)
+        self._progress_timer.stop()
+        self._pending_progress = None
 
     def display_results(self):
         """Display analysis results."""
@@ -460,40 +631,91 @@ class DuplicateFinderTool(QWidget):
         if not self.duplicate_groups:
             # No duplicates found
             no_results_label = QLabel("No duplicate files found!")
-            no_results_label.setStyleSheet(f"""
-            QLabel {{
-                color: {ModernTheme.SUCCESS.name()};
-                font-size: {Typography.FONT_LG};
-                font-weight: {Typography.WEIGHT_BOLD};
-                padding: {Spacing.XL}px;
-                text-align: center;
-                background: transparent;
-                border: none;
-            }}
-            """)
+            no_results_label.setStyleSheet(_NO_RESULTS_QSS)
             no_results_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             self.results_layout.addWidget(no_results_label)
 
         else:
+            # Suspend repaints while the layout is filled, then repaint once
+            self.results_area.setUpdatesEnabled(False)
+            self.results_widget.setUpdatesEnabled(False)
+
             # Show summary statistics
             self.add_summary_stats()
 
-            # Show duplicate groups
+            # Show duplicate groups as sized placeholders; the real widgets
+            # are only built once a placeholder reaches the viewport
+            add_widget = self.results_layout.addWidget
+            estimate_height = self._estimate_group_height
             for group in self.duplicate_groups:
-                group_widget = DuplicateGroupWidget(group)
-                group_widget.files_selected.connect(self.on_files_selected)
-                group_widget.preview_requested.connect(self.on_preview_requested)
-                self.results_layout.addWidget(group_widget)
+                placeholder = QFrame()
+                placeholder.setMinimumHeight(estimate_height(group))
+                self._pending[placeholder] = group
+                add_widget(placeholder)
+
+            self.results_widget.setUpdatesEnabled(True)
+            self.results_area.setUpdatesEnabled(True)
+            self.results_widget.updateGeometry()
 
         self.results_area.setVisible(True)
 
+        if self._pending:
+            # Wait for the layout pass so placeholder geometry is valid
+            QTimer.singleShot(0, self._materialize_visible_groups)
+
+    def _estimate_group_height(self, group: DuplicateGroup) -> int:
+        """Approximate the height of a DuplicateGroupWidget before building it."""
+        row_height = self.fontMetrics().height() + Spacing.XS
+        return 2 * Spacing.MD + 3 * Spacing.XL + row_height * len(group.files)
+
+    def _create_group_widget(self, group: DuplicateGroup) -> DuplicateGroupWidget:
+        """Get a group widget for a group, reusing a pooled one if available."""
+        if self._group_widget_pool:
+            group_widget = self._group_widget_pool.pop()
+            group_widget.rebind(group)
+            group_widget.show()
+        else:
+            group_widget = DuplicateGroupWidget(group)
+            group_widget.files_selected.connect(self.on_files_selected)
+            group_widget.preview_requested.connect(self.on_preview_requested)
+        self._group_widgets.append(group_widget)
+        return group_widget
+
+    def _materialize_visible_groups(self, *_args):
+        """Replace placeholders intersecting the viewport with real group widgets."""
+        if not self._pending or not self.results_area.isVisible():
+            return
+
+        # Placeholder geometry is only meaningful once the scroll area has
+        # grown the results widget to fit them; rangeChanged calls us again
+        self.results_layout.activate()
+        if self.results_widget.height() < self.results_layout.minimumSize().height():
+            return
+
+        top = self.results_area.verticalScrollBar().value()
+        bottom = top + self.results_area.viewport().height()
+
+        for placeholder in list(self._pending):
+            # Freshly added placeholders are shown by a queued call; until
+            # then the layout skips them and their geometry is stale
+            if not placeholder.isVisible():
+                QTimer.singleShot(0, self._materialize_visible_groups)
+                return
+
+            geometry = placeholder.geometry()
+            if geometry.bottom() < top or geometry.top() > bottom:
+                continue
+
+            group = self._pending.pop(placeholder)
+            group_widget = self._create_group_widget(group)
+            self.results_layout.replaceWidget(placeholder, group_widget)
+            placeholder.deleteLater()
+
     def add_summary_stats(self):
         """Add summary statistics card."""
         total_files = sum(len(group.files) for group in self.duplicate_groups)
         total_savings = sum(group.potential_savings for group in self.duplicate_groups)
 
-        from src.utils.file_utils import format_size
-
         summary_card = CardWidget()
         summary_layout = QHBoxLayout(summary_card)
 
@@ -509,10 +731,30 @@ class DuplicateFinderTool(QWidget):
 
     def clear_results(self):
         """Clear the results area."""
-        while self.results_layout.count():
-            child = self.results_layout.takeAt(0)
-            if child.widget():
-                child.widget().setParent(None)
+        self._pending.clear()
+
+        # Keep up to 25 group widgets for the next display; reparenting to the
+        # tool hides them and saves them from the container's destruction
+        # below, and the rest are released along with it. Widgets still
+        # deleting files are set aside instead: a rebind would apply their
+        # results to another group, and releasing them would drop the results
+        pool = self._group_widget_pool
+        deleting = []
+        for widget in self._deleting_group_widgets + self._group_widgets:
+            if widget.is_deleting():
+                widget.setParent(self)
+                deleting.append(widget)
+            elif len(pool) < 25:
+                widget.setParent(self)
+                pool.append(widget)
+            else:
+                widget.deleteLater()
+        self._deleting_group_widgets = deleting
+        self._group_widgets.clear()
+
+        self.results_widget, self.results_layout = replace_results_container(
+            self.results_area
+        )
 
     def on_files_selected(self, selected_files: list[FileInfo], group: DuplicateGroup):
         """Handle file selection in a duplicate group."""
@@ -525,7 +767,7 @@ class DuplicateFinderTool(QWidget):
         QMessageBox.information(
             self,
             "File Preview",
-            f"File: {file_path}\\n\\nPreview functionality will be enhanced in future versions.",
+            f"File: {file_path}\n\nPreview functionality will be enhanced in future versions.",
         )
 
     def get_analysis_summary(self) -> dict:
@@ -4,155 +4,406 @@
 import os
 import platform
 import subprocess
-
-from PyQt6.QtCore import Qt, pyqtSignal
+from functools import partial
+from operator import attrgetter
+from typing import ClassVar
+
+from PyQt6.QtCore import (
+    QAbstractListModel,
+    QModelIndex,
+    QPersistentModelIndex,
+    QRect,
+    QSize,
+    Qt,
+    QThreadPool,
+    QTimer,
+    pyqtSignal,
+)
+from PyQt6.QtGui import QColor, QFont, QFontMetrics, QPainter
 from PyQt6.QtWidgets import (
+    QAbstractItemView,
+    QApplication,
     QCheckBox,
     QComboBox,
     QFileDialog,
     QHBoxLayout,
     QLabel,
+    QListView,
+    QMenu,
     QMessageBox,
     QProgressBar,
     QScrollArea,
     QSpinBox,
+    QStyle,
+    QStyledItemDelegate,
     QVBoxLayout,
     QWidget,
 )
 
+from src.utils.file_utils import format_size
+
 from ....themes.styles import ModernTheme, Spacing, Typography
 from ...card_widget import CardWidget, StatsCard, TitleCard
 from ...modern_button import ModernButton
 from ..models.management_data import FileInfo, FileSizeCategory, LargeFileAnalysis
 from ..services.large_file_service import LargeFileAnalysisService
 from ..workers.analysis_workers import LargeFileAnalysisWorker
+from ..workers.file_workers import FileDeleteRunnable, FileDeleteSignals
+from .common import ThrottledProgress, replace_results_container
+
+# C-level sort keys for the plain attribute sorts
+_KEY_SIZE = attrgetter("size")
+_KEY_MODIFIED = attrgetter("modified")
+
+# Theme colour names resolved once; these QColors never change at runtime
+_WHITE = ModernTheme.WHITE.name()
+_BORDER = ModernTheme.BORDER.name()
+_DARK_GRAY = ModernTheme.DARK_GRAY.name()
+_VERY_DARK_GRAY = ModernTheme.VERY_DARK_GRAY.name()
+
+# Stylesheets built once at import instead of re-formatted per widget
+_FILE_LIST_QSS = f"""
+QListView {{
+    background-color: {_WHITE};
+    border: 1px solid {_BORDER};
+    border-radius: 4px;
+}}
+QListView::item {{
+    border-bottom: 1px solid {_BORDER};
+}}
+QListView::item:hover {{
+    background-color: {ModernTheme.HOVER.name()};
+}}
+QListView::item:selected {{
+    background-color: {ModernTheme.SELECTED.name()};
+}}
+"""
+
+_NO_RESULTS_QSS = f"""
+QLabel {{
+    color: {ModernTheme.SUCCESS.name()};
+    font-size: {Typography.FONT_LG};
+    font-weight: {Typography.WEIGHT_BOLD};
+    padding: {Spacing.XL}px;
+    text-align: center;
+    background: transparent;
+    border: none;
+}}
+"""
+
+_REC_TITLE_QSS = f"""
+QLabel {{
+    font-weight: {Typography.WEIGHT_BOLD};
+    font-size: {Typography.FONT_MD};
+    color: {_VERY_DARK_GRAY};
+    background: transparent;
+    border: none;
+}}
+"""
+
+_REC_DESC_QSS = f"""
+QLabel {{
+    color: {_DARK_GRAY};
+    font-size: {Typography.FONT_SM};
+    background: transparent;
+    border: none;
+}}
+"""
+
+_REC_ACTION_QSS = f"""
+QLabel {{
+    color: {_DARK_GRAY};
+    font-size: {Typography.FONT_SM};
+    font-style: italic;
+    background: transparent;
+    border: none;
+}}
+"""
+
+
+def _priority_badge_qss(color: str) -> str:
+    """Build the recommendation priority badge stylesheet for a background."""
+    return f"""
+QLabel {{
+    background-color: {color};
+    color: {_WHITE};
+    padding: 4px 8px;
+    border-radius: 4px;
+    font-size: {Typography.FONT_XS};
+    font-weight: {Typography.WEIGHT_BOLD};
+    max-width: 60px;
+}}
+"""
+
+
+def _launch_detached(command: list[str]):
+    """Start an external program without waiting for it to come up."""
+    if platform.system() == "Windows":
+        options = {
+            "creationflags": subprocess.CREATE_NEW_PROCESS_GROUP
+            | subprocess.DETACHED_PROCESS
+        }
+    else:
+        options = {"start_new_session": True}
 
+    subprocess.Popen(
+        command,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        **options,
+    )
 
-class LargeFileItemWidget(CardWidget):
-    """Widget for displaying a single large file with actions."""
 
-    file_action_requested = pyqtSignal(str, str)  # action, file_path
+class LargeFileListModel(QAbstractListModel):
+    """List model exposing large files to a view without per-row widgets."""
 
-    def __init__(self, file_info: FileInfo, rank: int, parent=None):
+    FileInfoRole = Qt.ItemDataRole.UserRole
+
+    def __init__(self, parent=None):
         super().__init__(parent)
+        self._files: list[FileInfo] = []
+
+    def rowCount(self, parent=QModelIndex()):
+        """Return the number of rows."""
+        return 0 if parent.isValid() else len(self._files)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Return the data at the given index."""
+        if not index.isValid() or index.row() >= len(self._files):
+            return None
+
+        file_info = self._files[index.row()]
+        if role == self.FileInfoRole:
+            return file_info
+        elif role == Qt.ItemDataRole.DisplayRole:
+            return file_info.name
+        elif role == Qt.ItemDataRole.ToolTipRole:
+            return file_info.path
+        return None
+
+    def set_files(self, files: list[FileInfo]):
+        """Replace the model contents with an already sorted list of files."""
+        self.beginResetModel()
+        self._files = list(files)
+        self.endResetModel()
+
+    def file_at(self, row: int) -> FileInfo:
+        """Return the file shown in the given row."""
+        return self._files[row]
+
+    def remove_file(self, file_info: FileInfo, row: int = -1) -> bool:
+        """
+        Remove a single file's row, returning whether it was present.
+
+        A row known to hold the file is used directly; otherwise the rows
+        are searched for it.
+        """
+        files = self._files
+        if not (0 <= row < len(files) and files[row] is file_info):
+            row = next((i for i, listed in enumerate(files) if listed is file_info), -1)
+            if row < 0:
+                return False
+
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del files[row]
+        self.endRemoveRows()
+        return True
+
+
+class LargeFileItemDelegate(QStyledItemDelegate):
+    """Paints a large file row: rank pill, name, size badge and details."""
+
+    ROW_HEIGHT = 2 * Spacing.SM + 2 * 20
+
+    _CATEGORY_COLORS: ClassVar[dict[FileSizeCategory, QColor]] = {
+        FileSizeCategory.SMALL: ModernTheme.SUCCESS,
+        FileSizeCategory.MEDIUM: ModernTheme.WARNING,
+        FileSizeCategory.LARGE: ModernTheme.ERROR,
+        FileSizeCategory.HUGE: ModernTheme.ERROR,
+        FileSizeCategory.MASSIVE: ModernTheme.ERROR,
+    }
 
-        self.file_info = file_info
-        self.rank = rank
-        self.setup_ui()
+    def __init__(self, parent=None):
+        super().__init__(parent)
 
-    def setup_ui(self):
-        """Setup the file item UI."""
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(Spacing.MD, Spacing.SM, Spacing.MD, Spacing.SM)
-        layout.setSpacing(Spacing.MD)
+        # Fonts are built once per delegate rather than per painted row
+        self._name_font = QFont()
+        self._name_font.setWeight(QFont.Weight.Medium)
+        self._name_font.setPixelSize(int(Typography.FONT_MD.removesuffix("px")))
+        self._details_font = QFont()
+        self._details_font.setPixelSize(int(Typography.FONT_SM.removesuffix("px")))
+        self._badge_font = QFont(self._details_font)
+        self._badge_font.setBold(True)
+
+        self._name_metrics = QFontMetrics(self._name_font)
+        self._details_metrics = QFontMetrics(self._details_font)
+        self._badge_metrics = QFontMetrics(self._badge_font)
+
+        # Details line per file path; rows are repainted on every scroll
+        self._details_cache: dict[str, str] = {}
+
+    def sizeHint(self, option, index):
+        """Every row has the same height so the view can lay out in O(1)."""
+        return QSize(option.rect.width(), self.ROW_HEIGHT)
+
+    def paint(self, painter, option, index):
+        """Paint the row directly from the model's FileInfo."""
+        file_info = index.data(LargeFileListModel.FileInfoRole)
+        if file_info is None:
+            super().paint(painter, option, index)
+            return
 
-        # Rank badge
-        rank_label = QLabel(f"#{self.rank}")
-        rank_label.setStyleSheet(f"""
-        QLabel {{
-            background-color: {ModernTheme.PRIMARY.name()};
-            color: {ModernTheme.WHITE.name()};
-            padding: 4px 8px;
-            border-radius: 12px;
-            font-size: {Typography.FONT_SM};
-            font-weight: {Typography.WEIGHT_BOLD};
-            min-width: 24px;
-            max-width: 40px;
-        }}
-        """)
-        rank_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        painter.save()
 
-        # File info section
-        info_layout = QVBoxLayout()
-        info_layout.setSpacing(2)
+        # Background (hover / selection) comes from the view's style
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawPrimitive(
+            QStyle.PrimitiveElement.PE_PanelItemViewItem, option, painter, option.widget
+        )
 
-        # File name and size
-        name_layout = QHBoxLayout()
-        name_label = QLabel(self.file_info.name)
-        name_label.setStyleSheet(f"""
-        QLabel {{
-            font-weight: {Typography.WEIGHT_MEDIUM};
-            font-size: {Typography.FONT_MD};
-            color: {ModernTheme.VERY_DARK_GRAY.name()};
-            background: transparent;
-            border: none;
-        }}
-        """)
+        rect = option.rect.adjusted(Spacing.MD, Spacing.SM, -Spacing.MD, -Spacing.SM)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        from src.utils.file_utils import format_size
+        # Rank badge, wide enough for the highest rank so every row's text
+        # column lines up however long the list is
+        widest_rank = f"#{index.model().rowCount()}"
+        rank_width = max(
+            40, self._badge_metrics.horizontalAdvance(widest_rank) + 2 * Spacing.SM
+        )
+        rank_rect = QRect(rect.left(), rect.center().y() - 12, rank_width, 24)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(ModernTheme.PRIMARY)
+        painter.drawRoundedRect(rank_rect, 12, 12)
+        painter.setFont(self._badge_font)
+        painter.setPen(ModernTheme.WHITE)
+        painter.drawText(rank_rect, Qt.AlignmentFlag.AlignCenter, f"#{index.row() + 1}")
+
+        # Two text lines to the right of the rank badge
+        text_left = rank_rect.right() + Spacing.MD
+        line_height = rect.height() // 2
+        name_line = QRect(text_left, rect.top(), rect.right() - text_left, line_height)
+        details_line = name_line.translated(0, line_height)
+
+        # Size badge, right-aligned on the name line
+        size_text = format_size(file_info.size)
+        badge_width = self._badge_metrics.horizontalAdvance(size_text) + 2 * Spacing.SM
+        badge_rect = QRect(
+            name_line.right() - badge_width,
+            name_line.top(),
+            badge_width,
+            name_line.height() - 2,
+        )
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(
+            self._CATEGORY_COLORS.get(file_info.size_category, ModernTheme.DARK_GRAY)
+        )
+        painter.drawRoundedRect(badge_rect, 4, 4)
+        painter.setPen(ModernTheme.WHITE)
+        painter.drawText(badge_rect, Qt.AlignmentFlag.AlignCenter, size_text)
+
+        # File name
+        left_v_center = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+        name_rect = name_line.adjusted(0, 0, -(badge_width + Spacing.SM), 0)
+        painter.setFont(self._name_font)
+        painter.setPen(ModernTheme.VERY_DARK_GRAY)
+        painter.drawText(
+            name_rect,
+            left_v_center,
+            self._name_metrics.elidedText(
+                file_info.name, Qt.TextElideMode.ElideRight, name_rect.width()
+            ),
+        )
 
-        size_label = QLabel(format_size(self.file_info.size))
-        size_label.setStyleSheet(f"""
-        QLabel {{
-            background-color: {self._get_size_category_color()};
-            color: {ModernTheme.WHITE.name()};
-            padding: 2px 8px;
-            border-radius: 4px;
-            font-size: {Typography.FONT_SM};
-            font-weight: {Typography.WEIGHT_BOLD};
-        }}
-        """)
+        # File details
+        details_text = self._details_text(file_info)
+        painter.setFont(self._details_font)
+        painter.setPen(ModernTheme.DARK_GRAY)
+        painter.drawText(
+            details_line,
+            left_v_center,
+            self._details_metrics.elidedText(
+                details_text, Qt.TextElideMode.ElideMiddle, details_line.width()
+            ),
+        )
 
-        name_layout.addWidget(name_label)
-        name_layout.addStretch()
-        name_layout.addWidget(size_label)
+        painter.restore()
 
-        # File details
-        details_text = f"{self.file_info.path} • {self.file_info.file_type.upper()} • Modified: {self.file_info.modified.strftime('%Y-%m-%d')}"
-        details_label = QLabel(details_text)
-        details_label.setStyleSheet(f"""
-        QLabel {{
-            color: {ModernTheme.DARK_GRAY.name()};
-            font-size: {Typography.FONT_SM};
-            background: transparent;
-            border: none;
-        }}
-        """)
+    def _details_text(self, file_info: FileInfo) -> str:
+        """Get the path, type and modification date line for a file."""
+        details_text = self._details_cache.get(file_info.path)
+        if details_text is None:
+            # date.isoformat() gives the same YYYY-MM-DD as strftime, cheaper
+            details_text = (
+                f"{file_info.path} • {file_info.file_type.upper()} • "
+                f"Modified: {file_info.modified.date().isoformat()}"
+            )
+            self._details_cache[file_info.path] = details_text
+        return details_text
 
-        info_layout.addLayout(name_layout)
-        info_layout.addWidget(details_label)
 
-        # Action buttons
-        actions_layout = QHBoxLayout()
-        actions_layout.setSpacing(Spacing.SM)
+class LargeFileListView(QListView):
+    """List view of large files with open/delete actions on the chosen row."""
 
-        open_btn = ModernButton("Open Location", "secondary")
-        open_btn.setMaximumWidth(120)
-        open_btn.clicked.connect(
-            lambda: self.file_action_requested.emit(
-                "open_location", self.file_info.path
-            )
-        )
+    file_action_requested = pyqtSignal(str, str)  # action, file_path
 
-        delete_btn = ModernButton("Delete", "danger")
-        delete_btn.setMaximumWidth(80)
-        delete_btn.clicked.connect(
-            lambda: self.file_action_requested.emit("delete", self.file_info.path)
-        )
+    def __init__(self, parent=None):
+        super().__init__(parent)
 
-        actions_layout.addWidget(open_btn)
-        actions_layout.addWidget(delete_btn)
+        self.setUniformItemSizes(True)
+        self.setMouseTracking(True)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setItemDelegate(LargeFileItemDelegate(self))
+        self.setStyleSheet(_FILE_LIST_QSS)
 
-        # Assemble layout
-        layout.addWidget(rank_label)
-        layout.addLayout(info_layout, 1)
-        layout.addLayout(actions_layout)
-
-    def _get_size_category_color(self) -> str:
-        """Get color based on file size category."""
-        colors = {
-            FileSizeCategory.SMALL: ModernTheme.SUCCESS.name(),
-            FileSizeCategory.MEDIUM: ModernTheme.WARNING.name(),
-            FileSizeCategory.LARGE: ModernTheme.ERROR.name(),
-            FileSizeCategory.HUGE: ModernTheme.ERROR.name(),
-            FileSizeCategory.MASSIVE: ModernTheme.ERROR.name(),
-        }
-        return colors.get(self.file_info.size_category, ModernTheme.DARK_GRAY.name())
+        self.doubleClicked.connect(partial(self._emit_action, "open_location"))
+
+    def request_action(self, action: str):
+        """Request an action for the current row, if any."""
+        self._emit_action(action, self.currentIndex())
+
+    def contextMenuEvent(self, event):
+        """Offer the file actions for the row under the cursor."""
+        index = self.indexAt(event.pos())
+        if not index.isValid():
+            return
+
+        # The menu acts on this row, so make it the current one too
+        self.setCurrentIndex(index)
+
+        menu = QMenu(self)
+        open_action = menu.addAction("Open Location")
+        delete_action = menu.addAction("Delete")
+
+        chosen = menu.exec(event.globalPos())
+        if chosen is open_action:
+            self._emit_action("open_location", index)
+        elif chosen is delete_action:
+            self._emit_action("delete", index)
+
+    def _emit_action(self, action: str, index: QModelIndex):
+        """Emit file_action_requested for the file at index."""
+        if index.isValid():
+            file_info = index.data(LargeFileListModel.FileInfoRole)
+            self.file_action_requested.emit(action, file_info.path)
 
 
 class LargeFileAnalyzerTool(QWidget):
     """Main large file analyzer and management tool."""
 
+    # Recommendation priority badge colours and their full stylesheets
+    _PRIORITY_COLORS: ClassVar[dict[str, str]] = {
+        "high": ModernTheme.ERROR.name(),
+        "medium": ModernTheme.WARNING.name(),
+        "low": ModernTheme.SUCCESS.name(),
+    }
+    _PRIORITY_QSS: ClassVar[dict[str, str]] = {
+        priority: _priority_badge_qss(color)
+        for priority, color in _PRIORITY_COLORS.items()
+    }
+    _DEFAULT_PRIORITY_QSS: ClassVar[str] = _priority_badge_qss(_DARK_GRAY)
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
@@ -161,6 +412,16 @@ class LargeFileAnalyzerTool(QWidget):
         self.analysis_worker = None
         self.service = LargeFileAnalysisService()
 
+        # Sorted views of the current analysis' files, keyed by sort option;
+        # cleared whenever the analysis or its file list changes
+        self._sort_cache: dict[str, list[FileInfo]] = {}
+
+        # Listed rows of files being deleted (tracked across other row
+        # removals), plus the displayed list model and stats cards, so a
+        # deletion can update the results in place
+        self._pending_delete_rows: dict[str, QPersistentModelIndex] = {}
+        self._reset_result_refs()
+
         self.setup_ui()
 
     def setup_ui(self):
@@ -178,6 +439,7 @@ class LargeFileAnalyzerTool(QWidget):
         # Progress bar
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
+        self._progress = ThrottledProgress(self.progress_bar)
         layout.addWidget(self.progress_bar)
 
         # Results area
@@ -261,6 +523,7 @@ class LargeFileAnalyzerTool(QWidget):
             min-width: 150px;
         }}
         """)
+        self.sort_combo.currentTextChanged.connect(self.on_sort_changed)
 
         sort_layout.addWidget(sort_label)
         sort_layout.addWidget(self.sort_combo)
@@ -306,12 +569,9 @@ class LargeFileAnalyzerTool(QWidget):
         self.results_area = QScrollArea()
         self.results_area.setWidgetResizable(True)
         self.results_area.setVisible(False)
-
-        self.results_widget = QWidget()
-        self.results_layout = QVBoxLayout(self.results_widget)
-        self.results_layout.setSpacing(Spacing.MD)
-
-        self.results_area.setWidget(self.results_widget)
+        self.results_widget, self.results_layout = replace_results_container(
+            self.results_area
+        )
         layout.addWidget(self.results_area, 1)  # Take remaining space
 
     def update_files(self, files: list[dict]):
@@ -336,17 +596,21 @@ class LargeFileAnalyzerTool(QWidget):
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
 
-        # Clear previous results
-        self.clear_results()
+        # Previous results stay up until the new ones arrive, so display_results
+        # can keep them when nothing changed
 
         # Start analysis worker
         self.analysis_worker = LargeFileAnalysisWorker(
             self.current_files, threshold_bytes
         )
-
-        self.analysis_worker.progress_updated.connect(self.on_progress_updated)
-        self.analysis_worker.analysis_completed.connect(self.on_analysis_completed)
-        self.analysis_worker.analysis_failed.connect(self.on_analysis_failed)
+        self._progress.reset()
+
+        # Queue explicitly so the worker never blocks on UI slots
+        signals = self.analysis_worker.signals
+        queued = Qt.ConnectionType.QueuedConnection
+        signals.progress_updated.connect(self.on_progress_updated, queued)
+        signals.analysis_completed.connect(self.on_analysis_completed, queued)
+        signals.analysis_failed.connect(self.on_analysis_failed, queued)
         self.analysis_worker.start()
 
     def cancel_analysis(self):
@@ -359,12 +623,15 @@ class LargeFileAnalyzerTool(QWidget):
 
     def on_progress_updated(self, message: str, percentage: int):
         """Handle progress updates."""
-        self.progress_bar.setValue(percentage)
-        self.progress_bar.setFormat(f"{message} ({percentage}%)")
+        self._progress.update(message, percentage)
 
     def on_analysis_completed(self, analysis: LargeFileAnalysis):
         """Handle completed analysis."""
         self.current_analysis = analysis
+        analysis.recommendations = self.service.generate_detailed_recommendations(
+            analysis
+        )
+        self._sort_cache.clear()
         self.display_results()
         self.reset_ui_after_analysis()
 
@@ -384,49 +651,82 @@ class LargeFileAnalyzerTool(QWidget):
 
     def display_results(self):
         """Display analysis results."""
+        # Re-running the analysis on unchanged files yields the same results;
+        # keep the built widgets and only point the list at the new objects
+        signature = self._display_signature()
+        if (
+            signature is not None
+            and signature == self._last_display_signature
+            and self._files_model is not None
+        ):
+            self._files_model.set_files(self._sort_files(self.current_analysis.files))
+            return
+
         self.clear_results()
+        self._last_display_signature = signature
 
         if not self.current_analysis or not self.current_analysis.files:
             # No large files found
             no_results_label = QLabel("No large files found above the threshold!")
-            no_results_label.setStyleSheet(f"""
-            QLabel {{
-                color: {ModernTheme.SUCCESS.name()};
-                font-size: {Typography.FONT_LG};
-                font-weight: {Typography.WEIGHT_BOLD};
-                padding: {Spacing.XL}px;
-                text-align: center;
-                background: transparent;
-                border: none;
-            }}
-            """)
+            no_results_label.setStyleSheet(_NO_RESULTS_QSS)
             no_results_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             self.results_layout.addWidget(no_results_label)
         else:
-            # Show summary statistics
-            self.add_summary_stats()
+            # Build the summary statistics, recommendations and large file
+            # list one per event-loop tick so the window keeps repainting
+            self._display_steps = iter(
+                (
+                    self.add_summary_stats,
+                    self.add_recommendations,
+                    self.add_large_files_list,
+                )
+            )
+            self._run_display_step(self._display_steps)
+
+        self.results_area.setVisible(True)
+
+    def _display_signature(self) -> tuple | None:
+        """
+        Identify the displayed results by threshold, totals and recommendations.
+
+        Everything the summary and recommendation cards show is covered. The
+        list itself is always re-pointed at the new files in the current sort
+        order, so the sort option is left out and this stays
+        O(recommendations) rather than O(files).
+        """
+        analysis = self.current_analysis
+        if not analysis or not analysis.files:
+            return None
+        return (
+            self.threshold_spinbox.value(),
+            len(analysis.files),
+            analysis.total_size,
+            tuple(
+                (rec["title"], rec["description"]) for rec in analysis.recommendations
+            ),
+        )
 
-            # Show recommendations
-            self.add_recommendations()
+    def _run_display_step(self, steps):
+        """Run the next display step, then schedule the one after it."""
+        # A newer display_results (or clear_results) supersedes these steps
+        if steps is not self._display_steps:
+            return
 
-            # Show large files
-            self.add_large_files_list()
+        step = next(steps, None)
+        if step is None:
+            self._display_steps = None
+            return
 
-        self.results_area.setVisible(True)
+        step()
+        QTimer.singleShot(0, partial(self._run_display_step, steps))
 
     def add_summary_stats(self):
         """Add summary statistics card."""
         if not self.current_analysis:
             return
 
-        from src.utils.file_utils import format_size
-
-        total_size = sum(f.size for f in self.current_analysis.files)
-        avg_size = (
-            total_size // len(self.current_analysis.files)
-            if self.current_analysis.files
-            else 0
-        )
+        total_size = self.current_analysis.total_size
+        avg_size = self.current_analysis.get_average_size()
 
         summary_card = CardWidget()
         summary_layout = QHBoxLayout(summary_card)
@@ -445,6 +745,11 @@ class LargeFileAnalyzerTool(QWidget):
         summary_layout.addWidget(avg_size_stat)
         summary_layout.addWidget(threshold_stat)
 
+        self._files_stat = files_stat
+        self._total_size_stat = total_size_stat
+        self._avg_size_stat = avg_size_stat
+        self._summary_card = summary_card
+
         self.results_layout.addWidget(summary_card)
 
     def add_recommendations(self):
@@ -452,23 +757,44 @@ class LargeFileAnalyzerTool(QWidget):
         if not self.current_analysis:
             return
 
-        recommendations = self.service.generate_detailed_recommendations(
-            self.current_analysis
-        )
+        self._rec_card = self.create_recommendations_card()
+        if self._rec_card is not None:
+            self.results_layout.addWidget(self._rec_card)
 
-        if recommendations:
-            rec_card = TitleCard(
-                "Cleanup Recommendations", "Suggested actions to optimize disk space"
-            )
-            rec_content = QWidget()
-            rec_layout = QVBoxLayout(rec_content)
+    def create_recommendations_card(self) -> TitleCard | None:
+        """Create the recommendations card, or None if there are none."""
+        recommendations = self.current_analysis.recommendations
+        if not recommendations:
+            return None
 
-            for rec in recommendations[:5]:  # Top 5 recommendations
-                rec_widget = self.create_recommendation_widget(rec)
-                rec_layout.addWidget(rec_widget)
+        rec_card = TitleCard(
+            "Cleanup Recommendations", "Suggested actions to optimize disk space"
+        )
+        rec_content = QWidget()
+        rec_layout = QVBoxLayout(rec_content)
+
+        for rec in recommendations[:5]:  # Top 5 recommendations
+            rec_widget = self.create_recommendation_widget(rec)
+            rec_layout.addWidget(rec_widget)
+
+        rec_card.add_content_widget(rec_content)
+        return rec_card
+
+    def _replace_recommendations_card(self):
+        """Swap the displayed recommendations card for a current one."""
+        layout = self.results_layout
+        old_card = self._rec_card
+        if old_card is not None:
+            position = layout.indexOf(old_card)
+            layout.removeWidget(old_card)
+            old_card.deleteLater()
+        else:
+            # It goes straight after the summary card
+            position = layout.indexOf(self._summary_card) + 1
 
-            rec_card.add_content_widget(rec_content)
-            self.results_layout.addWidget(rec_card)
+        self._rec_card = self.create_recommendations_card()
+        if self._rec_card is not None:
+            layout.insertWidget(position, self._rec_card)
 
     def create_recommendation_widget(self, recommendation: dict) -> QWidget:
         """Create a widget for a single recommendation."""
@@ -476,60 +802,24 @@ class LargeFileAnalyzerTool(QWidget):
         layout = QHBoxLayout(widget)
 
         # Priority indicator
-        priority_colors = {
-            "high": ModernTheme.ERROR.name(),
-            "medium": ModernTheme.WARNING.name(),
-            "low": ModernTheme.SUCCESS.name(),
-        }
-
-        priority_label = QLabel(recommendation["priority"].upper())
-        priority_label.setStyleSheet(f"""
-        QLabel {{
-            background-color: {priority_colors.get(recommendation["priority"], ModernTheme.DARK_GRAY.name())};
-            color: {ModernTheme.WHITE.name()};
-            padding: 4px 8px;
-            border-radius: 4px;
-            font-size: {Typography.FONT_XS};
-            font-weight: {Typography.WEIGHT_BOLD};
-            max-width: 60px;
-        }}
-        """)
+        priority = recommendation["priority"]
+        priority_label = QLabel(priority.upper())
+        priority_label.setStyleSheet(
+            self._PRIORITY_QSS.get(priority, self._DEFAULT_PRIORITY_QSS)
+        )
         priority_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         # Recommendation content
         content_layout = QVBoxLayout()
 
         title_label = QLabel(recommendation["title"])
-        title_label.setStyleSheet(f"""
-        QLabel {{
-            font-weight: {Typography.WEIGHT_BOLD};
-            font-size: {Typography.FONT_MD};
-            color: {ModernTheme.VERY_DARK_GRAY.name()};
-            background: transparent;
-            border: none;
-        }}
-        """)
+        title_label.setStyleSheet(_REC_TITLE_QSS)
 
         desc_label = QLabel(recommendation["description"])
-        desc_label.setStyleSheet(f"""
-        QLabel {{
-            color: {ModernTheme.DARK_GRAY.name()};
-            font-size: {Typography.FONT_SM};
-            background: transparent;
-            border: none;
-        }}
-        """)
+        desc_label.setStyleSheet(_REC_DESC_QSS)
 
         action_label = QLabel(f"Action: {recommendation['action']}")
-        action_label.setStyleSheet(f"""
-        QLabel {{
-            color: {ModernTheme.DARK_GRAY.name()};
-            font-size: {Typography.FONT_SM};
-            font-style: italic;
-            background: transparent;
-            border: none;
-        }}
-        """)
+        action_label.setStyleSheet(_REC_ACTION_QSS)
 
         content_layout.addWidget(title_label)
         content_layout.addWidget(desc_label)
@@ -551,49 +841,90 @@ class LargeFileAnalyzerTool(QWidget):
         files_content = QWidget()
         files_layout = QVBoxLayout(files_content)
 
-        # Sort files based on current selection
+        # Sort files based on current selection; rows are painted on demand,
+        # so every file is listed instead of only the top 50
         sorted_files = self._sort_files(self.current_analysis.files)
 
-        for i, file_info in enumerate(sorted_files[:50], 1):  # Show top 50
-            file_widget = LargeFileItemWidget(file_info, i)
-            file_widget.file_action_requested.connect(self.handle_file_action)
-            files_layout.addWidget(file_widget)
+        files_model = LargeFileListModel(files_content)
+        files_model.set_files(sorted_files)
 
-        if len(self.current_analysis.files) > 50:
-            more_label = QLabel(
-                f"... and {len(self.current_analysis.files) - 50} more files"
-            )
-            more_label.setStyleSheet(f"""
-            QLabel {{
-                color: {ModernTheme.DARK_GRAY.name()};
-                font-size: {Typography.FONT_SM};
-                font-style: italic;
-                padding: {Spacing.MD}px;
-                text-align: center;
-                background: transparent;
-                border: none;
-            }}
-            """)
-            more_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            files_layout.addWidget(more_label)
+        files_view = LargeFileListView()
+        files_view.setModel(files_model)
+        files_view.setToolTip("Double-click a file to open its location")
+        files_view.file_action_requested.connect(self.handle_file_action)
+
+        self._files_model = files_model
+        self._files_view = files_view
+        self._fit_files_view_height()
+
+        # Actions for the current row
+        actions_layout = QHBoxLayout()
+        actions_layout.setSpacing(Spacing.SM)
+
+        open_btn = ModernButton("Open Location", "secondary")
+        open_btn.clicked.connect(partial(files_view.request_action, "open_location"))
+
+        delete_btn = ModernButton("Delete", "danger")
+        delete_btn.clicked.connect(partial(files_view.request_action, "delete"))
+
+        actions_layout.addStretch()
+        actions_layout.addWidget(open_btn)
+        actions_layout.addWidget(delete_btn)
+
+        files_layout.addWidget(files_view)
+        files_layout.addLayout(actions_layout)
 
         files_card.add_content_widget(files_content)
         self.results_layout.addWidget(files_card)
 
+    def _fit_files_view_height(self):
+        """Show up to ten rows before the file list scrolls on its own."""
+        view = self._files_view
+        visible_rows = min(self._files_model.rowCount(), 10)
+        view.setFixedHeight(
+            visible_rows * LargeFileItemDelegate.ROW_HEIGHT + 2 * view.frameWidth()
+        )
+
+    def on_sort_changed(self, _sort_option: str):
+        """Re-order the listed files; orderings seen before come from the cache."""
+        if self._files_model is None or not self.current_analysis:
+            return
+        self._files_model.set_files(self._sort_files(self.current_analysis.files))
+
     def _sort_files(self, files: list[FileInfo]) -> list[FileInfo]:
         """Sort files based on current selection."""
         sort_option = self.sort_combo.currentText()
 
-        if sort_option == "Size (Largest First)":
-            return sorted(files, key=lambda f: f.size, reverse=True)
-        elif sort_option == "Size (Smallest First)":
-            return sorted(files, key=lambda f: f.size)
+        # Orderings of the current analysis' files are reused until it changes
+        analysis = self.current_analysis
+        if analysis is None or files is not analysis.files:
+            return self._sorted_by(files, sort_option)
+
+        sorted_files = self._sort_cache.get(sort_option)
+        if sorted_files is None:
+            sorted_files = self._sorted_by(files, sort_option)
+            self._sort_cache[sort_option] = sorted_files
+        return sorted_files
+
+    def _sorted_by(self, files: list[FileInfo], sort_option: str) -> list[FileInfo]:
+        """Return files ordered by the given sort option."""
+        if sort_option in ("Size (Largest First)", "Size (Smallest First)"):
+            # Use the analysis' precomputed size column when sorting its files
+            analysis = self.current_analysis
+            if analysis is not None and files is analysis.files:
+                order = analysis.get_size_order(
+                    descending=sort_option == "Size (Largest First)"
+                )
+                return [files[i] for i in order]
+            return sorted(
+                files, key=_KEY_SIZE, reverse=sort_option == "Size (Largest First)"
+            )
         elif sort_option == "Name":
             return sorted(files, key=lambda f: f.name.lower())
         elif sort_option == "Path":
             return sorted(files, key=lambda f: f.path.lower())
         elif sort_option == "Date Modified":
-            return sorted(files, key=lambda f: f.modified, reverse=True)
+            return sorted(files, key=_KEY_MODIFIED, reverse=True)
         elif sort_option == "File Type":
             return sorted(files, key=lambda f: f.file_type.lower())
         else:
@@ -610,11 +941,11 @@ class LargeFileAnalyzerTool(QWidget):
         """Open file location in system file manager."""
         try:
             if platform.system() == "Windows":
-                subprocess.run(["explorer", "/select,", file_path])
+                _launch_detached(["explorer", "/select,", file_path])
             elif platform.system() == "Darwin":  # macOS
-                subprocess.run(["open", "-R", file_path])
+                _launch_detached(["open", "-R", file_path])
             else:  # Linux and others
-                subprocess.run(["xdg-open", os.path.dirname(file_path)])
+                _launch_detached(["xdg-open", os.path.dirname(file_path)])
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Could not open file location: {e!s}")
 
@@ -629,19 +960,74 @@ class LargeFileAnalyzerTool(QWidget):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            try:
-                os.remove(file_path)
-                QMessageBox.information(self, "Success", "File deleted successfully.")
+            self._pending_delete_rows[file_path] = self._listed_index(file_path)
+
+            # Removing a huge file can take a while; do it off the UI thread
+            signals = FileDeleteSignals(self)
+            signals.finished.connect(self._after_delete)
+            signals.finished.connect(signals.deleteLater)
+            QThreadPool.globalInstance().start(FileDeleteRunnable(file_path, signals))
+
+    def _listed_index(self, file_path: str) -> QPersistentModelIndex:
+        """Get the file list's current row if it shows the given file."""
+        if self._files_view is not None:
+            index = self._files_view.currentIndex()
+            file_info = index.data(LargeFileListModel.FileInfoRole)
+            if file_info is not None and file_info.path == file_path:
+                return QPersistentModelIndex(index)
+        return QPersistentModelIndex()
+
+    def _after_delete(self, file_path: str, error: str):
+        """Report a finished deletion and drop the file from the results."""
+        listed = self._pending_delete_rows.pop(file_path, QPersistentModelIndex())
+
+        if error:
+            QMessageBox.critical(self, "Error", f"Failed to delete file: {error}")
+            return
+
+        QMessageBox.information(self, "Success", "File deleted successfully.")
+
+        # Refresh the analysis by removing the file from current results
+        if self.current_analysis:
+            self._remove_from_results(file_path, listed)
+
+    def _remove_from_results(self, file_path: str, listed: QPersistentModelIndex):
+        """Drop one deleted file from the analysis and the displayed results."""
+        # The listed row, while still valid, names the file without a search
+        file_info = listed.data(LargeFileListModel.FileInfoRole)
+        if file_info is None or file_info.path != file_path:
+            listed = QPersistentModelIndex()
+            file_info = next(
+                (f for f in self.current_analysis.files if f.path == file_path), None
+            )
+
+        analysis = self.current_analysis
+        if file_info is None or not analysis.remove_file(file_info):
+            return
+        self._sort_cache.clear()
+
+        # Recommendations count and size the files, so they change with them
+        recommendations = analysis.recommendations
+        analysis.recommendations = self.service.generate_detailed_recommendations(
+            analysis
+        )
+
+        if not analysis.files or self._files_model is None:
+            self.display_results()
+            return
 
-                # Refresh the analysis by removing the file from current results
-                if self.current_analysis:
-                    self.current_analysis.files = [
-                        f for f in self.current_analysis.files if f.path != file_path
-                    ]
-                    self.display_results()
+        # Remove just that row and refresh every card derived from the
+        # files in place, leaving what a full redisplay would show
+        row = listed.row() if listed.isValid() else -1
+        self._files_model.remove_file(file_info, row)
+        self._fit_files_view_height()
 
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to delete file: {e!s}")
+        self._files_stat.update_value(str(len(analysis.files)))
+        self._total_size_stat.update_value(format_size(analysis.total_size))
+        self._avg_size_stat.update_value(format_size(analysis.get_average_size()))
+        if analysis.recommendations != recommendations:
+            self._replace_recommendations_card()
+        self._last_display_signature = self._display_signature()
 
     def export_results(self):
         """Export analysis results to file."""
@@ -661,12 +1047,14 @@ class LargeFileAnalyzerTool(QWidget):
 
         try:
             format_type = "json" if selected_filter.startswith("JSON") else "csv"
-            export_data = self.service.export_analysis_results(
-                self.current_analysis, format_type
-            )
-
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(export_data)
+            # Stream straight to disk through a 1 MiB buffer instead of
+            # serializing the whole export into memory first
+            with open(
+                file_path, "w", encoding="utf-8", newline="", buffering=1 << 20
+            ) as f:
+                self.service.export_analysis_results_stream(
+                    self.current_analysis, format_type, f
+                )
 
             QMessageBox.information(
                 self, "Export Successful", f"Analysis results exported to:\n{file_path}"
@@ -679,23 +1067,33 @@ class LargeFileAnalyzerTool(QWidget):
 
     def clear_results(self):
         """Clear the results area."""
-        while self.results_layout.count():
-            child = self.results_layout.takeAt(0)
-            if child.widget():
-                child.widget().setParent(None)
+        self.results_widget, self.results_layout = replace_results_container(
+            self.results_area
+        )
+        self._reset_result_refs()
+
+    def _reset_result_refs(self):
+        """Forget the widgets of results that are no longer displayed."""
+        self._display_steps = None
+        self._files_model = None
+        self._files_view = None
+        self._files_stat = None
+        self._total_size_stat = None
+        self._avg_size_stat = None
+        self._summary_card = None
+        self._rec_card = None
+        self._last_display_signature = None
 
     def get_analysis_summary(self) -> dict:
         """Get summary of current analysis."""
         if not self.current_analysis:
             return {}
 
-        total_size = sum(f.size for f in self.current_analysis.files)
+        total_size = self.current_analysis.total_size
 
         return {
             "large_files_count": len(self.current_analysis.files),
             "total_large_file_size": total_size,
             "threshold_mb": self.threshold_spinbox.value(),
-            "recommendations": len(
-                self.service.generate_detailed_recommendations(self.current_analysis)
-            ),
+            "recommendations": len(self.current_analysis.recommendations),
         }
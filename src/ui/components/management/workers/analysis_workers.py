@@ -1,44 +1,202 @@
 #!/usr/bin/env python3
 # File: src/ui/components/management/workers/analysis_workers.py
 
-from PyQt6.QtCore import QMutex, QThread, pyqtSignal
+import threading
+import time
+from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
 
 from ..models.management_data import FileAgeAnalysis, FileInfo, LargeFileAnalysis
 from ..services.duplicate_service import DuplicateDetectionService
 
 
-class DuplicateAnalysisWorker(QThread):
+def _large_file_indices(files: list[dict], size_threshold: int) -> list[int]:
     """
-    Background worker for duplicate file detection.
-    Runs in a separate thread to keep UI responsive during analysis.
+    Get indices of files at or above the size threshold, largest first.
+
+    Works on a column of sizes so no FileInfo is built for files that are
+    filtered out. Files of equal size keep their scan order.
     """
+    if NUMPY_AVAILABLE:
+        sizes = np.fromiter(
+            (file_dict["size"] for file_dict in files), dtype=np.int64, count=len(files)
+        )
+        selected = np.flatnonzero(sizes >= size_threshold)
+        if selected.size == 0:
+            return []
+
+        # The gathered keys are a fresh array; negate them in place so the
+        # stable ascending sort puts the largest first without another copy
+        keys = sizes[selected]
+        np.negative(keys, out=keys)
+        order = np.argsort(keys, kind="stable")
+        return selected[order].tolist()
+
+    selected = [
+        i for i, file_dict in enumerate(files) if file_dict["size"] >= size_threshold
+    ]
+    selected.sort(key=lambda i: files[i]["size"], reverse=True)
+    return selected
+
+
+class _ProgressThrottle:
+    """
+    Rate limiter for progress signals emitted from a worker's hot loop.
+
+    A report passes when its percentage changed and at least `interval`
+    seconds went by since the last one, so a run emits at most ~100
+    progress signals. Completion (100%) always passes.
+    """
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self._last_percentage = -1
+        self._last_ts = float("-inf")
+
+    def ready(self, percentage: int) -> bool:
+        """Return True if a report at this percentage should be emitted."""
+        if percentage < 100:
+            if percentage == self._last_percentage:
+                return False
+            now = time.monotonic()
+            if now - self._last_ts < self.interval:
+                return False
+        else:
+            now = time.monotonic()
+
+        self._last_percentage = percentage
+        self._last_ts = now
+        return True
+
+
+class AnalysisSignals(QObject):
+    """Signals for the single-analysis workers, which cannot emit them themselves."""
 
-    # Signals for communication with UI
     progress_updated = pyqtSignal(str, int)  # message, percentage
-    analysis_completed = pyqtSignal(list)  # duplicate_groups
+    progress_counts = pyqtSignal(int, int, int)  # processed, total, percentage
+    analysis_completed = pyqtSignal(object)  # analysis result
     analysis_failed = pyqtSignal(str)  # error_message
 
+
+class BatchAnalysisSignals(QObject):
+    """Signals for BatchAnalysisWorker."""
+
+    progress_updated = pyqtSignal(str, int)
+    duplicate_analysis_completed = pyqtSignal(list)
+    large_file_analysis_completed = pyqtSignal(object)
+    age_analysis_completed = pyqtSignal(object)
+    all_analysis_completed = pyqtSignal()
+    analysis_failed = pyqtSignal(str)
+
+
+class _AnalysisRunnable(QRunnable):
+    """
+    Base for analysis workers run on the shared QThreadPool.
+
+    Pooled threads are reused across runs instead of being created and
+    destroyed per analysis. The worker keeps the QThread-style start(),
+    cancel() and wait() API; subclasses implement _execute().
+
+    Inputs smaller than inline_file_limit cost less to process than to hand
+    to another thread, so they run on the caller's event loop instead.
+    """
+
+    # Subclasses with cheap per-file work raise this
+    inline_file_limit = 0
+
+    def __init__(self, signals: QObject):
+        super().__init__()
+        # The owning tool holds the reference, so Qt must not delete the
+        # runnable when run() returns
+        self.setAutoDelete(False)
+
+        self.signals = signals
+        self._cancel_event = threading.Event()
+        self._finished_event = threading.Event()
+        self._finished_event.set()
+
+    def start(self):
+        """Queue the analysis on the thread pool, or inline for small inputs."""
+        if len(self.files) < self.inline_file_limit:
+            # Still asynchronous for the caller; the finished event stays
+            # set, since wait() on the same thread could never see it set
+            QTimer.singleShot(0, self.run)
+            return
+
+        self._finished_event.clear()
+        QThreadPool.globalInstance().start(self)
+
+    def run(self):
+        """Entry point on the pool thread or, for small inputs, the event loop."""
+        try:
+            if not self._cancel_event.is_set():
+                self._execute()
+        finally:
+            self._finished_event.set()
+
+    @abstractmethod
+    def _execute(self):
+        """
+        Run the analysis; called from run() unless cancelled first.
+
+        Must be implemented by subclasses. QRunnable's metaclass can't be
+        combined with ABCMeta, so as in BaseChart the decorator documents
+        the contract and the base implementation does nothing.
+        """
+        pass
+
+    def cancel(self):
+        """Cancel the analysis operation."""
+        self._cancel_event.set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until the analysis has finished; True if it did."""
+        return self._finished_event.wait(timeout)
+
+
+class DuplicateAnalysisWorker(_AnalysisRunnable):
+    """
+    Background worker for duplicate file detection.
+    Runs on a pool thread to keep UI responsive during analysis.
+    """
+
     def __init__(
         self,
         files: list[dict],
         use_content_hash: bool = True,
         use_heuristics: bool = True,
     ):
-        super().__init__()
+        super().__init__(AnalysisSignals())
         self.files = files
         self.use_content_hash = use_content_hash
         self.use_heuristics = use_heuristics
-        self.service = DuplicateDetectionService()
-        self.is_cancelled = False
-        self.mutex = QMutex()
+        self.service = None
+        self._progress_throttle = _ProgressThrottle()
 
-    def run(self):
-        """Main thread execution method."""
+    def _execute(self):
+        """Run duplicate detection on the pool thread."""
         try:
+            if len(self.files) < 2:
+                # No duplicates are possible; skip the hashing pipeline
+                self.signals.analysis_completed.emit([])
+                return
+
             # Set up progress callback
+            self.service = DuplicateDetectionService()
             self.service.set_progress_callback(self._progress_callback)
+            self.service.set_cancel_event(self._cancel_event)
 
-            self.progress_updated.emit("Starting duplicate analysis...", 0)
+            self.signals.progress_updated.emit("Starting duplicate analysis...", 0)
 
             # Perform duplicate detection
             duplicate_groups = self.service.find_duplicates(
@@ -46,137 +204,102 @@ class DuplicateAnalysisWorker(QThread):
             )
 
             # Check if cancelled
-            self.mutex.lock()
-            cancelled = self.is_cancelled
-            self.mutex.unlock()
-
-            if not cancelled:
-                self.analysis_completed.emit(duplicate_groups)
+            if not self._cancel_event.is_set():
+                self.signals.analysis_completed.emit(duplicate_groups)
 
         except Exception as e:
-            self.analysis_failed.emit(f"Duplicate analysis failed: {e!s}")
+            self.signals.analysis_failed.emit(f"Duplicate analysis failed: {e!s}")
 
     def _progress_callback(self, message: str, percentage: int):
         """Callback for progress updates from the service."""
-        # Check if cancelled before emitting progress
-        self.mutex.lock()
-        cancelled = self.is_cancelled
-        self.mutex.unlock()
+        # The service reports every file; forward only a throttled subset
+        if not self._progress_throttle.ready(percentage):
+            return
 
-        if not cancelled:
-            self.progress_updated.emit(message, percentage)
-
-    def cancel(self):
-        """Cancel the analysis operation."""
-        self.mutex.lock()
-        self.is_cancelled = True
-        self.mutex.unlock()
+        # Check if cancelled before emitting progress
+        if not self._cancel_event.is_set():
+            self.signals.progress_updated.emit(message, percentage)
 
 
-class LargeFileAnalysisWorker(QThread):
+class LargeFileAnalysisWorker(_AnalysisRunnable):
     """
     Background worker for large file analysis.
     """
 
-    progress_updated = pyqtSignal(str, int)
-    analysis_completed = pyqtSignal(object)  # LargeFileAnalysis
-    analysis_failed = pyqtSignal(str)
+    inline_file_limit = 10_000
 
     def __init__(self, files: list[dict], size_threshold: int = 100 * 1024 * 1024):
-        super().__init__()
+        super().__init__(AnalysisSignals())
         self.files = files
         self.size_threshold = size_threshold
-        self.is_cancelled = False
-        self.mutex = QMutex()
 
-    def run(self):
+    def _execute(self):
         """Analyze large files."""
         try:
-            self.progress_updated.emit("Analyzing file sizes...", 0)
+            self.signals.progress_updated.emit("Analyzing file sizes...", 0)
 
-            # Convert to FileInfo objects
-            file_infos = []
-            total_files = len(self.files)
+            # Select and sort by size first (largest first), then convert only
+            # the files above the threshold to FileInfo objects
+            indices = _large_file_indices(self.files, self.size_threshold)
 
-            for i, file_dict in enumerate(self.files):
-                # Check if cancelled
-                self.mutex.lock()
-                cancelled = self.is_cancelled
-                self.mutex.unlock()
-
-                if cancelled:
-                    return
-
-                file_info = FileInfo(
-                    name=file_dict["name"],
-                    path=file_dict["path"],
-                    size=file_dict["size"],
-                    modified=file_dict["modified"],
-                    file_type=file_dict["type"],
-                )
+            # Check if cancelled
+            if self._cancel_event.is_set():
+                return
 
-                # Only include files above threshold
-                if file_info.size >= self.size_threshold:
-                    file_infos.append(file_info)
+            self.signals.progress_updated.emit(f"Found {len(indices)} large files", 50)
 
-                # Update progress
-                progress = int((i / total_files) * 100)
-                self.progress_updated.emit(
-                    f"Processed {i + 1}/{total_files} files", progress
+            file_infos = []
+            for i in indices:
+                file_dict = self.files[i]
+                file_infos.append(
+                    FileInfo(
+                        name=file_dict["name"],
+                        path=file_dict["path"],
+                        size=file_dict["size"],
+                        modified=file_dict["modified"],
+                        file_type=file_dict["type"],
+                    )
                 )
 
-            # Sort by size (largest first)
-            file_infos.sort(key=lambda f: f.size, reverse=True)
-
             # Create analysis result
             analysis = LargeFileAnalysis(
                 files=file_infos, size_threshold=self.size_threshold
             )
 
-            self.progress_updated.emit("Large file analysis complete", 100)
-            self.analysis_completed.emit(analysis)
+            self.signals.progress_updated.emit("Large file analysis complete", 100)
+            self.signals.analysis_completed.emit(analysis)
 
         except Exception as e:
-            self.analysis_failed.emit(f"Large file analysis failed: {e!s}")
-
-    def cancel(self):
-        """Cancel the analysis."""
-        self.mutex.lock()
-        self.is_cancelled = True
-        self.mutex.unlock()
+            self.signals.analysis_failed.emit(f"Large file analysis failed: {e!s}")
 
 
-class FileAgeAnalysisWorker(QThread):
+class FileAgeAnalysisWorker(_AnalysisRunnable):
     """
     Background worker for file age analysis.
     """
 
-    progress_updated = pyqtSignal(str, int)
-    analysis_completed = pyqtSignal(object)  # FileAgeAnalysis
-    analysis_failed = pyqtSignal(str)
+    inline_file_limit = 10_000
 
     def __init__(self, files: list[dict]):
-        super().__init__()
+        super().__init__(AnalysisSignals())
         self.files = files
-        self.is_cancelled = False
-        self.mutex = QMutex()
 
-    def run(self):
+    def _execute(self):
         """Analyze file ages."""
         try:
-            self.progress_updated.emit("Analyzing file ages...", 0)
+            self.signals.progress_updated.emit("Analyzing file ages...", 0)
 
             # Convert to FileInfo objects
             file_infos = []
             total_files = len(self.files)
 
+            # Report progress about once per percent, rate-limited
+            progress_step = max(1, total_files // 100)
+            throttle = _ProgressThrottle()
+
             for i, file_dict in enumerate(self.files):
                 # Check if cancelled
-                self.mutex.lock()
-                cancelled = self.is_cancelled
-                self.mutex.unlock()
-
-                if cancelled:
+                if self._cancel_event.is_set():
                     return
 
                 file_info = FileInfo(
@@ -189,38 +312,30 @@ class FileAgeAnalysisWorker(QThread):
                 file_infos.append(file_info)
 
                 # Update progress
-                progress = int((i / total_files) * 100)
-                self.progress_updated.emit(
-                    f"Processed {i + 1}/{total_files} files", progress
-                )
+                if i % progress_step == 0:
+                    progress = int((i / total_files) * 100)
+                    if throttle.ready(progress):
+                        # Raw counts; the UI formats them only if shown
+                        self.signals.progress_counts.emit(i + 1, total_files, progress)
 
             # Create analysis result
             analysis = FileAgeAnalysis(files=file_infos)
 
-            self.progress_updated.emit("File age analysis complete", 100)
-            self.analysis_completed.emit(analysis)
+            self.signals.progress_updated.emit("File age analysis complete", 100)
+            self.signals.analysis_completed.emit(analysis)
 
         except Exception as e:
-            self.analysis_failed.emit(f"File age analysis failed: {e!s}")
-
-    def cancel(self):
-        """Cancel the analysis."""
-        self.mutex.lock()
-        self.is_cancelled = True
-        self.mutex.unlock()
+            self.signals.analysis_failed.emit(f"File age analysis failed: {e!s}")
 
 
-class BatchAnalysisWorker(QThread):
-    """
-    Worker that runs all analysis types in sequence.
+class BatchAnalysisWorker(_AnalysisRunnable):
     """
+    Worker that runs all enabled analysis types side by side.
 
-    progress_updated = pyqtSignal(str, int)
-    duplicate_analysis_completed = pyqtSignal(list)
-    large_file_analysis_completed = pyqtSignal(object)
-    age_analysis_completed = pyqtSignal(object)
-    all_analysis_completed = pyqtSignal()
-    analysis_failed = pyqtSignal(str)
+    The analyses only read the scanned files, so each runs on its own
+    executor thread and reports as soon as it finishes; wall-clock time is
+    bounded by the slowest analysis rather than their sum.
+    """
 
     def __init__(
         self,
@@ -230,77 +345,87 @@ class BatchAnalysisWorker(QThread):
         run_age_analysis: bool = True,
         size_threshold: int = 100 * 1024 * 1024,
     ):
-        super().__init__()
+        super().__init__(BatchAnalysisSignals())
         self.files = files
         self.run_duplicates = run_duplicates
         self.run_large_files = run_large_files
         self.run_age_analysis = run_age_analysis
         self.size_threshold = size_threshold
-        self.is_cancelled = False
-        self.mutex = QMutex()
+        self._progress_lock = threading.Lock()
+        self._progress_throttle = _ProgressThrottle()
+        self._track_progress: dict[str, int] = {}
 
-    def run(self):
-        """Run all enabled analyses in sequence."""
+    def _execute(self):
+        """Run all enabled analyses concurrently."""
         try:
-            total_steps = sum(
-                [self.run_duplicates, self.run_large_files, self.run_age_analysis]
-            )
-            current_step = 0
-
-            # Duplicate analysis
-            if self.run_duplicates and not self._is_cancelled():
-                self.progress_updated.emit(
-                    "Running duplicate analysis...",
-                    int((current_step / total_steps) * 100),
+            tracks = []
+            if self.run_duplicates:
+                tracks.append(
+                    (
+                        "duplicates",
+                        self._run_duplicates,
+                        self.signals.duplicate_analysis_completed,
+                    )
                 )
-
-                service = DuplicateDetectionService()
-                service.set_progress_callback(self._duplicate_progress_callback)
-                duplicate_groups = service.find_duplicates(self.files)
-
-                if not self._is_cancelled():
-                    self.duplicate_analysis_completed.emit(duplicate_groups)
-                    current_step += 1
-
-            # Large file analysis
-            if self.run_large_files and not self._is_cancelled():
-                self.progress_updated.emit(
-                    "Running large file analysis...",
-                    int((current_step / total_steps) * 100),
+            if self.run_large_files:
+                tracks.append(
+                    (
+                        "large_files",
+                        self._run_large,
+                        self.signals.large_file_analysis_completed,
+                    )
                 )
-
-                file_infos = [self._dict_to_fileinfo(f) for f in self.files]
-                large_files = [f for f in file_infos if f.size >= self.size_threshold]
-                large_files.sort(key=lambda f: f.size, reverse=True)
-
-                analysis = LargeFileAnalysis(
-                    files=large_files, size_threshold=self.size_threshold
+            if self.run_age_analysis:
+                tracks.append(
+                    ("age", self._run_age, self.signals.age_analysis_completed)
                 )
 
-                if not self._is_cancelled():
-                    self.large_file_analysis_completed.emit(analysis)
-                    current_step += 1
+            self._track_progress = {name: 0 for name, _, _ in tracks}
+            self.signals.progress_updated.emit("Running analyses...", 0)
 
-            # Age analysis
-            if self.run_age_analysis and not self._is_cancelled():
-                self.progress_updated.emit(
-                    "Running file age analysis...",
-                    int((current_step / total_steps) * 100),
-                )
-
-                file_infos = [self._dict_to_fileinfo(f) for f in self.files]
-                analysis = FileAgeAnalysis(files=file_infos)
+            with ThreadPoolExecutor(max_workers=max(1, len(tracks))) as executor:
+                futures = {
+                    executor.submit(run_track): (name, completed)
+                    for name, run_track, completed in tracks
+                }
+                for future in as_completed(futures):
+                    name, completed = futures[future]
+                    result = future.result()
 
-                if not self._is_cancelled():
-                    self.age_analysis_completed.emit(analysis)
-                    current_step += 1
+                    if self._is_cancelled():
+                        continue
+                    completed.emit(result)
+                    self._track_progress_update(name, "Finished", 100)
 
             if not self._is_cancelled():
-                self.progress_updated.emit("All analyses complete", 100)
-                self.all_analysis_completed.emit()
+                self.signals.progress_updated.emit("All analyses complete", 100)
+                self.signals.all_analysis_completed.emit()
 
         except Exception as e:
-            self.analysis_failed.emit(f"Batch analysis failed: {e!s}")
+            self.signals.analysis_failed.emit(f"Batch analysis failed: {e!s}")
+
+    def _run_duplicates(self) -> list:
+        """Find duplicate groups; runs on an executor thread."""
+        if len(self.files) < 2:
+            return []
+
+        service = DuplicateDetectionService()
+        service.set_progress_callback(self._duplicate_progress_callback)
+        service.set_cancel_event(self._cancel_event)
+        return service.find_duplicates(self.files)
+
+    def _run_large(self) -> LargeFileAnalysis:
+        """Select the large files; runs on an executor thread."""
+        # Only the selected files are converted, so the age track converting
+        # every file concurrently costs no extra work here
+        indices = _large_file_indices(self.files, self.size_threshold)
+        large_files = [self._dict_to_fileinfo(self.files[i]) for i in indices]
+        return LargeFileAnalysis(files=large_files, size_threshold=self.size_threshold)
+
+    def _run_age(self) -> FileAgeAnalysis:
+        """Bucket every file by age; runs on an executor thread."""
+        file_infos = [self._dict_to_fileinfo(f) for f in self.files]
+        return FileAgeAnalysis(files=file_infos)
 
     def _dict_to_fileinfo(self, file_dict: dict) -> FileInfo:
         """Convert file dictionary to FileInfo object."""
@@ -314,22 +439,24 @@ class BatchAnalysisWorker(QThread):
 
     def _duplicate_progress_callback(self, message: str, percentage: int):
         """Progress callback for duplicate analysis."""
+        self._track_progress_update("duplicates", f"Duplicates: {message}", percentage)
+
+    def _track_progress_update(self, track: str, message: str, percentage: int):
+        """
+        Record one track's progress and emit the mean over all tracks.
+
+        Called from several threads, so the bookkeeping and the shared
+        throttle are guarded by a lock.
+        """
+        with self._progress_lock:
+            self._track_progress[track] = percentage
+            overall = sum(self._track_progress.values()) // len(self._track_progress)
+            if not self._progress_throttle.ready(overall):
+                return
+
         if not self._is_cancelled():
-            # Scale progress for the duplicate analysis portion
-            scaled_progress = int(
-                percentage * 0.33
-            )  # Assuming duplicates is 1/3 of total work
-            self.progress_updated.emit(f"Duplicates: {message}", scaled_progress)
+            self.signals.progress_updated.emit(message, overall)
 
     def _is_cancelled(self) -> bool:
         """Check if the operation has been cancelled."""
-        self.mutex.lock()
-        cancelled = self.is_cancelled
-        self.mutex.unlock()
-        return cancelled
-
-    def cancel(self):
-        """Cancel all analyses."""
-        self.mutex.lock()
-        self.is_cancelled = True
-        self.mutex.unlock()
+        return self._cancel_event.is_set()
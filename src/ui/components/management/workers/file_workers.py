@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+# File: src/ui/components/management/workers/file_workers.py
+
+import os
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+
+class FileDeleteSignals(QObject):
+    """Signals for FileDeleteRunnable, which cannot emit them itself."""
+
+    finished = pyqtSignal(str, str)  # file_path, error message ("" on success)
+
+
+class FileDeleteRunnable(QRunnable):
+    """
+    Deletes a single file on a QThreadPool thread.
+    Several runnables may share one FileDeleteSignals object.
+    """
+
+    def __init__(self, file_path: str, signals: FileDeleteSignals):
+        super().__init__()
+
+        self.file_path = file_path
+        self.signals = signals
+
+    def run(self):
+        """Remove the file and report the outcome."""
+        try:
+            os.remove(self.file_path)
+        except Exception as e:
+            self.signals.finished.emit(self.file_path, str(e))
+            return
+
+        self.signals.finished.emit(self.file_path, "")
@@ -2,11 +2,94 @@
 # File: src/ui/components/modern_button.py
 
 from PyQt6.QtGui import QColor
-from PyQt6.QtWidgets import QGraphicsDropShadowEffect, QPushButton
+from PyQt6.QtWidgets import QPushButton
 
 from ..themes.styles import BorderRadius, ModernTheme, Spacing, Typography
 
 
+_BUTTON_STYLES = {
+    "primary": {
+        "normal": ModernTheme.PRIMARY,
+        "hover": ModernTheme.PRIMARY_DARK,
+        "text": ModernTheme.WHITE,
+    },
+    "secondary": {
+        "normal": ModernTheme.LIGHT_GRAY,
+        "hover": ModernTheme.MEDIUM_GRAY,
+        "text": ModernTheme.VERY_DARK_GRAY,
+    },
+    "danger": {
+        "normal": ModernTheme.ERROR,
+        "hover": QColor("#c0392b"),  # Darker red
+        "text": ModernTheme.WHITE,
+    },
+    "success": {
+        "normal": ModernTheme.SUCCESS,
+        "hover": QColor("#27ae60"),  # Darker green
+        "text": ModernTheme.WHITE,
+    },
+}
+
+
+# "#rrggbb" names of every color a button stylesheet uses, per button type
+_BUTTON_COLOR_NAMES = {
+    button_type: {
+        **{role: color.name() for role, color in style.items()},
+        "disabled_bg": ModernTheme.MEDIUM_GRAY.name(),
+        "disabled_text": ModernTheme.DARK_GRAY.name(),
+    }
+    for button_type, style in _BUTTON_STYLES.items()
+}
+
+
+def _button_stylesheet(button_type: str, border_radius: str = BorderRadius.SM) -> str:
+    """
+    Build the ModernButton stylesheet for one button type.
+
+    Depth comes from a static darker bottom border rather than a
+    QGraphicsDropShadowEffect, which would render the button through an
+    offscreen image on every paint.
+    """
+    colors = _BUTTON_COLOR_NAMES[button_type]
+    return f"""
+        ModernButton {{
+            background-color: {colors["normal"]};
+            color: {colors["text"]};
+            border: none;
+            border-bottom: 2px solid rgba(0, 0, 0, 40);
+            border-radius: {border_radius};
+            padding: {Spacing.SM}px {Spacing.MD}px;
+            font-weight: {Typography.WEIGHT_MEDIUM};
+            font-size: {Typography.FONT_MD};
+            font-family: {Typography.MAIN_FONT};
+        }}
+
+        ModernButton:hover {{
+            background-color: {colors["hover"]};
+        }}
+
+        ModernButton:pressed {{
+            background-color: {colors["hover"]};
+            padding-top: {Spacing.SM + 1}px;
+            padding-bottom: {Spacing.SM - 1}px;
+        }}
+
+        ModernButton:disabled {{
+            background-color: {colors["disabled_bg"]};
+            color: {colors["disabled_text"]};
+        }}
+        """
+
+
+# Button styles never change at runtime, so each stylesheet is built once
+_STYLESHEET_CACHE = {
+    button_type: _button_stylesheet(button_type) for button_type in _BUTTON_STYLES
+}
+
+# PillButton stylesheets, rendered on first use per (button type, radius)
+_PILL_STYLESHEET_CACHE: dict[tuple[str, int], str] = {}
+
+
 class ModernButton(QPushButton):
     """
     A modern-styled button with hover effects, animations, and consistent theming.
@@ -33,77 +116,16 @@ class ModernButton(QPushButton):
         # Apply style based on button type
         self.apply_button_style()
 
-        # Add subtle shadow effect
-        self.add_shadow_effect()
-
     def apply_button_style(self):
         """Apply styling based on button type."""
-        styles = {
-            "primary": {
-                "normal": ModernTheme.PRIMARY,
-                "hover": ModernTheme.PRIMARY_DARK,
-                "text": ModernTheme.WHITE,
-            },
-            "secondary": {
-                "normal": ModernTheme.LIGHT_GRAY,
-                "hover": ModernTheme.MEDIUM_GRAY,
-                "text": ModernTheme.VERY_DARK_GRAY,
-            },
-            "danger": {
-                "normal": ModernTheme.ERROR,
-                "hover": QColor("#c0392b"),  # Darker red
-                "text": ModernTheme.WHITE,
-            },
-            "success": {
-                "normal": ModernTheme.SUCCESS,
-                "hover": QColor("#27ae60"),  # Darker green
-                "text": ModernTheme.WHITE,
-            },
-        }
-
-        style = styles.get(self.button_type, styles["primary"])
+        style = _BUTTON_STYLES.get(self.button_type, _BUTTON_STYLES["primary"])
         self._normal_color = style["normal"]
         self._hover_color = style["hover"]
 
-        # Apply the stylesheet
-        stylesheet = f"""
-        ModernButton {{
-            background-color: {style["normal"].name()};
-            color: {style["text"].name()};
-            border: none;
-            border-radius: {BorderRadius.SM};
-            padding: {Spacing.SM}px {Spacing.MD}px;
-            font-weight: {Typography.WEIGHT_MEDIUM};
-            font-size: {Typography.FONT_MD};
-            font-family: {Typography.MAIN_FONT};
-        }}
-
-        ModernButton:hover {{
-            background-color: {style["hover"].name()};
-        }}
-
-        ModernButton:pressed {{
-            background-color: {style["hover"].name()};
-            padding-top: {Spacing.SM + 1}px;
-            padding-bottom: {Spacing.SM - 1}px;
-        }}
-
-        ModernButton:disabled {{
-            background-color: {ModernTheme.MEDIUM_GRAY.name()};
-            color: {ModernTheme.DARK_GRAY.name()};
-        }}
-        """
-
-        self.setStyleSheet(stylesheet)
-
-    def add_shadow_effect(self):
-        """Add a subtle drop shadow effect for depth."""
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(4)
-        shadow.setXOffset(0)
-        shadow.setYOffset(2)
-        shadow.setColor(QColor(0, 0, 0, 50))  # Semi-transparent black
-        self.setGraphicsEffect(shadow)
+        # Stylesheets are built once per type at import time
+        self.setStyleSheet(
+            _STYLESHEET_CACHE.get(self.button_type, _STYLESHEET_CACHE["primary"])
+        )
 
     def setup_animations(self):
         """Setup hover animations (placeholder for future enhancement)."""
@@ -181,20 +203,35 @@ class PillButton(ModernButton):
     Good for toggle buttons or special actions.
     """
 
-    def setup_button(self):
-        """Override to use pill-shaped styling."""
-        super().setup_button()
-
-        # Override border radius to be fully rounded
-        current_style = self.styleSheet()
-        pill_style = current_style.replace(
-            f"border-radius: {BorderRadius.SM}",
-            f"border-radius: {self.height() // 2}px",
-        )
-        self.setStyleSheet(pill_style)
+    def apply_button_style(self):
+        """Apply the type's styling with a fully rounded border radius."""
+        style = _BUTTON_STYLES.get(self.button_type, _BUTTON_STYLES["primary"])
+        self._normal_color = style["normal"]
+        self._hover_color = style["hover"]
+
+        self._last_radius = None
+        self._apply_with_radius(self.height() // 2)
+
+    def _apply_with_radius(self, radius: int):
+        """Set the stylesheet for this radius unless it is already applied."""
+        if radius == self._last_radius:
+            return
+        self._last_radius = radius
+
+        button_type = self.button_type
+        if button_type not in _BUTTON_STYLES:
+            button_type = "primary"
+
+        key = (button_type, radius)
+        stylesheet = _PILL_STYLESHEET_CACHE.get(key)
+        if stylesheet is None:
+            stylesheet = _button_stylesheet(button_type, f"{radius}px")
+            _PILL_STYLESHEET_CACHE[key] = stylesheet
+
+        self.setStyleSheet(stylesheet)
 
     def resizeEvent(self, event):
         """Update border radius when button is resized."""
         super().resizeEvent(event)
-        # Update the pill shape when size changes
-        self.setup_button()
+        # Heights that round to the same radius leave the stylesheet alone
+        self._apply_with_radius(self.height() // 2)
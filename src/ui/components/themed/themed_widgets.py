@@ -5,9 +5,10 @@ This module provides theme-aware widget components that automatically
 follow the design system and update when themes change.
 """
 
+import weakref
 
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QColor, QFont
+from PyQt6.QtGui import QColor, QPixmap
 from PyQt6.QtWidgets import (
     QFrame,
     QHBoxLayout,
@@ -21,6 +22,36 @@ from PyQt6.QtWidgets import (
 from ...themes.design_system import IconSystem, Spacing
 from ...themes.theme_provider import theme_provider
 
+# Themed widgets register here instead of each connecting to theme_changed,
+# so a theme switch is one slot call that walks the live widgets
+_themed_registry: "weakref.WeakSet[QWidget]" = weakref.WeakSet()
+_icon_registry: "weakref.WeakSet[ThemedIcon]" = weakref.WeakSet()
+
+# Rendered icon pixmaps keyed by (icon name, size, color name), shared by
+# every ThemedIcon so a re-theme only renders each distinct icon once
+_ICON_PIXMAP_CACHE: dict[tuple[str, int, str], QPixmap] = {}
+
+
+def _on_theme_changed(theme_name: str):
+    """Repolish every registered widget and redraw every themed icon"""
+    for widget in list(_themed_registry):
+        try:
+            style = widget.style()
+            style.unpolish(widget)
+            style.polish(widget)
+        except RuntimeError:
+            # The underlying C++ widget is already gone
+            _themed_registry.discard(widget)
+
+    for icon in list(_icon_registry):
+        try:
+            icon._update_icon()
+        except RuntimeError:
+            _icon_registry.discard(icon)
+
+
+theme_provider.theme_changed.connect(_on_theme_changed)
+
 
 class ThemedButton(QPushButton):
     """Theme-aware button component"""
@@ -30,36 +61,32 @@ class ThemedButton(QPushButton):
         self.variant = variant
         self.setProperty("class", variant)
         self._setup_button()
-        theme_provider.theme_changed.connect(self._on_theme_changed)
+        _themed_registry.add(self)
 
     def _setup_button(self):
         """Setup button styling"""
         self.setCursor(Qt.CursorShape.PointingHandCursor)
 
-    def _on_theme_changed(self, theme_name: str):
-        """Handle theme changes"""
-        self.style().unpolish(self)
-        self.style().polish(self)
-
 
 class ThemedLabel(QLabel):
     """Theme-aware label component"""
 
+    # Word wrap makes every resize lay the text out again, so only the
+    # running-text variants wrap; titles and headings stay single-line
+    _WRAPPED_VARIANTS = frozenset({"body", "caption"})
+
     def __init__(self, text: str = "", variant: str = "body", parent=None):
+        """Create a label; only "body" and "caption" variants word-wrap"""
         super().__init__(text, parent)
         self.variant = variant
         self.setProperty("class", variant)
         self._setup_label()
-        theme_provider.theme_changed.connect(self._on_theme_changed)
+        _themed_registry.add(self)
 
     def _setup_label(self):
         """Setup label styling"""
-        self.setWordWrap(True)
-
-    def _on_theme_changed(self, theme_name: str):
-        """Handle theme changes"""
-        self.style().unpolish(self)
-        self.style().polish(self)
+        if self.variant in self._WRAPPED_VARIANTS:
+            self.setWordWrap(True)
 
 
 class ThemedCard(QFrame):
@@ -70,17 +97,12 @@ class ThemedCard(QFrame):
         self.variant = variant
         self.setProperty("class", variant)
         self._setup_card()
-        theme_provider.theme_changed.connect(self._on_theme_changed)
+        _themed_registry.add(self)
 
     def _setup_card(self):
         """Setup card styling"""
         self.setFrameStyle(QFrame.Shape.NoFrame)
 
-    def _on_theme_changed(self, theme_name: str):
-        """Handle theme changes"""
-        self.style().unpolish(self)
-        self.style().polish(self)
-
 
 class ThemedInput(QLineEdit):
     """Theme-aware input component"""
@@ -90,17 +112,12 @@ class ThemedInput(QLineEdit):
         if placeholder:
             self.setPlaceholderText(placeholder)
         self._setup_input()
-        theme_provider.theme_changed.connect(self._on_theme_changed)
+        _themed_registry.add(self)
 
     def _setup_input(self):
         """Setup input styling"""
         pass
 
-    def _on_theme_changed(self, theme_name: str):
-        """Handle theme changes"""
-        self.style().unpolish(self)
-        self.style().polish(self)
-
 
 class ThemedIcon(QLabel):
     """Theme-aware icon component"""
@@ -110,7 +127,7 @@ class ThemedIcon(QLabel):
         self.icon_name = icon_name
         self.icon_size = size
         self._setup_icon()
-        theme_provider.theme_changed.connect(self._on_theme_changed)
+        _icon_registry.add(self)
 
     def _setup_icon(self):
         """Setup icon styling"""
@@ -120,18 +137,22 @@ class ThemedIcon(QLabel):
 
     def _update_icon(self):
         """Update icon based on current theme"""
-        from ...themes.icon_manager import icon_manager
-        
-        # Use the new icon manager for proper SVG icons
-        icon = icon_manager.get_icon(self.icon_name, self.icon_size)
-        pixmap = icon.pixmap(self.icon_size, self.icon_size)
+        color = theme_provider.current_palette.text_primary
+        key = (self.icon_name, self.icon_size, color.name())
+
+        pixmap = _ICON_PIXMAP_CACHE.get(key)
+        if pixmap is None:
+            from ...themes.icon_manager import icon_manager
+
+            # Pass the color explicitly so the icon manager's cache is keyed
+            # by theme as well, whatever order the theme slots run in
+            icon = icon_manager.get_icon(self.icon_name, self.icon_size, color)
+            pixmap = icon.pixmap(self.icon_size, self.icon_size)
+            _ICON_PIXMAP_CACHE[key] = pixmap
+
         self.setPixmap(pixmap)
         self.setText("")  # Clear any text since we're using pixmap
 
-    def _on_theme_changed(self, theme_name: str):
-        """Handle theme changes"""
-        self._update_icon()
-
 
 class ThemedContainer(QFrame):
     """Theme-aware container component"""
@@ -140,7 +161,7 @@ class ThemedContainer(QFrame):
         super().__init__(parent)
         self.layout_type = layout_type
         self._setup_container()
-        theme_provider.theme_changed.connect(self._on_theme_changed)
+        _themed_registry.add(self)
 
     def _setup_container(self):
         """Setup container layout"""
@@ -153,11 +174,6 @@ class ThemedContainer(QFrame):
         layout.setSpacing(Spacing.MD)
         self.setLayout(layout)
 
-    def _on_theme_changed(self, theme_name: str):
-        """Handle theme changes"""
-        self.style().unpolish(self)
-        self.style().polish(self)
-
 
 class ThemedChart(QFrame):
     """Theme-aware chart container"""
@@ -167,7 +183,7 @@ class ThemedChart(QFrame):
         self.chart_title = title
         self.setProperty("class", "chart-container")
         self._setup_chart()
-        theme_provider.theme_changed.connect(self._on_theme_changed)
+        _themed_registry.add(self)
 
     def _setup_chart(self):
         """Setup chart container"""
@@ -203,11 +219,6 @@ class ThemedChart(QFrame):
         """Get chart text color"""
         return theme_provider.current_palette.chart_legend
 
-    def _on_theme_changed(self, theme_name: str):
-        """Handle theme changes"""
-        self.style().unpolish(self)
-        self.style().polish(self)
-
 
 class ThemedStatsCard(ThemedCard):
     """Enhanced stats card with theme awareness"""
@@ -234,6 +245,7 @@ class ThemedStatsCard(ThemedCard):
         value_label.setObjectName("stats_value")
         value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(value_label)
+        self._value_label = value_label
 
         # Title
         title_label = QLabel(self.card_title)
@@ -251,9 +263,7 @@ class ThemedStatsCard(ThemedCard):
     def update_value(self, new_value: str):
         """Update the card value"""
         self.card_value = new_value
-        value_label = self.findChild(QLabel)
-        if value_label and value_label.objectName() == "stats_value":
-            value_label.setText(new_value)
+        self._value_label.setText(new_value)
 
 
 class ThemedTitle(ThemedLabel):
@@ -2,57 +2,174 @@
 # File: src/ui/components/visualization/charts/bar_chart.py
 
 
-from PyQt6.QtGui import QColor, QPainter, QPen
-from PyQt6.QtWidgets import QHBoxLayout, QLabel, QVBoxLayout, QWidget
+from PyQt6.QtCore import QRect, QSize, Qt
+from PyQt6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPen, QPixmap
+from PyQt6.QtWidgets import QVBoxLayout, QWidget
+
+from src.utils.logger import logger
 
 from ....themes.styles import ModernTheme, Spacing, Typography
 from ..models.chart_data import ChartMetadata, FileAgeData, FileDistributionData
 from .base_chart import BaseChart
 
-
-class BarWidget(QWidget):
-    """Custom widget for drawing individual bars."""
-
-    def __init__(self, value: float, max_value: float, label: str, color: str | None = None):
+_BAR_PALETTE = (
+    ModernTheme.SUCCESS,
+    ModernTheme.PRIMARY,
+    ModernTheme.WARNING,
+    ModernTheme.ERROR,
+    ModernTheme.DARK_GRAY,
+)
+
+_AGE_PALETTE = (
+    ModernTheme.SUCCESS,  # Today - green
+    ModernTheme.PRIMARY,  # This week - blue
+    ModernTheme.INFO,  # This month - blue
+    ModernTheme.WARNING,  # 3 months - yellow
+    ModernTheme.ERROR,  # This year - red
+    ModernTheme.DARK_GRAY,  # Older - gray
+)
+
+
+def _pixel_size(css_size: str) -> int:
+    """Convert a Typography size such as "12px" to a pixel count."""
+    return int(css_size.removesuffix("px"))
+
+
+class BarRowWidget(QWidget):
+    """
+    One chart row painted in a single pass: label, bar and info text.
+
+    Replaces a container, its layout, two labels and a bar widget per row.
+    """
+
+    # Shared by every row; built once instead of on each paint
+    _BG_COLOR = QColor(ModernTheme.LIGHT_GRAY.name())
+    _TEXT_PEN = QPen(QColor(ModernTheme.VERY_DARK_GRAY.name()), 1)
+    _INFO_PEN = QPen(QColor(ModernTheme.DARK_GRAY.name()), 1)
+
+    _SPACING = 2
+    _MIN_BAR_HEIGHT = 30
+    _MAX_BAR_HEIGHT = 50
+
+    def __init__(
+        self,
+        label: str,
+        value: float,
+        max_value: float,
+        color: QColor | None = None,
+        info: str = "",
+    ):
         super().__init__()
+        self.label = label
         self.value = value
         self.max_value = max_value
-        self.label = label
-        self.color = color or ModernTheme.PRIMARY.name()
-        self.setMinimumHeight(30)
-        self.setMaximumHeight(50)
+        self.color = color or ModernTheme.PRIMARY
+        self.info = info
+
+        font_family = Typography.MAIN_FONT.split(",")[0]
+        self._label_font = QFont(font_family)
+        self._label_font.setPixelSize(_pixel_size(Typography.FONT_SM))
+        self._label_font.setWeight(QFont.Weight(int(Typography.WEIGHT_MEDIUM)))
+        self._info_font = QFont(font_family)
+        self._info_font.setPixelSize(_pixel_size(Typography.FONT_XS))
+
+        self._label_height = QFontMetrics(self._label_font).height()
+        self._info_height = QFontMetrics(self._info_font).height()
+        text_height = self._label_height + self._info_height + 2 * self._SPACING
+        self.setMinimumHeight(text_height + self._MIN_BAR_HEIGHT)
+        self.setMaximumHeight(text_height + self._MAX_BAR_HEIGHT)
+
+        # Rendered row, blitted on expose until its contents or size change
+        self._cache: QPixmap | None = None
+
+    def set_row(
+        self, label: str, value: float, max_value: float, color: QColor, info: str
+    ):
+        """Change what the row shows; schedules a repaint only if it differs."""
+        row = (label, value, max_value, color, info)
+        if row == (self.label, self.value, self.max_value, self.color, self.info):
+            return
+        self.label, self.value, self.max_value, self.color, self.info = row
+        self._cache = None
+        self.update()
+
+    def sizeHint(self) -> QSize:
+        return QSize(super().sizeHint().width(), self.minimumHeight())
+
+    def resizeEvent(self, event):
+        """Drop the cached rendering; it no longer fits the widget."""
+        super().resizeEvent(event)
+        self._cache = None
 
     def paintEvent(self, event):
+        dpr = self.devicePixelRatioF()
+        if self._cache is None or self._cache.devicePixelRatio() != dpr:
+            self._cache = QPixmap(self.size() * dpr)
+            self._cache.setDevicePixelRatio(dpr)
+            self._cache.fill(Qt.GlobalColor.transparent)
+
+            cache_painter = QPainter(self._cache)
+            self._draw_row(cache_painter)
+            cache_painter.end()
+
+        # Qt clips the blit to the exposed region
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.drawPixmap(0, 0, self._cache)
+
+    def _draw_row(self, painter: QPainter):
+        """Draw the label, the bar with its value and the info line."""
+        width = self.width()
+        text_align = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+
+        # Label line
+        painter.setPen(self._TEXT_PEN)
+        painter.setFont(self._label_font)
+        painter.drawText(QRect(0, 0, width, self._label_height), text_align, self.label)
 
-        # Calculate bar width as percentage of widget width
+        # Bars are axis-aligned rectangles, so antialiasing only costs fill
+        # rate; text keeps its default text antialiasing
+        bar_top = self._label_height + self._SPACING
+        bar_height = self.height() - bar_top - self._SPACING - self._info_height
+        track_width = width - 100
+
+        # Calculate bar width as percentage of the track
         if self.max_value > 0:
-            bar_width = int((self.value / self.max_value) * (self.width() - 100))
+            bar_width = int((self.value / self.max_value) * track_width)
         else:
             bar_width = 0
 
         # Draw background
-        painter.fillRect(0, 0, self.width() - 100, self.height(), QColor(ModernTheme.LIGHT_GRAY.name()))
+        painter.fillRect(0, bar_top, track_width, bar_height, self._BG_COLOR)
 
         # Draw bar
         if bar_width > 0:
-            painter.fillRect(0, 0, bar_width, self.height(), QColor(self.color))
+            painter.fillRect(0, bar_top, bar_width, bar_height, self.color)
 
         # Draw value text
-        painter.setPen(QPen(QColor(ModernTheme.VERY_DARK_GRAY.name()), 1))
-        text_rect = painter.fontMetrics().boundingRect(f"{int(self.value)}")
-        text_x = self.width() - 90
-        text_y = self.height() // 2 + text_rect.height() // 2
-        painter.drawText(text_x, text_y, f"{int(self.value)}")
-
-
-class SizeDistributionChart(BaseChart):
-    """Bar chart for file size distribution."""
-
-    def __init__(self, parent=None):
-        super().__init__("File Size Distribution", parent)
-        self.distribution_data = None
+        painter.setFont(self.font())
+        painter.drawText(
+            QRect(width - 90, bar_top, 90, bar_height),
+            text_align,
+            f"{int(self.value)}",
+        )
+
+        # Info line
+        painter.setPen(self._INFO_PEN)
+        painter.setFont(self._info_font)
+        painter.drawText(
+            QRect(0, self.height() - self._info_height, width, self._info_height),
+            text_align,
+            self.info,
+        )
+
+
+class _BarRowsChart(BaseChart):
+    """
+    Base for charts drawn as a column of labelled bars.
+
+    Row widgets are pooled: a refresh updates existing rows in place and
+    only creates rows when more are needed, hiding any surplus.
+    """
 
     def setup_chart(self):
         """Setup the bar chart content."""
@@ -61,6 +178,53 @@ class SizeDistributionChart(BaseChart):
         self.bars_layout.setSpacing(Spacing.SM)
         self.chart_layout.addWidget(self.bars_widget)
 
+        # One row widget per bar, reused across refreshes
+        self._row_widgets: list[BarRowWidget] = []
+
+    def persistent_widgets(self) -> tuple[QWidget, ...]:
+        return (self.bars_widget,)
+
+    def _show_rows(self, rows: list[tuple[str, int, int, QColor, str]]):
+        """
+        Display rows of (label, count, max_count, color, info text).
+
+        Args:
+            rows: One entry per bar to show, top to bottom
+        """
+        # Coalesce the row changes into a single relayout and repaint
+        self.bars_widget.setUpdatesEnabled(False)
+        try:
+            # A no-data message replaces the bars; put them back first
+            if self.bars_widget.parent() is not self.chart_widget:
+                self.clear_chart()
+                self.chart_layout.addWidget(self.bars_widget)
+
+            for i, (label_text, count, max_count, color, info_text) in enumerate(rows):
+                if i < len(self._row_widgets):
+                    row_widget = self._row_widgets[i]
+                    row_widget.set_row(label_text, count, max_count, color, info_text)
+                    row_widget.show()
+                    continue
+
+                row_widget = BarRowWidget(
+                    label_text, count, max_count, color, info_text
+                )
+                self.bars_layout.addWidget(row_widget)
+                self._row_widgets.append(row_widget)
+
+            for row_widget in self._row_widgets[len(rows) :]:
+                row_widget.hide()
+        finally:
+            self.bars_widget.setUpdatesEnabled(True)
+
+
+class SizeDistributionChart(_BarRowsChart):
+    """Bar chart for file size distribution."""
+
+    def __init__(self, parent=None):
+        super().__init__("File Size Distribution", parent)
+        self.distribution_data = None
+
     def update_data(self, data: FileDistributionData, metadata: ChartMetadata = None):
         """Update the chart with size distribution data."""
         self.distribution_data = data
@@ -69,108 +233,51 @@ class SizeDistributionChart(BaseChart):
 
     def refresh_chart(self):
         """Refresh the chart display."""
-        from src.utils.logger import logger
-
-        # Clear existing bars
-        for i in reversed(range(self.bars_layout.count())):
-            child = self.bars_layout.itemAt(i).widget()
-            if child:
-                child.setParent(None)
-
-        if not self.distribution_data or not any(self.distribution_data.file_counts):
-            logger.debug(f"Size distribution chart: No data to display - data exists: {bool(self.distribution_data)}, counts: {self.distribution_data.file_counts if self.distribution_data else 'None'}")
+        if not self.distribution_data or not self.distribution_data.has_data:
+            logger.debug(
+                "Size distribution chart: No data to display - data exists: %s, "
+                "counts: %s",
+                bool(self.distribution_data),
+                self.distribution_data.file_counts if self.distribution_data else None,
+            )
             self.show_no_data_message("No file size data available")
             return
 
-        logger.debug(f"Size distribution chart: Displaying {len(self.distribution_data.size_ranges)} size ranges")
-
-        # Find max count for scaling
-        max_count = max(self.distribution_data.file_counts) if self.distribution_data.file_counts else 1
-
-        # Create bars for each size range
-        for i, (size_range, count, total_size, percentage) in enumerate(
-            zip(
-                self.distribution_data.size_ranges,
-                self.distribution_data.file_counts,
-                self.distribution_data.total_sizes,
-                self.distribution_data.percentages,
-            )
-        ):
+        logger.debug(
+            "Size distribution chart: Displaying %d size ranges",
+            len(self.distribution_data.size_ranges),
+        )
+
+        # One bar for each non-empty size range
+        data = self.distribution_data
+        max_count = data.max_count  # Scale bars to the largest range
+        rows = []
+        for i in range(len(data.size_ranges)):
+            count = data.file_counts[i]
             if count == 0:
                 continue
 
-            # Create container for bar and label
-            bar_container = QWidget()
-            bar_layout = QVBoxLayout(bar_container)
-            bar_layout.setContentsMargins(0, 0, 0, 0)
-            bar_layout.setSpacing(2)
-
-            # Label
-            label = QLabel(size_range)
-            label.setStyleSheet(f"""
-            QLabel {{
-                font-size: {Typography.FONT_SM};
-                font-weight: {Typography.WEIGHT_MEDIUM};
-                color: {ModernTheme.VERY_DARK_GRAY.name()};
-                background: transparent;
-                border: none;
-            }}
-            """)
-
-            # Bar with count info
-            QHBoxLayout()
-
-            # Bar widget
-            bar_widget = BarWidget(count, max_count, size_range, self._get_bar_color(i))
-
-            # Info label
-            from src.utils.file_utils import format_size
-            info_text = f"{count} files, {format_size(total_size)}, {percentage:.1f}%"
-            info_label = QLabel(info_text)
-            info_label.setStyleSheet(f"""
-            QLabel {{
-                font-size: {Typography.FONT_XS};
-                color: {ModernTheme.DARK_GRAY.name()};
-                background: transparent;
-                border: none;
-            }}
-            """)
-
-            bar_layout.addWidget(label)
-            bar_layout.addWidget(bar_widget)
-            bar_layout.addWidget(info_label)
-
-            self.bars_layout.addWidget(bar_container)
-
-    def _get_bar_color(self, index: int) -> str:
+            color = self._get_bar_color(i)
+            info_text = data.info_texts[i]
+            rows.append((data.size_ranges[i], count, max_count, color, info_text))
+
+        self._show_rows(rows)
+
+    def _get_bar_color(self, index: int) -> QColor:
         """Get color for bar based on index."""
-        colors = [
-            ModernTheme.SUCCESS.name(),
-            ModernTheme.PRIMARY.name(),
-            ModernTheme.WARNING.name(),
-            ModernTheme.ERROR.name(),
-            ModernTheme.DARK_GRAY.name(),
-        ]
-        return colors[index % len(colors)]
+        return _BAR_PALETTE[index % len(_BAR_PALETTE)]
 
     def get_chart_type(self) -> str:
         return "size_distribution"
 
 
-class FileAgeChart(BaseChart):
+class FileAgeChart(_BarRowsChart):
     """Bar chart for file age analysis."""
 
     def __init__(self, parent=None):
         super().__init__("File Age Analysis", parent)
         self.age_data = None
 
-    def setup_chart(self):
-        """Setup the bar chart content."""
-        self.bars_widget = QWidget()
-        self.bars_layout = QVBoxLayout(self.bars_widget)
-        self.bars_layout.setSpacing(Spacing.SM)
-        self.chart_layout.addWidget(self.bars_widget)
-
     def update_data(self, data: FileAgeData, metadata: ChartMetadata = None):
         """Update the chart with age distribution data."""
         self.age_data = data
@@ -179,87 +286,37 @@ class FileAgeChart(BaseChart):
 
     def refresh_chart(self):
         """Refresh the chart display."""
-        from src.utils.logger import logger
-
-        # Clear existing bars
-        for i in reversed(range(self.bars_layout.count())):
-            child = self.bars_layout.itemAt(i).widget()
-            if child:
-                child.setParent(None)
-
-        if not self.age_data or not any(self.age_data.file_counts):
-            logger.debug(f"File age chart: No data to display - data exists: {bool(self.age_data)}, counts: {self.age_data.file_counts if self.age_data else 'None'}")
+        if not self.age_data or not self.age_data.has_data:
+            logger.debug(
+                "File age chart: No data to display - data exists: %s, counts: %s",
+                bool(self.age_data),
+                self.age_data.file_counts if self.age_data else None,
+            )
             self.show_no_data_message("No file age data available")
             return
 
-        logger.debug(f"File age chart: Displaying {len(self.age_data.age_ranges)} age ranges")
-
-        # Find max count for scaling
-        max_count = max(self.age_data.file_counts) if self.age_data.file_counts else 1
+        logger.debug(
+            "File age chart: Displaying %d age ranges", len(self.age_data.age_ranges)
+        )
 
-        # Create bars for each age range
-        for i, (age_range, count, total_size, percentage) in enumerate(
-            zip(
-                self.age_data.age_ranges,
-                self.age_data.file_counts,
-                self.age_data.total_sizes,
-                self.age_data.percentages,
-            )
-        ):
+        # One bar for each non-empty age range
+        data = self.age_data
+        max_count = data.max_count  # Scale bars to the largest range
+        rows = []
+        for i in range(len(data.age_ranges)):
+            count = data.file_counts[i]
             if count == 0:
                 continue
 
-            # Create container for bar and label
-            bar_container = QWidget()
-            bar_layout = QVBoxLayout(bar_container)
-            bar_layout.setContentsMargins(0, 0, 0, 0)
-            bar_layout.setSpacing(2)
-
-            # Label
-            label = QLabel(age_range)
-            label.setStyleSheet(f"""
-            QLabel {{
-                font-size: {Typography.FONT_SM};
-                font-weight: {Typography.WEIGHT_MEDIUM};
-                color: {ModernTheme.VERY_DARK_GRAY.name()};
-                background: transparent;
-                border: none;
-            }}
-            """)
-
-            # Bar with count info
-            bar_widget = BarWidget(count, max_count, age_range, self._get_age_color(i))
-
-            # Info label
-            from src.utils.file_utils import format_size
-            info_text = f"{count} files, {format_size(total_size)}, {percentage:.1f}%"
-            info_label = QLabel(info_text)
-            info_label.setStyleSheet(f"""
-            QLabel {{
-                font-size: {Typography.FONT_XS};
-                color: {ModernTheme.DARK_GRAY.name()};
-                background: transparent;
-                border: none;
-            }}
-            """)
-
-            bar_layout.addWidget(label)
-            bar_layout.addWidget(bar_widget)
-            bar_layout.addWidget(info_label)
-
-            self.bars_layout.addWidget(bar_container)
-
-    def _get_age_color(self, index: int) -> str:
+            color = self._get_age_color(i)
+            info_text = data.info_texts[i]
+            rows.append((data.age_ranges[i], count, max_count, color, info_text))
+
+        self._show_rows(rows)
+
+    def _get_age_color(self, index: int) -> QColor:
         """Get color for bar based on age (newer = green, older = red)."""
-        colors = [
-            ModernTheme.SUCCESS.name(),  # Today - green
-            ModernTheme.PRIMARY.name(),  # This week - blue
-            ModernTheme.INFO.name(),     # This month - blue
-            ModernTheme.WARNING.name(),  # 3 months - yellow
-            ModernTheme.ERROR.name(),    # This year - red
-            ModernTheme.DARK_GRAY.name(), # Older - gray
-        ]
-        return colors[index % len(colors)]
+        return _AGE_PALETTE[index % len(_AGE_PALETTE)]
 
     def get_chart_type(self) -> str:
         return "file_age"
@@ -5,7 +5,7 @@ from abc import abstractmethod
 from typing import Any
 
 from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QPainter, QPixmap
+from PyQt6.QtGui import QImage, QPainter
 from PyQt6.QtWidgets import QHBoxLayout, QLabel, QVBoxLayout, QWidget
 
 from ....themes.styles import ModernTheme, Typography
@@ -14,6 +14,23 @@ from ...modern_button import ModernButton
 from ..models.chart_data import ChartMetadata
 
 
+def _clear_layout(layout, keep: tuple[QWidget, ...] = ()):
+    """
+    Empty a layout in one pass.
+
+    Widgets in keep are only detached so the chart can add them back later;
+    everything else is scheduled for deletion instead of lingering parentless.
+    """
+    while (item := layout.takeAt(0)) is not None:
+        widget = item.widget()
+        if widget is None:
+            continue
+        if any(widget is kept for kept in keep):
+            widget.setParent(None)
+        else:
+            widget.deleteLater()
+
+
 class BaseChart(CardWidget):
     """
     Abstract base class for all chart widgets.
@@ -128,17 +145,18 @@ class BaseChart(CardWidget):
             True if export was successful
         """
         try:
-            # Create a pixmap of the specified size
-            pixmap = QPixmap(width, height)
-            pixmap.fill(ModernTheme.WHITE)
+            # Render into a plain CPU image; a QPixmap would go through the
+            # window system backend for a file that never reaches the screen
+            image = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+            image.fill(ModernTheme.WHITE)
 
-            # Render the widget to the pixmap
-            painter = QPainter(pixmap)
+            # Render the widget to the image
+            painter = QPainter(image)
             self.render(painter)
             painter.end()
 
-            # Save the pixmap
-            return pixmap.save(file_path, "PNG")
+            # Save the image
+            return image.save(file_path, "PNG")
 
         except Exception as e:
             print(f"Error exporting chart: {e}")
@@ -159,34 +177,45 @@ class BaseChart(CardWidget):
 
     def show_no_data_message(self, message: str = "No data available"):
         """Show a message when there's no data to display."""
-        # Clear existing chart content
-        for i in reversed(range(self.chart_layout.count())):
-            child = self.chart_layout.itemAt(i).widget()
-            if child:
-                child.setParent(None)
-
-        # Add no data label
-        no_data_label = QLabel(message)
-        no_data_label.setStyleSheet(f"""
-        QLabel {{
-            color: {ModernTheme.DARK_GRAY.name()};
-            font-size: {Typography.FONT_MD};
-            padding: 40px;
-            text-align: center;
-            border: none;
-            background: transparent;
-        }}
-        """)
-        no_data_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-
-        self.chart_layout.addWidget(no_data_label)
+        # Swap the content with one relayout and repaint instead of one each
+        self.chart_widget.setUpdatesEnabled(False)
+        try:
+            # Clear existing chart content
+            _clear_layout(self.chart_layout, self.persistent_widgets())
+
+            # Add no data label
+            no_data_label = QLabel(message)
+            no_data_label.setStyleSheet(f"""
+            QLabel {{
+                color: {ModernTheme.DARK_GRAY.name()};
+                font-size: {Typography.FONT_MD};
+                padding: 40px;
+                text-align: center;
+                border: none;
+                background: transparent;
+            }}
+            """)
+            no_data_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+            self.chart_layout.addWidget(no_data_label)
+        finally:
+            self.chart_widget.setUpdatesEnabled(True)
 
     def clear_chart(self):
         """Clear all chart content."""
-        for i in reversed(range(self.chart_layout.count())):
-            child = self.chart_layout.itemAt(i).widget()
-            if child:
-                child.setParent(None)
+        self.chart_widget.setUpdatesEnabled(False)
+        try:
+            _clear_layout(self.chart_layout, self.persistent_widgets())
+        finally:
+            self.chart_widget.setUpdatesEnabled(True)
+
+    def persistent_widgets(self) -> tuple[QWidget, ...]:
+        """
+        Get the chart widgets that survive clearing, to be re-added later.
+
+        Anything else in the chart layout is deleted when the chart is cleared.
+        """
+        return ()
 
     def emit_item_clicked(self, item_id: str, data: dict[str, Any]):
         """Emit the item clicked signal with data."""
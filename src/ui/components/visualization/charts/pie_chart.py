@@ -1,13 +1,22 @@
 #!/usr/bin/env python3
 # File: src/ui/components/visualization/charts/pie_chart.py
 
+import bisect
 import math
 from typing import Any
 
 from PyQt6.QtCore import QPoint, QRect, Qt
-from PyQt6.QtGui import QBrush, QColor, QFont, QPainter, QPen
+from PyQt6.QtGui import QBrush, QColor, QFont, QPainter, QPen, QPixmap
 from PyQt6.QtWidgets import QWidget
 
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
 from ....themes.styles import ModernTheme, Typography
 from ..models.chart_data import ChartMetadata, FileTypeData
 from .base_chart import InteractiveChart
@@ -23,27 +32,150 @@ class PieChartWidget(QWidget):
 
         self.data = []
         self.segments = []  # Store segment info for mouse events
+        self._cum_angles: list[float] = []
+        self._brushes: list[QBrush] = []
+        self._hover_brushes: list[QBrush] = []
+        self._total_size = 0
         self.hover_segment = -1
         self.setMinimumSize(300, 300)
 
         # Enable mouse tracking for hover effects
         self.setMouseTracking(True)
 
+        # Fonts and pens are reused by every paint instead of rebuilt
+        font_family = Typography.MAIN_FONT.split(",")[0]
+        self._label_font = QFont(font_family, 10)
+        self._label_font.setBold(True)
+        self._legend_font = QFont(font_family, 9)
+        self._no_data_font = QFont(font_family, 14)
+
+        self._segment_pen = QPen(ModernTheme.WHITE, 2)
+        self._label_pen = QPen(ModernTheme.WHITE)
+        self._text_pen = QPen(ModernTheme.VERY_DARK_GRAY)
+        self._border_pen = QPen(ModernTheme.BORDER)
+        self._no_data_pen = QPen(ModernTheme.DARK_GRAY)
+
+        # Rendered chart, blitted on expose until the data or size change
+        self._cache: QPixmap | None = None
+
+        self._update_geometry()
+
     def update_data(self, data: list[FileTypeData]):
         """Update the pie chart with new data."""
         self.data = data
-        self.segments = []
+        self._update_segments()
+        self._cache = None
         self.update()
 
+    def _update_segments(self):
+        """
+        Lay out the segment angles for the current data.
+
+        Also records, per segment, the cumulative sweep in degrees from
+        12 o'clock where it ends, so hit-testing is a binary search.
+        """
+        self.segments = []
+        self._cum_angles = []
+
+        # Parsed once per data update; the legend needs them even when
+        # every size is zero and there are no segments
+        self._brushes = [QBrush(QColor(item.color)) for item in self.data]
+        self._hover_brushes = [
+            QBrush(brush.color().lighter(120)) for brush in self._brushes
+        ]
+
+        # Qt uses 1/16th degree units; segments start at 12 o'clock
+        full_circle = 360 * 16
+        start = 90 * 16
+
+        # Integer spans, so each segment's share truncates exactly once
+        if NUMPY_AVAILABLE:
+            sizes = np.fromiter(
+                (item.total_size for item in self.data),
+                dtype=np.int64,
+                count=len(self.data),
+            )
+            self._total_size = total_size = int(sizes.sum())
+            if total_size == 0:
+                return
+            span_array = sizes * full_circle // total_size
+            swept_array = np.cumsum(span_array)
+            spans = span_array.tolist()
+            starts = (start + swept_array - span_array).tolist()
+            self._cum_angles = (swept_array / 16).tolist()
+        else:
+            self._total_size = total_size = sum(item.total_size for item in self.data)
+            if total_size == 0:
+                return
+            spans = [item.total_size * full_circle // total_size for item in self.data]
+            starts = []
+            swept = 0
+            for span_angle in spans:
+                starts.append(start + swept)
+                swept += span_angle
+                self._cum_angles.append(swept / 16)
+
+        for i, item in enumerate(self.data):
+            # Unit vector from the center through the middle of the segment;
+            # Y is negated because screen Y points down
+            mid_angle_rad = math.radians((starts[i] + spans[i] / 2) / 16)
+            self.segments.append(
+                {
+                    "start_angle": starts[i],
+                    "span_angle": spans[i],
+                    "data": item,
+                    "index": i,
+                    "brush": self._brushes[i],
+                    "hover_brush": self._hover_brushes[i],
+                    # Only show text for segments > 5%
+                    "label": f"{item.percentage:.1f}%" if item.percentage > 5 else None,
+                    "label_dx": math.cos(mid_angle_rad),
+                    "label_dy": -math.sin(mid_angle_rad),
+                }
+            )
+
     def paintEvent(self, event):
         """Paint the pie chart."""
+        dpr = self.devicePixelRatioF()
+        if self._cache is None or self._cache.devicePixelRatio() != dpr:
+            self._cache = QPixmap(self.size() * dpr)
+            self._cache.setDevicePixelRatio(dpr)
+            self._render_cache(self.rect())
+
+        # Qt clips the blit to the exposed region
         painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._cache)
+
+    def _render_cache(self, rect: QRect):
+        """Redraw the part of the cached chart inside rect."""
+        painter = QPainter(self._cache)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setClipRect(rect)
+
+        # Clear what was there before drawing over it
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+        painter.fillRect(rect, Qt.GlobalColor.transparent)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
 
         if not self.data:
             self.draw_no_data_message(painter)
-            return
-
+        else:
+            # Hover changes only redraw the pie; skip the legend then
+            if rect.intersects(self._pie_update_rect):
+                self.draw_pie_segments(painter, self._chart_rect)
+            if rect.intersects(self._legend_rect):
+                self.draw_legend(painter, self._chart_rect)
+
+        painter.end()
+
+    def resizeEvent(self, event):
+        """Recompute the pie geometry for the new size."""
+        super().resizeEvent(event)
+        self._update_geometry()
+        self._cache = None
+
+    def _update_geometry(self):
+        """Cache the pie rectangle, center and radius for the current size."""
         # Calculate chart area
         margin = 40
         chart_rect = QRect(
@@ -52,98 +184,64 @@ class PieChartWidget(QWidget):
 
         # Make it square (use the smaller dimension)
         side = min(chart_rect.width(), chart_rect.height())
-        chart_rect = QRect(
+        self._chart_rect = QRect(
             (self.width() - side) // 2, (self.height() - side) // 2, side, side
         )
 
-        # Draw pie segments
-        self.draw_pie_segments(painter, chart_rect)
+        # The 2px segment outline reaches just past the pie rectangle
+        self._pie_update_rect = self._chart_rect.adjusted(-2, -2, 2, 2)
+
+        # Same placement rules as draw_legend, eight rows of 20px
+        legend_x = self._chart_rect.right() + 20
+        legend_y = self._chart_rect.top()
+        if legend_x + 150 > self.width():
+            legend_x = 20
+            legend_y = self._chart_rect.bottom() + 20
+        self._legend_rect = QRect(
+            legend_x, legend_y, max(0, self.width() - legend_x), 8 * 20
+        )
 
-        # Draw legend
-        self.draw_legend(painter, chart_rect)
+        self._center = QPoint(self.width() // 2, self.height() // 2)
+        radius = min(self.width(), self.height()) // 2 - margin
+        self._radius_sq = radius * radius
 
     def draw_pie_segments(self, painter: QPainter, chart_rect: QRect):
         """Draw the pie chart segments."""
-        if not self.data:
+        if not self.data or self._total_size == 0:
             return
 
-        # Calculate total size
-        total_size = sum(item.total_size for item in self.data)
-        if total_size == 0:
-            return
-
-        # Clear segments list
-        self.segments = []
-
-        # Starting angle (12 o'clock position)
-        start_angle = 90 * 16  # Qt uses 1/16th degree units
-
-        for i, item in enumerate(self.data):
-            # Calculate span angle
-            span_angle = int((item.total_size / total_size) * 360 * 16)
-
-            # Get color
-            color = QColor(item.color)
-
+        # All wedges share one outline pen, so set it once
+        painter.setPen(self._segment_pen)
+        for segment in self.segments:
             # Highlight hovered segment
-            if i == self.hover_segment:
-                color = color.lighter(120)
+            if segment["index"] == self.hover_segment:
+                painter.setBrush(segment["hover_brush"])
+            else:
+                painter.setBrush(segment["brush"])
 
             # Draw the segment
-            painter.setBrush(QBrush(color))
-            painter.setPen(QPen(QColor(ModernTheme.WHITE.name()), 2))
-            painter.drawPie(chart_rect, start_angle, span_angle)
-
-            # Store segment info for mouse events
-            self.segments.append(
-                {
-                    "start_angle": start_angle,
-                    "span_angle": span_angle,
-                    "data": item,
-                    "index": i,
-                }
-            )
+            painter.drawPie(chart_rect, segment["start_angle"], segment["span_angle"])
 
-            # Draw percentage text for larger segments
-            if item.percentage > 5:  # Only show text for segments > 5%
-                self.draw_segment_label(
-                    painter, chart_rect, start_angle, span_angle, item
-                )
-
-            start_angle += span_angle
+        # Then the labels on top, all with the same pen and font
+        painter.setPen(self._label_pen)
+        painter.setFont(self._label_font)
+        for segment in self.segments:
+            if segment["label"] is not None:
+                self.draw_segment_label(painter, chart_rect, segment)
 
     def draw_segment_label(
-        self,
-        painter: QPainter,
-        chart_rect: QRect,
-        start_angle: int,
-        span_angle: int,
-        item: FileTypeData,
+        self, painter: QPainter, chart_rect: QRect, segment: dict[str, Any]
     ):
-        """Draw text label on pie segment."""
-        # Calculate label position (middle of the segment)
-        mid_angle = (start_angle + span_angle / 2) / 16  # Convert to degrees
-        mid_angle_rad = math.radians(mid_angle)
-
+        """Draw text label on pie segment with the painter's current pen and font."""
         # Calculate position on the pie (2/3 of the radius from center)
-        center_x = chart_rect.center().x()
-        center_y = chart_rect.center().y()
-        radius = min(chart_rect.width(), chart_rect.height()) / 2
-        label_radius = radius * 0.65
-
-        label_x = center_x + label_radius * math.cos(mid_angle_rad)
-        label_y = center_y - label_radius * math.sin(
-            mid_angle_rad
-        )  # Negative because Y is inverted
-
-        # Setup text drawing
-        painter.setPen(QPen(QColor(ModernTheme.WHITE.name())))
-        font = QFont(Typography.MAIN_FONT.split(",")[0], 10)
-        font.setBold(True)
-        painter.setFont(font)
+        center = chart_rect.center()
+        label_radius = min(chart_rect.width(), chart_rect.height()) / 2 * 0.65
+
+        label_x = center.x() + label_radius * segment["label_dx"]
+        label_y = center.y() + label_radius * segment["label_dy"]
 
         # Draw percentage
-        text = f"{item.percentage:.1f}%"
+        text = segment["label"]
         text_rect = painter.fontMetrics().boundingRect(text)
 
         # Center the text at the calculated position
@@ -167,33 +265,31 @@ class PieChartWidget(QWidget):
             legend_x = 20
             legend_y = chart_rect.bottom() + 20
 
-        # Setup text drawing
-        painter.setPen(QPen(QColor(ModernTheme.VERY_DARK_GRAY.name())))
-        font = QFont(Typography.MAIN_FONT.split(",")[0], 9)
-        painter.setFont(font)
-
         line_height = 20
-        current_y = legend_y
+        items = self.data[:8]  # Show top 8 items in legend
 
-        for item in self.data[:8]:  # Show top 8 items in legend
-            # Draw color box
-            color_rect = QRect(legend_x, current_y, 12, 12)
-            painter.fillRect(color_rect, QColor(item.color))
-            painter.setPen(QPen(QColor(ModernTheme.BORDER.name())))
-            painter.drawRect(color_rect)
+        # Color boxes first, all outlined with the same pen; drawRect fills
+        # with the item's brush rather than whatever the pie left set
+        painter.setPen(self._border_pen)
+        current_y = legend_y
+        for brush in self._brushes[: len(items)]:
+            painter.setBrush(brush)
+            painter.drawRect(legend_x, current_y, 12, 12)
+            current_y += line_height
 
-            # Draw text
-            painter.setPen(QPen(QColor(ModernTheme.VERY_DARK_GRAY.name())))
+        # Then all the text with the text pen
+        painter.setPen(self._text_pen)
+        painter.setFont(self._legend_font)
+        current_y = legend_y
+        for item in items:
             text = f"{item.type} ({item.percentage:.1f}%)"
             painter.drawText(legend_x + 18, current_y + 10, text)
-
             current_y += line_height
 
     def draw_no_data_message(self, painter: QPainter):
         """Draw a message when there's no data."""
-        painter.setPen(QPen(QColor(ModernTheme.DARK_GRAY.name())))
-        font = QFont(Typography.MAIN_FONT.split(",")[0], 14)
-        painter.setFont(font)
+        painter.setPen(self._no_data_pen)
+        painter.setFont(self._no_data_font)
 
         text = "No data available"
         painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, text)
@@ -210,9 +306,11 @@ class PieChartWidget(QWidget):
         if segment_index >= 0:
             self.hover_segment = segment_index
 
-        # Update if hover changed
+        # Update if hover changed; only the pie itself looks different
         if old_hover != self.hover_segment:
-            self.update()
+            if self._cache is not None:
+                self._render_cache(self._pie_update_rect)
+            self.update(self._pie_update_rect)
 
     def mousePressEvent(self, event):
         """Handle mouse clicks on segments."""
@@ -229,44 +327,23 @@ class PieChartWidget(QWidget):
         if not self.segments:
             return -1
 
-        # Calculate center and radius
-        center_x = self.width() // 2
-        center_y = self.height() // 2
-
         # Check if point is within the pie circle
-        dx = pos.x() - center_x
-        dy = pos.y() - center_y
-        distance = math.sqrt(dx * dx + dy * dy)
+        dx = pos.x() - self._center.x()
+        dy = pos.y() - self._center.y()
 
-        margin = 40
-        radius = min(self.width(), self.height()) // 2 - margin
-
-        if distance > radius:
+        if dx * dx + dy * dy > self._radius_sq:
             return -1
 
-        # Calculate angle of the mouse position
-        angle = math.degrees(math.atan2(-dy, dx))  # Negative dy because Y is inverted
-        if angle < 0:
-            angle += 360
-
-        # Convert to Qt angle format (starting from 3 o'clock, going clockwise)
-        qt_angle = (90 - angle) % 360
-        qt_angle * 16
+        # Angle of the mouse position, counter-clockwise from 3 o'clock like
+        # Qt's pie angles; negative dy because Y is inverted
+        angle = math.degrees(math.atan2(-dy, dx))
 
-        # Find which segment contains this angle
-        for i, segment in enumerate(self.segments):
-            start = segment["start_angle"] / 16
-            span = segment["span_angle"] / 16
-            end = (start + span) % 360
+        # Segments sweep counter-clockwise from 12 o'clock
+        swept = (angle - 90) % 360
 
-            if start <= end:
-                if start <= qt_angle <= end:
-                    return i
-            else:  # Segment crosses 0 degrees
-                if qt_angle >= start or qt_angle <= end:
-                    return i
-
-        return -1
+        # Truncated spans can leave a sliver after the last segment
+        index = bisect.bisect_right(self._cum_angles, swept)
+        return index if index < len(self.segments) else -1
 
 
 class FileTypePieChart(InteractiveChart):
@@ -293,15 +370,16 @@ class FileTypePieChart(InteractiveChart):
             self.show_no_data_message("No files to analyze")
             return
 
-        # Clear any existing no-data message
-        self.clear_chart()
-
-        # Re-add the pie widget if it was cleared
-        if not hasattr(self, "pie_widget") or not self.pie_widget.parent():
-            self.setup_chart()
+        # A no-data message replaces the pie; put it back first
+        if self.pie_widget.parent() is not self.chart_widget:
+            self.clear_chart()
+            self.chart_layout.addWidget(self.pie_widget)
 
         self.pie_widget.update_data(data)
 
+    def persistent_widgets(self) -> tuple[QWidget, ...]:
+        return (self.pie_widget,)
+
     def on_segment_clicked(self, data_item: FileTypeData):
         """Handle pie segment clicks."""
         # Emit drill-down signal with file type filter
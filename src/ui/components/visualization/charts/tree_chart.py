@@ -1,70 +1,248 @@
 #!/usr/bin/env python3
 # File: src/ui/components/visualization/charts/tree_chart.py
 
+from operator import attrgetter
 from typing import Any
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QAbstractItemModel, QModelIndex, QPoint, Qt
 from PyQt6.QtWidgets import (
     QHBoxLayout,
     QLabel,
-    QTreeWidget,
-    QTreeWidgetItem,
+    QTreeView,
     QWidget,
 )
 
+from src.utils.file_utils import format_size
+
 from ....themes.styles import ModernTheme, Spacing, Typography
 from ..models.chart_data import ChartMetadata, DirectoryNode
 from .base_chart import InteractiveChart
 
 
-class DirectoryTreeChart(InteractiveChart):
-    """Tree chart for directory structure visualization."""
-
-    def __init__(self, parent=None):
-        super().__init__("Directory Structure", parent)
-        self.directory_data = None
-
-    def setup_chart(self):
-        """Setup the tree chart content."""
-        # Create tree widget
-        self.tree_widget = QTreeWidget()
-        self.tree_widget.setHeaderLabels(["Name", "Size", "Files", "Type"])
-        self.tree_widget.setAlternatingRowColors(True)
-        self.tree_widget.setStyleSheet(f"""
-        QTreeWidget {{
+# Built once at import; the branch arrows are inline base64 PNGs, so the
+# sheet is a few KB that would otherwise be re-formatted per chart
+_TREE_QSS = f"""
+        QTreeView {{
             background-color: {ModernTheme.WHITE.name()};
             border: 1px solid {ModernTheme.BORDER.name()};
             border-radius: 4px;
             font-size: {Typography.FONT_SM};
         }}
-        QTreeWidget::item {{
+        QTreeView::item {{
             padding: 4px;
             border: none;
         }}
-        QTreeWidget::item:selected {{
+        QTreeView::item:selected {{
             background-color: {ModernTheme.SELECTED.name()};
         }}
-        QTreeWidget::item:hover {{
+        QTreeView::item:hover {{
             background-color: {ModernTheme.HOVER.name()};
         }}
-        QTreeWidget::branch:has-children:!has-siblings:closed,
-        QTreeWidget::branch:closed:has-children:has-siblings {{
+        QTreeView::branch:has-children:!has-siblings:closed,
+        QTreeView::branch:closed:has-children:has-siblings {{
             border-image: none;
             image: url(data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAkAAAAJCAYAAADgkQYQAAAABHNCSVQICAgIfAhkiAAAAAlwSFlzAAAAdgAAAHYBTnsmCAAAABl0RVh0U29mdHdhcmUAd3d3Lmlua3NjYXBlLm9yZ5vuPBoAAAFHSURBVBiVY/z//z8DJQAggJiQOYAAYqAVAAggGlyAAAKiGAAIIEZcbkAAAVEcAAQQPgABBITLAEAAMeJzPgIIiJYBgABixGcgAgiIlgGAAGLE5yACCIiWAYAAYsTrOAQQEC0DAAHESMj5CCAg2gUAAgjZcQggIFoGAAKIEa/jEEBAtAwABBAjIecjgIBoFwAIIGTHIYCAaBkACCBGvI5DAAHR8gEggJAdJ0AA0TIAEECY/0UAAVH+CwIIiPJfEEBAlP+CAAKi/BcEEBDlvyCA/v//DwWAAAJBfQgCCJjyQQABUf4LAgjo8l8QQEDz/+CAgGj5AwggoON/qAGAAAI6/ocaAAgg5P+CAAKi/BcEEBDlvyCAkP8LAgjo+B8QQMj/BQEERPM/EEBAlP+CAAKi/BcEEBDlvyCA/v//DwIAAQYALY0j+bt24EQAAAAASUVORK5CYII=);
         }}
-        QTreeWidget::branch:open:has-children:!has-siblings,
-        QTreeWidget::branch:open:has-children:has-siblings {{
+        QTreeView::branch:open:has-children:!has-siblings,
+        QTreeView::branch:open:has-children:has-siblings {{
             border-image: none;
             image: url(data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAkAAAAJCAYAAADgkQYQAAAABHNCSVQICAgIfAhkiAAAAAlwSFlzAAAAdgAAAHYBTnsmCAAAABl0RVh0U29mdHdhcmUAd3d3Lmlua3NjYXBlLm9yZ5vuPBoAAAFHSURBVBiVY/z//z8DJQAggJiQOYAAYqAVAAggGlyAAAKiGAAIIEZcbkAAAVEcAAQQPgABBITLAEAAMeJzPgIIiJYBgABixGcgAgiIlgGAAGLE5yACCIiWAYAAYsTrOAQQEC0DAAHESMj5CCAg2gUAAgjZcQggIFoGAAKIEa/jEEBAtAwABBAjIecjgIBoFwAIIGTHIYCAaBkACCBGvI5DAAHR8gEggJAdJ0AA0TIAEECY/0UAAVH+CwIIiPJfEEBAlP+CAAKi/BcEEBDlvyCA/v//DwWAAAJBfQgCCJjyQQABUf4LAgjo8l8QQEDz/+CAgGj5AwggoON/qAGAAAI6/ocaAAgg5P+CAAKi/BcEEBDlvyCAkP8LAgjo+B8QQMj/BQEERPM/EEBAlP+CAAKi/BcEEBDlvyCA/v//DwIAAQYALY0j+bt24EQAAAAASUVORK5CYII=);
         }}
-        """)
+        """
+
+_SUMMARY_LABEL_QSS = f"""
+            QLabel {{
+                font-size: {Typography.FONT_SM};
+                color: {ModernTheme.DARK_GRAY.name()};
+                background: transparent;
+                border: none;
+                padding: 2px 8px;
+            }}
+            """
+
+
+class DirectoryTreeModel(QAbstractItemModel):
+    """
+    Tree model exposing a DirectoryNode hierarchy to a view without items.
+
+    The root node is the single top-level row. A node's children only
+    become rows once the view fetches them, normally when its branch is
+    expanded, so building the model costs nothing per node. Children are
+    ordered by size, largest first, as they are fetched.
+    """
+
+    NodeRole = Qt.ItemDataRole.UserRole
+    PayloadRole = Qt.ItemDataRole.UserRole + 1
+
+    HEADERS = ("Name", "Size", "Files", "Type")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._root: DirectoryNode | None = None
+
+        # Keyed by id(node) for nodes whose children have been exposed:
+        # each exposed child's parent and its row under that parent
+        self._parents: dict[int, DirectoryNode] = {}
+        self._rows: dict[int, int] = {}
+        self._fetched: set[int] = set()
+
+    def set_root(self, root: DirectoryNode | None):
+        """Replace the hierarchy shown by the model."""
+        self.beginResetModel()
+        self._root = root
+        self._parents.clear()
+        self._rows.clear()
+        self._fetched.clear()
+        self.endResetModel()
+
+    def root(self) -> DirectoryNode | None:
+        """Return the hierarchy shown by the model."""
+        return self._root
+
+    def node(self, index: QModelIndex) -> DirectoryNode | None:
+        """Return the node behind an index, or None for the invisible root."""
+        return index.internalPointer() if index.isValid() else None
+
+    def index(self, row, column, parent=QModelIndex()):
+        """Return the index of the given child of parent."""
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+
+        parent_node = self.node(parent)
+        child = self._root if parent_node is None else parent_node.children[row]
+        return self.createIndex(row, column, child)
+
+    def parent(self, index=QModelIndex()):
+        """Return the parent of the given index."""
+        if not index.isValid():
+            return QModelIndex()
+
+        parent_node = self._parents.get(id(index.internalPointer()))
+        if parent_node is None:
+            return QModelIndex()
+        return self.createIndex(self._rows.get(id(parent_node), 0), 0, parent_node)
+
+    def rowCount(self, parent=QModelIndex()):
+        """Return the number of exposed children of parent."""
+        if parent.column() > 0:
+            return 0
+
+        parent_node = self.node(parent)
+        if parent_node is None:
+            return 0 if self._root is None else 1
+        if id(parent_node) not in self._fetched:
+            return 0
+        return len(parent_node.children)
+
+    def columnCount(self, parent=QModelIndex()):
+        """Return the number of columns."""
+        return len(self.HEADERS)
+
+    def hasChildren(self, parent=QModelIndex()):
+        """Report children before they are fetched so branches can expand."""
+        parent_node = self.node(parent)
+        if parent_node is None:
+            return self._root is not None
+        return bool(parent_node.children) and not parent_node.is_file
+
+    def canFetchMore(self, parent):
+        """Whether parent still has children the view has not seen."""
+        parent_node = self.node(parent)
+        return (
+            parent_node is not None
+            and bool(parent_node.children)
+            and id(parent_node) not in self._fetched
+        )
+
+    def fetchMore(self, parent):
+        """Expose all children of parent as rows."""
+        if not self.canFetchMore(parent):
+            return
+        parent_node = self.node(parent)
+
+        # Largest first; sorted by the numeric size, one level at a time,
+        # only for branches that are actually opened
+        children = parent_node.children
+        children.sort(key=attrgetter("total_size"), reverse=True)
+
+        self.beginInsertRows(parent, 0, len(children) - 1)
+        for row, child in enumerate(children):
+            self._parents[id(child)] = parent_node
+            self._rows[id(child)] = row
+        self._fetched.add(id(parent_node))
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Return the data at the given index."""
+        if not index.isValid():
+            return None
+
+        node = index.internalPointer()
+        column = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                return node.name or "Root"
+            elif column == 1:
+                return format_size(node.total_size)
+            elif column == 2:
+                return str(node.file_count)
+            elif column == 3:
+                return (node.file_type or "File") if node.is_file else "Directory"
+        elif role == Qt.ItemDataRole.ForegroundRole and column == 0:
+            # Style file and directory names differently
+            return ModernTheme.DARK_GRAY if node.is_file else ModernTheme.VERY_DARK_GRAY
+        elif role == self.NodeRole:
+            return node
+        elif role == self.PayloadRole:
+            return node.click_payload
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        """Return the header data."""
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+        ):
+            return self.HEADERS[section]
+        return None
+
+
+class DirectoryTreeChart(InteractiveChart):
+    """Tree chart for directory structure visualization."""
+
+    def __init__(self, parent=None):
+        super().__init__("Directory Structure", parent)
+        self.directory_data = None
+
+        # (directories, files) in directory_data, counted once per data set
+        self._node_counts: tuple[int, int] | None = None
+
+        # (id, total size, file count) of the hierarchy shown; directory_data
+        # keeps that node alive, so its id cannot belong to another one
+        self._last_data_key: tuple[int, int, int] | None = None
+
+    def setup_chart(self):
+        """Setup the tree chart content."""
+        # Create tree view; rows come from the model as branches are expanded
+        self.tree_model = DirectoryTreeModel(self)
+        self.tree_view = QTreeView()
+        self.tree_view.setModel(self.tree_model)
+
+        # Every row has the same height, so Qt can measure one and multiply;
+        # no expand animation frames, and no per-row alternate palette lookups
+        self.tree_view.setUniformRowHeights(True)
+        self.tree_view.setAnimated(False)
+        self.tree_view.setItemsExpandable(True)
+        self.tree_view.setExpandsOnDoubleClick(True)
+        self.tree_view.setStyleSheet(_TREE_QSS)
 
         # Connect tree signals
-        self.tree_widget.itemClicked.connect(self.on_tree_item_clicked)
-        self.tree_widget.itemDoubleClicked.connect(self.on_tree_item_double_clicked)
+        self.tree_view.clicked.connect(self.on_tree_item_clicked)
+        self.tree_view.doubleClicked.connect(self.on_tree_item_double_clicked)
 
         # Add to layout
-        self.chart_layout.addWidget(self.tree_widget)
+        self.chart_layout.addWidget(self.tree_view)
 
         # Add summary info
         self.setup_summary_info()
@@ -80,16 +258,8 @@ class DirectoryTreeChart(InteractiveChart):
         self.total_files_label = QLabel("Files: 0")
         self.total_size_label = QLabel("Total Size: 0 B")
 
-        for label in [self.total_dirs_label, self.total_files_label, self.total_size_label]:
-            label.setStyleSheet(f"""
-            QLabel {{
-                font-size: {Typography.FONT_SM};
-                color: {ModernTheme.DARK_GRAY.name()};
-                background: transparent;
-                border: none;
-                padding: 2px 8px;
-            }}
-            """)
+        # One sheet on the container styles all three labels
+        self.summary_widget.setStyleSheet(_SUMMARY_LABEL_QSS)
 
         self.summary_layout.addWidget(self.total_dirs_label)
         self.summary_layout.addWidget(self.total_files_label)
@@ -98,119 +268,97 @@ class DirectoryTreeChart(InteractiveChart):
 
         self.chart_layout.addWidget(self.summary_widget)
 
+    def persistent_widgets(self) -> tuple[QWidget, ...]:
+        return (self.tree_view, self.summary_widget)
+
     def update_data(self, data: DirectoryNode, metadata: ChartMetadata = None):
         """Update the chart with directory hierarchy data."""
-        self.directory_data = data
         self.metadata = metadata
+
+        # The same hierarchy again needs no new tree
+        data_key = (id(data), data.total_size, data.file_count) if data else None
+        if data_key is not None and data_key == self._last_data_key:
+            return
+
+        self.directory_data = data
+        self._last_data_key = data_key
+        self._node_counts = None
         self.refresh_chart()
 
     def refresh_chart(self):
         """Refresh the chart display."""
-        self.tree_widget.clear()
-
         if not self.directory_data:
+            self.tree_model.set_root(None)
             self.show_no_data_message("No directory structure data available")
             return
 
-        # Populate tree
-        self.populate_tree_item(None, self.directory_data)
+        # A no-data message replaces the tree; put it back first
+        if self.tree_view.parent() is not self.chart_widget:
+            self.clear_chart()
+            self.chart_layout.addWidget(self.tree_view)
+            self.chart_layout.addWidget(self.summary_widget)
+
+        # Reset, expand and size the tree with one layout and one repaint
+        self.tree_view.setUpdatesEnabled(False)
+        try:
+            self.tree_model.set_root(self.directory_data)
+
+            # Expand the root and its children in one call; the root's rows
+            # must exist first, the view fetches the rest as it lays them out
+            root_index = self.tree_model.index(0, 0)
+            self.tree_model.fetchMore(root_index)
+            self.tree_view.expandRecursively(root_index, 1)
+
+            # Resize columns to fit content, once each
+            for i in range(self.tree_model.columnCount()):
+                self.tree_view.resizeColumnToContents(i)
+        finally:
+            self.tree_view.setUpdatesEnabled(True)
 
         # Update summary
         self.update_summary()
 
-        # Expand first level
-        self.tree_widget.expandToDepth(1)
-
-        # Resize columns to fit content
-        for i in range(self.tree_widget.columnCount()):
-            self.tree_widget.resizeColumnToContents(i)
-
-    def populate_tree_item(self, parent_item: QTreeWidgetItem, node: DirectoryNode):
-        """Recursively populate tree items."""
-        from src.utils.file_utils import format_size
-
-        # Create tree item
-        if parent_item is None:
-            item = QTreeWidgetItem(self.tree_widget)
-        else:
-            item = QTreeWidgetItem(parent_item)
-
-        # Set item data
-        item.setText(0, node.name or "Root")
-        item.setText(1, format_size(node.total_size))
-        item.setText(2, str(node.file_count))
-
-        if node.is_file:
-            item.setText(3, node.file_type or "File")
-            # Style file items differently
-            item.setForeground(0, ModernTheme.DARK_GRAY)
-        else:
-            item.setText(3, "Directory")
-            # Style directory items
-            item.setForeground(0, ModernTheme.VERY_DARK_GRAY)
-
-        # Store node data in item
-        item.setData(0, Qt.ItemDataRole.UserRole, node)
-
-        # Add children
-        for child in node.children:
-            self.populate_tree_item(item, child)
-
-        # Sort children by size (descending)
-        if not node.is_file:
-            item.sortChildren(1, Qt.SortOrder.DescendingOrder)
-
     def update_summary(self):
         """Update summary information."""
         if not self.directory_data:
             return
 
-        # Count directories and files
-        dir_count, file_count = self.count_nodes(self.directory_data)
-
-        from src.utils.file_utils import format_size
+        # Count directories and files; refreshes of the same data reuse it
+        if self._node_counts is None:
+            self._node_counts = self.count_nodes(self.directory_data)
+        dir_count, file_count = self._node_counts
 
         self.total_dirs_label.setText(f"Directories: {dir_count}")
         self.total_files_label.setText(f"Files: {file_count}")
         self.total_size_label.setText(f"Total Size: {format_size(self.directory_data.total_size)}")
 
     def count_nodes(self, node: DirectoryNode) -> tuple[int, int]:
-        """Count directories and files recursively."""
+        """Count directories and files under node, node included."""
         dir_count = 0
         file_count = 0
 
-        if node.is_file:
-            file_count = 1
-        else:
-            dir_count = 1
-
-        for child in node.children:
-            child_dirs, child_files = self.count_nodes(child)
-            dir_count += child_dirs
-            file_count += child_files
+        # Explicit stack: deep trees can't hit the recursion limit
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if current.is_file:
+                file_count += 1
+            else:
+                dir_count += 1
+                stack.extend(current.children)
 
         return dir_count, file_count
 
-    def on_tree_item_clicked(self, item: QTreeWidgetItem, column: int):
+    def on_tree_item_clicked(self, index: QModelIndex):
         """Handle tree item click."""
-        node = item.data(0, Qt.ItemDataRole.UserRole)
-        if node and self.is_interactive:
+        payload = index.data(DirectoryTreeModel.PayloadRole)
+        if payload and self.is_interactive:
             # Emit click signal with node data
-            self.emit_item_clicked(
-                f"node_{id(node)}",
-                {
-                    "node": node,
-                    "path": node.path,
-                    "is_file": node.is_file,
-                    "size": node.total_size,
-                    "filter_type": "directory" if not node.is_file else "file",
-                    "filter_value": node.path,
-                }
-            )
+            self.emit_item_clicked(f"node_{payload['path']}", payload)
 
-    def on_tree_item_double_clicked(self, item: QTreeWidgetItem, column: int):
+    def on_tree_item_double_clicked(self, index: QModelIndex):
         """Handle tree item double click."""
-        node = item.data(0, Qt.ItemDataRole.UserRole)
+        node = index.data(DirectoryTreeModel.NodeRole)
         if node and self.is_interactive:
             # Emit drill-down signal
             self.drill_down_requested.emit(
@@ -224,16 +372,9 @@ class DirectoryTreeChart(InteractiveChart):
 
     def get_item_at_position(self, x: int, y: int) -> dict[str, Any] | None:
         """Get the tree item at the specified position."""
-        item = self.tree_widget.itemAt(x, y)
-        if item:
-            node = item.data(0, Qt.ItemDataRole.UserRole)
-            if node:
-                return {
-                    "node": node,
-                    "path": node.path,
-                    "is_file": node.is_file,
-                    "size": node.total_size,
-                }
+        index = self.tree_view.indexAt(QPoint(x, y))
+        if index.isValid():
+            return index.data(DirectoryTreeModel.PayloadRole)
         return None
 
     def get_chart_type(self) -> str:
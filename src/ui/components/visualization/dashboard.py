@@ -3,7 +3,7 @@
 
 from typing import Any
 
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QThreadPool, QTimer, pyqtSignal
 from PyQt6.QtWidgets import (
     QGridLayout,
     QHBoxLayout,
@@ -13,6 +13,9 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from src.utils.file_utils import format_size
+from src.utils.logger import logger
+
 from ...themes.chart_theming import chart_theme_manager
 from ...themes.design_system import Spacing
 from ...themes.theme_provider import theme_provider
@@ -24,7 +27,15 @@ from .charts import (
     FileTypePieChart,
     SizeDistributionChart,
 )
+from .models.chart_data import (
+    ChartMetadata,
+    DirectoryNode,
+    FileAgeData,
+    FileDistributionData,
+    FileTypeData,
+)
 from .services.data_service import VisualizationDataService
+from .workers.dashboard_workers import DashboardDataRunnable, DashboardDataSignals
 
 
 class VisualizationDashboard(QWidget):
@@ -40,9 +51,27 @@ class VisualizationDashboard(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        # Data service
+        # Data service; replaced by each background aggregation's service
         self.data_service = VisualizationDataService()
 
+        # Aggregation runs off the GUI thread; rapid updates within the
+        # debounce interval collapse into one run, and results from runs
+        # superseded by a newer one are dropped
+        self._data_generation = 0
+        self._pending_data: tuple[list[dict[str, Any]], str] | None = None
+        self._data_signals = DashboardDataSignals(self)
+        self._data_signals.data_ready.connect(self._apply_chart_data)
+        self._data_signals.data_failed.connect(self._on_data_failed)
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(100)
+        self._update_timer.timeout.connect(self._start_data_worker)
+
+        # (id, length, directory) of the file list last sent for aggregation;
+        # the list itself is kept so its id cannot be reused by another one
+        self._last_data_key: tuple[int, int, str] | None = None
+        self._last_file_list: list[dict[str, Any]] | None = None
+
         # Chart widgets
         self.charts = {}
 
@@ -143,6 +172,11 @@ class VisualizationDashboard(QWidget):
         # Create initial charts
         self.create_charts()
 
+        # Placeholder shown over the whole grid instead of the charts
+        self._no_data_widget = self.create_no_data_widget()
+        self._no_data_widget.setVisible(False)
+        self.charts_layout.addWidget(self._no_data_widget, 0, 0, 2, 2)
+
         self.scroll_area.setWidget(self.charts_widget)
         self.main_layout.addWidget(self.scroll_area, 1)  # Stretch to fill
 
@@ -172,84 +206,133 @@ class VisualizationDashboard(QWidget):
     def setup_signals(self):
         """Connect chart signals to dashboard handlers."""
         # Connect file type chart signals
-        if hasattr(self, "file_type_chart"):
-            self.file_type_chart.item_clicked.connect(self.on_chart_item_clicked)
-            self.file_type_chart.export_requested.connect(
-                self.on_chart_export_requested
-            )
+        self.file_type_chart.item_clicked.connect(self.on_chart_item_clicked)
+        self.file_type_chart.export_requested.connect(self.on_chart_export_requested)
 
-        # Connect directory chart signals
-        if hasattr(self, "directory_chart"):
-            self.directory_chart.item_clicked.connect(self.on_chart_item_clicked)
-            self.directory_chart.export_requested.connect(
-                self.on_chart_export_requested
-            )
-            self.directory_chart.drill_down_requested.connect(
-                lambda path, data: self.drill_down_requested.emit(path, data)
-            )
+        # Connect directory chart signals; drill-downs are forwarded as-is
+        self.directory_chart.item_clicked.connect(self.on_chart_item_clicked)
+        self.directory_chart.export_requested.connect(self.on_chart_export_requested)
+        self.directory_chart.drill_down_requested.connect(self.drill_down_requested)
 
         # Connect size distribution chart signals
-        if hasattr(self, "size_chart"):
-            self.size_chart.export_requested.connect(self.on_chart_export_requested)
+        self.size_chart.export_requested.connect(self.on_chart_export_requested)
 
         # Connect file age chart signals
-        if hasattr(self, "age_chart"):
-            self.age_chart.export_requested.connect(self.on_chart_export_requested)
+        self.age_chart.export_requested.connect(self.on_chart_export_requested)
 
     def update_data(self, file_list: list[dict[str, Any]], directory_path: str = ""):
         """
         Update the dashboard with new file data.
 
+        The data is aggregated on a worker thread shortly afterwards; the
+        cards and charts update once the results arrive.
+
         Args:
             file_list: List of file dictionaries from scanner
             directory_path: Path of the scanned directory
         """
-        # Update data service
-        self.data_service.update_data(file_list, directory_path)
+        # The same scan results again would produce the same charts
+        data_key = (id(file_list), len(file_list), directory_path)
+        if data_key == self._last_data_key and self._pending_data is None:
+            return
+
+        self._pending_data = (file_list, directory_path)
+        self._update_timer.start()
+
+    def _start_data_worker(self):
+        """Aggregate the latest pending data on the thread pool."""
+        if self._pending_data is None:
+            return
+
+        file_list, directory_path = self._pending_data
+        self._pending_data = None
+        self._last_data_key = (id(file_list), len(file_list), directory_path)
+        self._last_file_list = file_list
+        self._data_generation += 1
+        QThreadPool.globalInstance().start(
+            DashboardDataRunnable(
+                self._data_generation, file_list, directory_path, self._data_signals
+            )
+        )
+
+    def _apply_chart_data(
+        self,
+        generation: int,
+        service: VisualizationDataService,
+        metadata: ChartMetadata,
+        file_type_data: list[FileTypeData],
+        directory_hierarchy: DirectoryNode | None,
+        size_distribution: FileDistributionData,
+        age_distribution: FileAgeData,
+    ):
+        """Show aggregated data on the GUI thread, unless it is stale."""
+        if generation != self._data_generation:
+            return
+
+        self.data_service = service
 
         # Update statistics overview
-        self.update_stats_overview()
+        self.update_stats_overview(metadata, file_type_data)
 
         # Update charts
-        self.update_charts()
+        self.update_charts(
+            metadata,
+            file_type_data,
+            directory_hierarchy,
+            size_distribution,
+            age_distribution,
+        )
 
-    def update_stats_overview(self):
-        """Update the statistics overview cards."""
-        metadata = self.data_service.get_metadata()
+    def _on_data_failed(self, generation: int, error: str):
+        """Log a failed aggregation run."""
+        if generation == self._data_generation:
+            # Let the same data be tried again
+            self._last_data_key = None
+            logger.error(f"Failed to update visualization dashboard: {error}")
 
+    def update_stats_overview(
+        self, metadata: ChartMetadata, file_type_data: list[FileTypeData]
+    ):
+        """Update the statistics overview cards."""
         # Update cards with new values
         self.total_files_card.update_value(f"{metadata.total_files:,}")
         self.total_size_card.update_value(metadata.total_size_formatted)
 
         # Calculate unique file types
-        file_type_data = self.data_service.get_file_type_data()
         unique_types = len(file_type_data)
         self.file_types_card.update_value(str(unique_types))
 
         # Calculate average file size
         if metadata.total_files > 0:
             avg_size = metadata.total_size // metadata.total_files
-            from src.utils.file_utils import format_size
-
             avg_size_formatted = format_size(avg_size)
         else:
             avg_size_formatted = "0 B"
         self.avg_size_card.update_value(avg_size_formatted)
 
-    def update_charts(self):
-        """Update all chart widgets with new data."""
-        from src.utils.logger import logger
-
-        metadata = self.data_service.get_metadata()
-        logger.debug(f"Dashboard update_charts: Processing {metadata.total_files} files")
+    def update_charts(
+        self,
+        metadata: ChartMetadata,
+        file_type_data: list[FileTypeData],
+        directory_hierarchy: DirectoryNode | None,
+        size_distribution: FileDistributionData,
+        age_distribution: FileAgeData,
+    ):
+        """Update all chart widgets with already aggregated data."""
+        self.set_no_data_visible(False)
+
+        logger.debug(
+            "Dashboard update_charts: Processing %d files", metadata.total_files
+        )
 
         # Update file type pie chart
-        file_type_data = self.data_service.get_file_type_data()
-        logger.debug(f"Dashboard update_charts: File type data has {len(file_type_data)} types")
+        logger.debug(
+            "Dashboard update_charts: File type data has %d types",
+            len(file_type_data),
+        )
         self.file_type_chart.update_data(file_type_data, metadata)
 
         # Update directory structure chart
-        directory_hierarchy = self.data_service.get_directory_hierarchy()
         if directory_hierarchy:
             logger.debug("Dashboard update_charts: Directory hierarchy available")
             self.directory_chart.update_data(directory_hierarchy, metadata)
@@ -257,12 +340,10 @@ class VisualizationDashboard(QWidget):
             logger.debug("Dashboard update_charts: No directory hierarchy data")
 
         # Update file size distribution chart
-        size_distribution = self.data_service.get_file_size_distribution()
         logger.debug("Dashboard update_charts: Size distribution updating")
         self.size_chart.update_data(size_distribution, metadata)
 
         # Update file age analysis chart
-        age_distribution = self.data_service.get_file_age_distribution()
         logger.debug("Dashboard update_charts: Age distribution updating")
         self.age_chart.update_data(age_distribution, metadata)
 
@@ -293,10 +374,16 @@ class VisualizationDashboard(QWidget):
 
     def show_no_data_message(self):
         """Show a message when there's no data to display."""
-        # Clear existing content
-        self.clear_charts()
+        self.set_no_data_visible(True)
+
+    def set_no_data_visible(self, visible: bool):
+        """Swap the charts for the no data placeholder, or back."""
+        for chart in self.charts.values():
+            chart.setVisible(not visible)
+        self._no_data_widget.setVisible(visible)
 
-        # Show no data message
+    def create_no_data_widget(self) -> CardWidget:
+        """Create the placeholder shown when there's no data to display."""
         no_data_widget = CardWidget()
         no_data_layout = QVBoxLayout(no_data_widget)
 
@@ -313,7 +400,7 @@ class VisualizationDashboard(QWidget):
         no_data_layout.addWidget(no_data_label)
         no_data_layout.addWidget(instruction_label)
 
-        self.charts_layout.addWidget(no_data_widget, 0, 0, 2, 2)  # Span 2x2 grid
+        return no_data_widget
 
     def clear_charts(self):
         """Clear all charts from the layout."""
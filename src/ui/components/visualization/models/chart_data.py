@@ -1,10 +1,23 @@
 #!/usr/bin/env python3
 # File: src/ui/components/visualization/models/chart_data.py
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
 from typing import Any
 
+from src.utils.file_utils import format_size
+
+
+def _info_texts(
+    file_counts: list[int], total_sizes: list[int], percentages: list[float]
+) -> list[str]:
+    """Build the "N files, size, P%" line shown under each distribution bar."""
+    return [
+        f"{count} files, {format_size(size)}, {percentage:.1f}%"
+        for count, size, percentage in zip(file_counts, total_sizes, percentages)
+    ]
+
 
 @dataclass
 class FileTypeData:
@@ -31,6 +44,18 @@ class DirectoryNode:
     file_type: str | None = None  # File extension if is_file=True
     modified: datetime | None = None  # Last modified date
 
+    @cached_property
+    def click_payload(self) -> dict[str, Any]:
+        """Data sent with clicks on this node, built on first use."""
+        return {
+            "node": self,
+            "path": self.path,
+            "is_file": self.is_file,
+            "size": self.total_size,
+            "filter_type": "file" if self.is_file else "directory",
+            "filter_value": self.path,
+        }
+
 
 @dataclass
 class FileDistributionData:
@@ -41,6 +66,18 @@ class FileDistributionData:
     total_sizes: list[int]  # Total size in bytes for each range
     percentages: list[float]  # Percentage of total count for each range
 
+    # Derived once, so charts don't rescan or reformat on every refresh
+    max_count: int = field(init=False, repr=False)
+    has_data: bool = field(init=False, repr=False)
+    info_texts: list[str] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.max_count = max(self.file_counts, default=0)
+        self.has_data = self.max_count > 0
+        self.info_texts = _info_texts(
+            self.file_counts, self.total_sizes, self.percentages
+        )
+
 
 @dataclass
 class TopFilesData:
@@ -63,6 +100,18 @@ class FileAgeData:
     total_sizes: list[int]  # Total size for each age range
     percentages: list[float]  # Percentage of total for each range
 
+    # Derived once, so charts don't rescan or reformat on every refresh
+    max_count: int = field(init=False, repr=False)
+    has_data: bool = field(init=False, repr=False)
+    info_texts: list[str] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.max_count = max(self.file_counts, default=0)
+        self.has_data = self.max_count > 0
+        self.info_texts = _info_texts(
+            self.file_counts, self.total_sizes, self.percentages
+        )
+
 
 @dataclass
 class ChartMetadata:
@@ -185,21 +234,27 @@ class ChartDataTransformer:
 
     @staticmethod
     def _calculate_directory_sizes(node: DirectoryNode) -> None:
-        """Recursively calculate directory sizes and file counts."""
-        for child in node.children:
-            if not child.is_file:
-                ChartDataTransformer._calculate_directory_sizes(child)
-
-            node.total_size += child.total_size
-            node.file_count += child.file_count
+        """Calculate directory sizes and file counts bottom-up."""
+        # Collect directories parents-first with an explicit stack, so deep
+        # trees neither recurse nor hit the recursion limit
+        directories = []
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            directories.append(current)
+            stack.extend(child for child in current.children if not child.is_file)
+
+        # Walking that list backwards totals every child before its parent
+        for directory in reversed(directories):
+            for child in directory.children:
+                directory.total_size += child.total_size
+                directory.file_count += child.file_count
 
     @staticmethod
     def files_to_top_files(
         file_list: list[dict[str, Any]], limit: int = 20
     ) -> list[TopFilesData]:
         """Get the largest files from the file list."""
-        from src.utils.file_utils import format_size
-
         # Sort by size descending and take top N
         sorted_files = sorted(file_list, key=lambda x: x["size"], reverse=True)[:limit]
 
@@ -0,0 +1,2 @@
+#!/usr/bin/env python3
+# File: src/ui/components/visualization/workers/__init__.py
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# File: src/ui/components/visualization/workers/dashboard_workers.py
+
+from typing import Any
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from ..services.data_service import VisualizationDataService
+
+
+class DashboardDataSignals(QObject):
+    """Signals for DashboardDataRunnable, which cannot emit them itself."""
+
+    # generation, service, metadata, file types, hierarchy, size and age data
+    data_ready = pyqtSignal(int, object, object, object, object, object, object)
+    data_failed = pyqtSignal(int, str)  # generation, error message
+
+
+class DashboardDataRunnable(QRunnable):
+    """
+    Aggregates scan results for the dashboard on a QThreadPool thread.
+
+    Each run uses its own VisualizationDataService, so a run still in
+    flight never shares state with a newer one. Results carry the
+    generation they were started for, letting the receiver drop stale
+    ones. Only plain data crosses back; widgets are updated by the
+    receiver on the GUI thread.
+    """
+
+    def __init__(
+        self,
+        generation: int,
+        file_list: list[dict[str, Any]],
+        directory_path: str,
+        signals: DashboardDataSignals,
+    ):
+        super().__init__()
+
+        self.generation = generation
+        self.file_list = file_list
+        self.directory_path = directory_path
+        self.signals = signals
+
+    def run(self):
+        """Build every dataset the dashboard shows and report them."""
+        try:
+            service = VisualizationDataService()
+            service.update_data(self.file_list, self.directory_path)
+
+            results = (
+                service.get_metadata(),
+                service.get_file_type_data(),
+                service.get_directory_hierarchy(),
+                service.get_file_size_distribution(),
+                service.get_file_age_distribution(),
+            )
+        except Exception as e:
+            self.signals.data_failed.emit(self.generation, str(e))
+            return
+
+        self.signals.data_ready.emit(self.generation, service, *results)
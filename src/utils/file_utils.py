@@ -5,8 +5,11 @@ import math
 import mimetypes
 import os
 from datetime import datetime
+from functools import lru_cache
 
 
+# Pure and called for every row, card and tree node; sizes repeat a lot
+@lru_cache(maxsize=8192)
 def format_size(size_bytes):
     """
     Format a file size in bytes to a human-readable string.
@@ -97,17 +97,17 @@ class FileAnalyzerLogger:
         self._logger.addHandler(console_handler)
         self._logger.addHandler(error_handler)
 
-    def debug(self, message: str, **kwargs):
-        """Log debug message."""
-        self._log(logging.DEBUG, message, **kwargs)
+    def debug(self, message: str, *args, **kwargs):
+        """Log debug message; %-style args are only formatted if emitted."""
+        self._log(logging.DEBUG, message, *args, **kwargs)
 
-    def info(self, message: str, **kwargs):
+    def info(self, message: str, *args, **kwargs):
         """Log info message."""
-        self._log(logging.INFO, message, **kwargs)
+        self._log(logging.INFO, message, *args, **kwargs)
 
-    def warning(self, message: str, **kwargs):
+    def warning(self, message: str, *args, **kwargs):
         """Log warning message."""
-        self._log(logging.WARNING, message, **kwargs)
+        self._log(logging.WARNING, message, *args, **kwargs)
 
     def error(self, message: str, exception: Exception | None = None, **kwargs):
         """Log error message with optional exception."""
@@ -123,10 +123,10 @@ class FileAnalyzerLogger:
         else:
             self._log(logging.CRITICAL, message, **kwargs)
 
-    def _log(self, level: int, message: str, **kwargs):
+    def _log(self, level: int, message: str, *args, **kwargs):
         """Internal logging method."""
         if self._logger:
-            self._logger.log(level, message, **kwargs)
+            self._logger.log(level, message, *args, **kwargs)
 
     def log_performance(self, operation: str, duration: float, details: dict | None = None):
         """Log performance metrics."""
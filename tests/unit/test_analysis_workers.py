@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.ui.components.management.workers import analysis_workers
+from src.ui.components.management.workers.analysis_workers import (
+    BatchAnalysisWorker,
+    LargeFileAnalysisWorker,
+    _large_file_indices,
+    _ProgressThrottle,
+)
+
+
+def _file_dicts(sizes):
+    """Build scanner-style file dictionaries with the given sizes."""
+    return [
+        {
+            "name": f"file_{i}.bin",
+            "path": f"/data/file_{i}.bin",
+            "size": size,
+            "modified": datetime(2024, 1, 1),
+            "type": "bin",
+        }
+        for i, size in enumerate(sizes)
+    ]
+
+
+class TestProgressThrottle(unittest.TestCase):
+
+    def ready_at(self, throttle, timestamp, percentage):
+        """Ask the throttle at a fixed monotonic time."""
+        with patch.object(analysis_workers.time, 'monotonic', return_value=timestamp):
+            return throttle.ready(percentage)
+
+    def test_first_report_passes(self):
+        """Test that the first report is always emitted."""
+        throttle = _ProgressThrottle()
+        self.assertTrue(self.ready_at(throttle, 10.0, 0))
+
+    def test_repeated_percentage_is_dropped(self):
+        """Test that an unchanged percentage is never re-emitted."""
+        throttle = _ProgressThrottle()
+        self.assertTrue(self.ready_at(throttle, 10.0, 5))
+        self.assertFalse(self.ready_at(throttle, 11.0, 5))
+
+    def test_reports_within_interval_are_dropped(self):
+        """Test that a new percentage inside the interval is dropped."""
+        throttle = _ProgressThrottle(interval=0.05)
+        self.assertTrue(self.ready_at(throttle, 10.0, 5))
+        self.assertFalse(self.ready_at(throttle, 10.01, 6))
+        self.assertTrue(self.ready_at(throttle, 10.06, 7))
+
+    def test_completion_always_passes(self):
+        """Test that 100% passes regardless of timing or repetition."""
+        throttle = _ProgressThrottle(interval=0.05)
+        self.assertTrue(self.ready_at(throttle, 10.0, 99))
+        self.assertTrue(self.ready_at(throttle, 10.001, 100))
+        self.assertTrue(self.ready_at(throttle, 10.002, 100))
+
+
+class TestLargeFileIndices(unittest.TestCase):
+
+    def setUp(self):
+        """Set up files with ties and files below the threshold."""
+        self.files = _file_dicts([50, 300, 100, 300, 99, 1000, 100])
+
+    def check_indices(self):
+        """Check filtering, descending order and stable ties."""
+        indices = _large_file_indices(self.files, 100)
+
+        self.assertEqual(indices, [5, 1, 3, 2, 6])
+        self.assertTrue(all(isinstance(i, int) for i in indices))
+
+    def test_fallback_without_numpy(self):
+        """Test the pure Python path."""
+        with patch.object(analysis_workers, 'NUMPY_AVAILABLE', False):
+            self.check_indices()
+
+    @unittest.skipUnless(analysis_workers.NUMPY_AVAILABLE, "NumPy not installed")
+    def test_numpy_path(self):
+        """Test the vectorized NumPy path."""
+        self.check_indices()
+
+    def test_no_files_above_threshold(self):
+        """Test that an empty selection is returned as an empty list."""
+        with patch.object(analysis_workers, 'NUMPY_AVAILABLE', False):
+            self.assertEqual(_large_file_indices(self.files, 10_000), [])
+        if analysis_workers.NUMPY_AVAILABLE:
+            self.assertEqual(_large_file_indices(self.files, 10_000), [])
+
+    def test_empty_input(self):
+        """Test that no files yields no indices."""
+        self.assertEqual(_large_file_indices([], 1), [])
+
+
+class TestAnalysisRunnable(unittest.TestCase):
+
+    def test_wait_before_start_returns_immediately(self):
+        """Test that waiting on a worker that never started does not block."""
+        worker = LargeFileAnalysisWorker(_file_dicts([1, 2]), size_threshold=1)
+        self.assertTrue(worker.wait(0))
+
+    def test_run_emits_result_and_finishes(self):
+        """Test that run() reports through the signals object and finishes."""
+        worker = LargeFileAnalysisWorker(_file_dicts([5, 50, 500]), size_threshold=50)
+        results = []
+        worker.signals.analysis_completed.connect(results.append)
+
+        worker._finished_event.clear()
+        worker.run()
+
+        self.assertTrue(worker.wait(0))
+        self.assertEqual(len(results), 1)
+        self.assertEqual([f.size for f in results[0].files], [500, 50])
+
+
+class TestBatchAnalysisWorker(unittest.TestCase):
+
+    def test_runs_enabled_tracks_and_completes(self):
+        """Test that every enabled analysis reports before the final signal."""
+        worker = BatchAnalysisWorker(
+            _file_dicts([10, 200, 3000]), run_duplicates=False, size_threshold=100
+        )
+        events = []
+        signals = worker.signals
+        signals.large_file_analysis_completed.connect(
+            lambda a: events.append(("large", len(a.files)))
+        )
+        signals.age_analysis_completed.connect(
+            lambda a: events.append(("age", len(a.files)))
+        )
+        signals.all_analysis_completed.connect(lambda: events.append(("all", None)))
+        signals.analysis_failed.connect(lambda e: events.append(("failed", e)))
+
+        worker.run()
+
+        self.assertCountEqual(events[:2], [("large", 2), ("age", 3)])
+        self.assertEqual(events[2:], [("all", None)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -60,6 +60,15 @@ class TestFileUtils(unittest.TestCase):
         for size, expected in test_cases:
             self.assertEqual(format_size(size), expected)
 
+    def test_format_size_is_cached(self):
+        """Test repeated sizes are served from the format_size cache."""
+        format_size.cache_clear()
+        first = format_size(123456)
+        second = format_size(123456)
+
+        self.assertEqual(first, second)
+        self.assertEqual(format_size.cache_info().hits, 1)
+
     def test_get_file_type(self):
         """Test the get_file_type function."""
         test_cases = [
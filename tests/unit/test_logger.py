@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import logging
 import os
 import sys
 import tempfile
@@ -70,6 +71,19 @@ class TestFileAnalyzerLogger(unittest.TestCase):
             self.assertIn(test_message, log_content)
             self.assertIn("INFO", log_content)
 
+    def test_deferred_argument_formatting(self):
+        """Test %-style arguments are formatted into the emitted message."""
+        with patch.object(FileAnalyzerLogger, '__init__', lambda x: None):
+            logger = FileAnalyzerLogger()
+            logger._logger = logging.getLogger("FileAnalyzer")
+            self.addCleanup(logger._logger.setLevel, logger._logger.level)
+            logger._logger.setLevel(logging.DEBUG)
+
+            with self.assertLogs("FileAnalyzer", level="DEBUG") as captured:
+                logger.debug("Deferred %d of %s", 3, "items")
+
+            self.assertEqual(captured.records[0].getMessage(), "Deferred 3 of items")
+
     @patch('src.utils.logger.Path.home')
     def test_error_logging(self, mock_home):
         """Test error level logging."""
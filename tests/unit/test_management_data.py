@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+
+import hashlib
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.ui.components.management.models import management_data
+from src.ui.components.management.models.management_data import (
+    DuplicateConfidence,
+    DuplicateGroup,
+    FileInfo,
+    LargeFileAnalysis,
+)
+
+
+def _files(sizes):
+    """Build FileInfo objects with the given sizes."""
+    return [
+        FileInfo(
+            name=f"file_{i}.bin",
+            path=f"/data/file_{i}.bin",
+            size=size,
+            modified=datetime(2024, 1, 1),
+            file_type="bin",
+        )
+        for i, size in enumerate(sizes)
+    ]
+
+
+class LargeFileAnalysisChecks:
+    """Checks run once with NumPy (when installed) and once without it."""
+
+    def test_update_files_recomputes_sizes(self):
+        """Test that update_files rebuilds the size column and total."""
+        analysis = LargeFileAnalysis(files=_files([10, 20]))
+        self.assertEqual(analysis.total_size, 30)
+
+        analysis.update_files(_files([5, 6, 7]))
+        self.assertEqual(analysis.total_size, 18)
+        self.assertEqual(list(analysis.sizes), [5, 6, 7])
+        self.assertIsInstance(analysis.total_size, int)
+
+    def test_get_size_order(self):
+        """Test size ordering in both directions with stable ties."""
+        analysis = LargeFileAnalysis(files=_files([30, 10, 30, 20]))
+
+        self.assertEqual(analysis.get_size_order(), [0, 2, 3, 1])
+        self.assertEqual(analysis.get_size_order(descending=False), [1, 3, 0, 2])
+
+    def test_get_size_order_empty(self):
+        """Test ordering an analysis without files."""
+        self.assertEqual(LargeFileAnalysis(files=[]).get_size_order(), [])
+
+    def test_get_average_size(self):
+        """Test the average size, including the empty case."""
+        self.assertEqual(LargeFileAnalysis(files=_files([10, 20])).get_average_size(), 15)
+        self.assertEqual(LargeFileAnalysis(files=[]).get_average_size(), 0)
+
+    def test_remove_file(self):
+        """Test removing a file by identity keeps the columns in step."""
+        files = _files([30, 10, 30])
+        analysis = LargeFileAnalysis(files=list(files))
+
+        self.assertTrue(analysis.remove_file(files[2]))
+        self.assertEqual(analysis.files, [files[0], files[1]])
+        self.assertIs(analysis.files[0], files[0])
+        self.assertEqual(list(analysis.sizes), [30, 10])
+        self.assertEqual(analysis.total_size, 40)
+
+    def test_remove_missing_file(self):
+        """Test that an equal but distinct file is not removed."""
+        analysis = LargeFileAnalysis(files=_files([30]))
+
+        self.assertFalse(analysis.remove_file(_files([30])[0]))
+        self.assertEqual(analysis.total_size, 30)
+
+
+class TestLargeFileAnalysisWithoutNumpy(LargeFileAnalysisChecks, unittest.TestCase):
+
+    def setUp(self):
+        """Force the pure Python code paths."""
+        patcher = patch.object(management_data, 'NUMPY_AVAILABLE', False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+@unittest.skipUnless(management_data.NUMPY_AVAILABLE, "NumPy not installed")
+class TestLargeFileAnalysisWithNumpy(LargeFileAnalysisChecks, unittest.TestCase):
+    pass
+
+
+class TestDuplicateGroup(unittest.TestCase):
+
+    def test_update_totals(self):
+        """Test that totals follow the group's files after removals."""
+        files = _files([10, 10, 10])
+        group = DuplicateGroup(files=files, confidence=DuplicateConfidence.HIGH)
+        self.assertEqual(group.total_size, 30)
+        self.assertEqual(group.potential_savings, 20)
+
+        del group.files[1:]
+        group.update_totals()
+        self.assertEqual(group.total_size, 10)
+        self.assertEqual(group.potential_savings, 0)
+
+        group.files.clear()
+        group.update_totals()
+        self.assertEqual(group.total_size, 0)
+        self.assertEqual(group.potential_savings, 0)
+
+
+class TestCalculateHash(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a file spanning several hash blocks."""
+        self.data = bytes(range(256)) * 40
+        handle = tempfile.NamedTemporaryFile(delete=False)
+        handle.write(self.data)
+        handle.close()
+        self.addCleanup(os.remove, handle.name)
+
+        self.file = FileInfo(
+            name="data.bin",
+            path=handle.name,
+            size=len(self.data),
+            modified=datetime(2024, 1, 1),
+            file_type="bin",
+        )
+        self.expected = hashlib.sha256(self.data).hexdigest()
+
+    def test_file_digest_path(self):
+        """Test the default path for files below the mmap threshold."""
+        self.assertEqual(self.file.calculate_hash("full"), self.expected)
+
+    def test_read_loop_path(self):
+        """Test the chunked read used when hashlib.file_digest is missing."""
+        with patch.object(management_data, '_file_digest', None):
+            self.assertEqual(self.file.calculate_hash("full"), self.expected)
+
+    def test_mmap_path(self):
+        """Test the memory-mapped path in blocks smaller than the file."""
+        with patch.object(management_data, '_MMAP_HASH_THRESHOLD', 1), \
+                patch.object(management_data, '_HASH_BLOCK_SIZE', 1000):
+            self.assertEqual(self.file.calculate_hash("full"), self.expected)
+
+    def test_mmap_path_cancelled(self):
+        """Test that a set cancel event stops the mmap path."""
+        cancel_event = threading.Event()
+        cancel_event.set()
+        with patch.object(management_data, '_MMAP_HASH_THRESHOLD', 1):
+            self.assertEqual(self.file.calculate_hash("full", cancel_event), "")
+        self.assertIsNone(self.file.hash_sha256)
+
+    def test_partial_hash(self):
+        """Test that the partial hash covers the first 1KB."""
+        self.assertEqual(
+            self.file.calculate_hash("partial"),
+            hashlib.sha256(self.data[:1024]).hexdigest(),
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+
+import csv
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from datetime import datetime
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.ui.components.management.models.management_data import (
+    FileAgeAnalysis,
+    FileInfo,
+    LargeFileAnalysis,
+)
+from src.ui.components.management.services.age_analysis_service import (
+    FileAgeAnalysisService,
+)
+from src.ui.components.management.services.duplicate_service import (
+    DuplicateDetectionService,
+)
+from src.ui.components.management.services.large_file_service import (
+    LargeFileAnalysisService,
+)
+
+
+def _files():
+    """Build a small set of FileInfo objects for export."""
+    return [
+        FileInfo(
+            name="movie.mkv",
+            path="/data/movie.mkv",
+            size=300 * 1024 * 1024,
+            modified=datetime(2020, 5, 1, 12, 0, 0),
+            file_type="mkv",
+        ),
+        FileInfo(
+            name="notes, draft.txt",
+            path="/data/notes, draft.txt",
+            size=2048,
+            modified=datetime(2024, 1, 1),
+            file_type="txt",
+        ),
+    ]
+
+
+class TestLargeFileExportStream(unittest.TestCase):
+
+    def setUp(self):
+        """Set up the service and an analysis to export."""
+        self.service = LargeFileAnalysisService()
+        self.analysis = LargeFileAnalysis(files=_files())
+
+    def test_csv_stream(self):
+        """Test that CSV rows are written to the stream."""
+        output = io.StringIO()
+        self.service.export_analysis_results_stream(self.analysis, "csv", output)
+
+        rows = list(csv.reader(io.StringIO(output.getvalue())))
+        self.assertEqual(rows[0][:3], ["File Name", "Path", "Size (Bytes)"])
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[2][0], "notes, draft.txt")
+        self.assertEqual(rows[1][2], str(300 * 1024 * 1024))
+
+    def test_json_stream(self):
+        """Test that the JSON written to the stream parses back."""
+        output = io.StringIO()
+        self.service.export_analysis_results_stream(self.analysis, "json", output)
+
+        data = json.loads(output.getvalue())
+        self.assertEqual(data["total_files"], 2)
+        self.assertEqual(data["total_size"], self.analysis.total_size)
+        self.assertEqual(len(data["files"]), 2)
+
+    def test_unsupported_format(self):
+        """Test that an unknown format raises ValueError."""
+        with self.assertRaises(ValueError):
+            self.service.export_analysis_results_stream(
+                self.analysis, "xml", io.StringIO()
+            )
+
+
+class TestAgeExportStream(unittest.TestCase):
+
+    def setUp(self):
+        """Set up the service and an analysis to export."""
+        self.service = FileAgeAnalysisService()
+        self.analysis = FileAgeAnalysis(files=_files())
+
+    def test_csv_stream(self):
+        """Test that CSV rows include the age columns."""
+        output = io.StringIO()
+        self.service.export_analysis_results_stream(self.analysis, "csv", output)
+
+        rows = list(csv.reader(io.StringIO(output.getvalue())))
+        self.assertIn("Age Category", rows[0])
+        self.assertIn("Days Old", rows[0])
+        self.assertEqual(len(rows), 3)
+
+    def test_json_stream(self):
+        """Test that the JSON written to the stream parses back."""
+        output = io.StringIO()
+        self.service.export_analysis_results_stream(self.analysis, "json", output)
+
+        data = json.loads(output.getvalue())
+        self.assertEqual(data["total_files"], 2)
+        self.assertEqual(len(data["files"]), 2)
+        self.assertIn("age_distribution", data)
+
+    def test_unsupported_format(self):
+        """Test that an unknown format raises ValueError."""
+        with self.assertRaises(ValueError):
+            self.service.export_analysis_results_stream(
+                self.analysis, "xml", io.StringIO()
+            )
+
+
+class TestDuplicateHashDetection(unittest.TestCase):
+
+    def setUp(self):
+        """Set up two identical files and one of a different size."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+        contents = {"a.txt": b"same bytes", "b.txt": b"same bytes", "c.txt": b"other"}
+        self.files = {}
+        for name, data in contents.items():
+            path = os.path.join(self.temp_dir.name, name)
+            with open(path, "wb") as f:
+                f.write(data)
+            self.files[name] = FileInfo(
+                name=name,
+                path=path,
+                size=len(data),
+                modified=datetime(2024, 1, 1),
+                file_type="txt",
+            )
+
+    def test_identical_files_are_grouped(self):
+        """Test that files with equal content form one group."""
+        groups = DuplicateDetectionService()._find_hash_duplicates(
+            list(self.files.values())
+        )
+
+        self.assertEqual(len(groups), 1)
+        self.assertCountEqual(
+            [f.name for f in groups[0].files], ["a.txt", "b.txt"]
+        )
+
+    def test_unique_sizes_are_not_read(self):
+        """Test that a file with a size no other file has is never hashed."""
+        DuplicateDetectionService()._find_hash_duplicates(list(self.files.values()))
+
+        self.assertIsNone(self.files["c.txt"].hash_partial)
+        self.assertIsNotNone(self.files["a.txt"].hash_partial)
+
+    def test_cancelled_detection_returns_nothing(self):
+        """Test that a set cancel event stops hashing with no groups."""
+        service = DuplicateDetectionService(max_workers=2)
+        cancel_event = threading.Event()
+        cancel_event.set()
+        service.set_cancel_event(cancel_event)
+
+        groups = service._find_hash_duplicates(list(self.files.values()))
+
+        self.assertEqual(groups, [])
+        self.assertEqual(service.hash_cache, {})
+
+
+if __name__ == '__main__':
+    unittest.main()